@@ -62,6 +62,11 @@ class ChartWidget(QtWidgets.QWidget):
         self._symbol: Optional[str] = None
         self._price_data: Optional[pd.DataFrame] = None
         self._signals: List[TradeSignal] = []
+        # Price data and signals usually arrive back to back; draw once for both.
+        self._render_timer = QtCore.QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(30)
+        self._render_timer.timeout.connect(self._on_render_timeout)
 
     # ------------------------------------------------------------------
     # Public API
@@ -75,10 +80,12 @@ class ChartWidget(QtWidgets.QWidget):
             self.clear()
 
     def set_loading(self, message: str = "Loading chart…") -> None:
+        self._render_timer.stop()
         self._stack.setCurrentWidget(self._message)
         self._message.setText(message)
 
     def set_error(self, message: str) -> None:
+        self._render_timer.stop()
         self._stack.setCurrentWidget(self._message)
         self._message.setText(message)
 
@@ -99,14 +106,15 @@ class ChartWidget(QtWidgets.QWidget):
             cleaned.index = pd.DatetimeIndex(cleaned.index)
         cleaned.index = cleaned.index.tz_localize(None)
         self._price_data = cleaned
-        self._render_chart()
+        self._render_timer.start()
 
     def display_signals(self, signals: Iterable[TradeSignal]) -> None:
         self._signals = list(signals)
         if self._price_data is not None:
-            self._render_chart()
+            self._render_timer.start()
 
     def clear(self) -> None:
+        self._render_timer.stop()
         self._price_data = None
         self._signals.clear()
         self._figure.clear()
@@ -117,6 +125,9 @@ class ChartWidget(QtWidgets.QWidget):
     # ------------------------------------------------------------------
     # Internal rendering helpers
     # ------------------------------------------------------------------
+    def _on_render_timeout(self) -> None:
+        self._render_chart()
+
     def _render_chart(self) -> None:
         if self._price_data is None or self._price_data.empty:
             self._stack.setCurrentWidget(self._message)
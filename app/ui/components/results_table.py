@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Sequence
+from typing import Any, Callable, Dict, List, Sequence, Tuple
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
@@ -12,11 +12,14 @@ from core.models import ScanResult, TradeSignal
 
 __all__ = ["ResultsTableModel", "ResultsTableView", "ResultRow"]
 
+_NUMERIC_COLUMNS = frozenset({1, 2, 3})
+_RIGHT_ALIGN = int(QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter)
+
 
 @dataclass
 class ResultRow:
     result: ScanResult
-    signals: List[TradeSignal]
+    signals: Sequence[TradeSignal]
 
 
 class ResultsTableModel(QtCore.QAbstractTableModel):
@@ -35,6 +38,17 @@ class ResultsTableModel(QtCore.QAbstractTableModel):
         super().__init__(parent)
         self._rows: List[ResultRow] = []
         self._index: Dict[str, int] = {}
+        # Per-row cell text, rendered on first paint so off-screen rows cost nothing.
+        self._display: List[Tuple[str, ...] | None] = []
+        self._tooltip: List[str | None] = []
+        self._bold_font: QtGui.QFont | None = None
+        roles = QtCore.Qt.ItemDataRole
+        self._role_handlers: Dict[int, Callable[[int, int], Any]] = {
+            roles.DisplayRole: lambda row, column: self._cells(row)[column],
+            roles.ToolTipRole: lambda row, column: self._tooltip_text(row),
+            roles.TextAlignmentRole: lambda row, column: _RIGHT_ALIGN if column in _NUMERIC_COLUMNS else None,
+            roles.FontRole: lambda row, column: self._header_font() if column == 0 else None,
+        }
 
     # ------------------------------------------------------------------
     # Qt Model interface
@@ -60,49 +74,14 @@ class ResultsTableModel(QtCore.QAbstractTableModel):
         return str(section + 1)
 
     def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole):  # type: ignore[override]
-        if not index.isValid():
+        handler = self._role_handlers.get(role)
+        if handler is None or not index.isValid():
             return None
 
         row = index.row()
         if row < 0 or row >= len(self._rows):
             return None
-
-        result_row = self._rows[row]
-        result = result_row.result
-
-        if role == QtCore.Qt.ItemDataRole.DisplayRole:
-            column = index.column()
-            if column == 0:
-                return result.symbol
-            if column == 1:
-                return f"{result.score:.1f}"
-            if column == 2:
-                return f"{result.last_price:.2f}"
-            if column == 3:
-                counts = _signal_counts(result_row.signals)
-                return ", ".join(
-                    f"{side.title()}: {count}"
-                    for side, count in counts.items()
-                    if count > 0
-                ) or "—"
-            if column == 4:
-                return "; ".join(result.reasons)
-            if column == 5:
-                return result.as_of.strftime("%Y-%m-%d %H:%M")
-
-        if role == QtCore.Qt.ItemDataRole.ToolTipRole:
-            return "\n".join(result.reasons)
-
-        if role == QtCore.Qt.ItemDataRole.TextAlignmentRole:
-            if index.column() in {1, 2, 3}:
-                return int(QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter)
-
-        if role == QtCore.Qt.ItemDataRole.FontRole and index.column() == 0:
-            font = QtGui.QFont()
-            font.setBold(True)
-            return font
-
-        return None
+        return handler(row, index.column())
 
     # ------------------------------------------------------------------
     # Custom API
@@ -113,9 +92,20 @@ class ResultsTableModel(QtCore.QAbstractTableModel):
         self.beginResetModel()
         self._rows.clear()
         self._index.clear()
+        self._display.clear()
+        self._tooltip.clear()
         self.endResetModel()
 
-    def upsert_row(self, result: ScanResult, signals: List[TradeSignal]) -> None:
+    def replace_all(self, entries: Sequence[Tuple[ScanResult, Sequence[TradeSignal]]]) -> None:
+        """Replace every row with *entries* using a single model reset."""
+
+        self.beginResetModel()
+        self._rows = [ResultRow(result=result, signals=signals) for result, signals in entries]
+        self._index = {row.result.symbol: position for position, row in enumerate(self._rows)}
+        self._rebuild_display_cache()
+        self.endResetModel()
+
+    def upsert_row(self, result: ScanResult, signals: Sequence[TradeSignal]) -> None:
         """Insert or update the row matching *result.symbol*."""
 
         row_index = self._index.get(result.symbol)
@@ -123,15 +113,65 @@ class ResultsTableModel(QtCore.QAbstractTableModel):
             row_index = len(self._rows)
             self.beginInsertRows(QtCore.QModelIndex(), row_index, row_index)
             self._rows.append(ResultRow(result=result, signals=signals))
+            self._display.append(None)
+            self._tooltip.append(None)
             self._index[result.symbol] = row_index
             self.endInsertRows()
             return
 
         self._rows[row_index] = ResultRow(result=result, signals=signals)
+        self._display[row_index] = None
+        self._tooltip[row_index] = None
         top_left = self.index(row_index, 0)
         bottom_right = self.index(row_index, self.columnCount() - 1)
         self.dataChanged.emit(top_left, bottom_right, [])
 
+    def upsert_rows(self, entries: Sequence[Tuple[ScanResult, Sequence[TradeSignal]]]) -> None:
+        """Insert or update several rows, notifying views once per batch."""
+
+        if not entries:
+            return
+        if not self._rows:
+            latest: Dict[str, Tuple[ScanResult, Sequence[TradeSignal]]] = {}
+            for result, signals in entries:
+                latest[result.symbol] = (result, signals)
+            self.replace_all(list(latest.values()))
+            return
+
+        appended: List[ResultRow] = []
+        appended_index: Dict[str, int] = {}
+        updated: List[int] = []
+        for result, signals in entries:
+            row = ResultRow(result=result, signals=signals)
+            row_index = self._index.get(result.symbol)
+            if row_index is not None:
+                self._rows[row_index] = row
+                self._display[row_index] = None
+                self._tooltip[row_index] = None
+                updated.append(row_index)
+                continue
+            pending_index = appended_index.get(result.symbol)
+            if pending_index is not None:
+                appended[pending_index] = row
+            else:
+                appended_index[result.symbol] = len(appended)
+                appended.append(row)
+
+        if updated:
+            top_left = self.index(min(updated), 0)
+            bottom_right = self.index(max(updated), self.columnCount() - 1)
+            self.dataChanged.emit(top_left, bottom_right, [])
+
+        if appended:
+            first = len(self._rows)
+            self.beginInsertRows(QtCore.QModelIndex(), first, first + len(appended) - 1)
+            for offset, row in enumerate(appended):
+                self._rows.append(row)
+                self._index[row.result.symbol] = first + offset
+            self._display.extend([None] * len(appended))
+            self._tooltip.extend([None] * len(appended))
+            self.endInsertRows()
+
     def row_at(self, row: int) -> ResultRow | None:
         if 0 <= row < len(self._rows):
             return self._rows[row]
@@ -140,6 +180,32 @@ class ResultsTableModel(QtCore.QAbstractTableModel):
     def rows(self) -> List[ResultRow]:
         return list(self._rows)
 
+    def _rebuild_display_cache(self) -> None:
+        self._display = [None] * len(self._rows)
+        self._tooltip = [None] * len(self._rows)
+
+    def _cells(self, row: int) -> Tuple[str, ...]:
+        cells = self._display[row]
+        if cells is None:
+            entry = self._rows[row]
+            cells = _display_cells(entry.result, entry.signals)
+            self._display[row] = cells
+        return cells
+
+    def _tooltip_text(self, row: int) -> str:
+        text = self._tooltip[row]
+        if text is None:
+            text = "\n".join(self._rows[row].result.reasons)
+            self._tooltip[row] = text
+        return text
+
+    def _header_font(self) -> QtGui.QFont:
+        if self._bold_font is None:
+            font = QtGui.QFont()
+            font.setBold(True)
+            self._bold_font = font
+        return self._bold_font
+
 
 class ResultsTableView(QtWidgets.QTableView):
     """Configured table view for presenting scan results."""
@@ -151,10 +217,31 @@ class ResultsTableView(QtWidgets.QTableView):
         self.setAlternatingRowColors(True)
         self.setSortingEnabled(True)
         self.horizontalHeader().setStretchLastSection(True)
-        self.verticalHeader().setVisible(False)
+        vertical = self.verticalHeader()
+        vertical.setVisible(False)
+        # Uniform row heights let the view skip per-row size hints on large scans.
+        vertical.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        vertical.setDefaultSectionSize(self.fontMetrics().height() + 8)
         self.setWordWrap(False)
 
 
+def _display_cells(result: ScanResult, signals: Sequence[TradeSignal]) -> Tuple[str, ...]:
+    counts = _signal_counts(signals)
+    signal_text = ", ".join(
+        f"{side.title()}: {count}"
+        for side, count in counts.items()
+        if count > 0
+    ) or "—"
+    return (
+        result.symbol,
+        f"{result.score:.1f}",
+        f"{result.last_price:.2f}",
+        signal_text,
+        "; ".join(result.reasons),
+        result.as_of.strftime("%Y-%m-%d %H:%M"),
+    )
+
+
 def _signal_counts(signals: Sequence[TradeSignal]) -> Dict[str, int]:
     counts: Dict[str, int] = defaultdict(int)
     for signal in signals:
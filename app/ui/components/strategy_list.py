@@ -29,6 +29,14 @@ class StrategyListWidget(QtWidgets.QWidget):
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
         self._items: Dict[str, StrategyInfo] = self._load_strategies()
+        self._last_emitted: str | None = None
+
+        # Keyboard navigation and rubber-band selection fire several
+        # selection changes per user action; only announce the settled one.
+        self._select_timer = QtCore.QTimer(self)
+        self._select_timer.setSingleShot(True)
+        self._select_timer.setInterval(75)
+        self._select_timer.timeout.connect(self._emit_selection)
 
         self._search = QtWidgets.QLineEdit(self)
         self._search.setPlaceholderText("Search strategies…")
@@ -44,6 +52,7 @@ class StrategyListWidget(QtWidgets.QWidget):
         layout.addWidget(self._list)
 
         self._populate()
+        self._last_emitted = self.current_strategy()
 
     # ------------------------------------------------------------------
     # Public API
@@ -90,9 +99,14 @@ class StrategyListWidget(QtWidgets.QWidget):
             item.setHidden(not visible)
 
     def _on_selection_changed(self) -> None:
+        self._select_timer.start()
+
+    def _emit_selection(self) -> None:
         identifier = self.current_strategy()
-        if identifier is not None:
-            self.strategySelected.emit(identifier)
+        if identifier is None or identifier == self._last_emitted:
+            return
+        self._last_emitted = identifier
+        self.strategySelected.emit(identifier)
 
     def _ensure_visible(self, index: int) -> None:
         item = self._list.item(index)
@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
-from concurrent.futures import Future, ThreadPoolExecutor
+import concurrent.futures
+import csv
+import sys
+import threading
+from concurrent.futures import Executor, Future
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 from core.data.chart_loader import ChartDataProvider
 from core.models import ScanResult, TradeSignal
-from core.runners import ScanConfig, ScanRunner, ScanSummary
+from core.runners import ScanConfig, ScanProgress, ScanRunner, ScanSummary
 from core.scans import SCENARIO_REGISTRY, BaseScenario
 
 from .components import (
@@ -27,11 +34,157 @@ from .components import (
 
 __all__ = ["MainWindow"]
 
+_TICKER_SEPARATORS = str.maketrans("\r\n", ",,")
+# Symbol fetches are I/O bound, so the scan pool is sized for yfinance
+# rather than for the CPU count.
+_SCAN_WORKERS = 4
+_PERIOD_OPTIONS: Tuple[Tuple[str, str], ...] = (
+    ("3 Months", "3mo"),
+    ("6 Months", "6mo"),
+    ("1 Year", "1y"),
+    ("2 Years", "2y"),
+    ("5 Years", "5y"),
+    ("10 Years", "10y"),
+)
+_UNIVERSE_OPTIONS: Tuple[Tuple[str, str], ...] = (
+    ("US – All (NASDAQ + NYSE)", "us-all"),
+    ("S&P 500", "sp500"),
+    ("NASDAQ", "nasdaq"),
+    ("NYSE", "nyse"),
+    ("Custom list", "custom"),
+)
+_SIGNAL_EXPORT_COLUMNS = ("Symbol", "Timestamp", "Side", "Confidence", "Reason", "Scenario")
+
+
+@lru_cache(maxsize=1)
+def _sorted_scenarios() -> Tuple[Tuple[str, str], ...]:
+    """Return ``(identifier, display name)`` pairs sorted by display name."""
+
+    entries: List[Tuple[str, str]] = []
+    for identifier, scenario_cls in SCENARIO_REGISTRY.items():
+        name = getattr(scenario_cls, "name", None)
+        if not isinstance(name, str):
+            name = scenario_cls().name
+        entries.append((identifier, name))
+    entries.sort(key=lambda pair: pair[1].lower())
+    return tuple(entries)
+
+
+def _post(target: QtCore.QObject, slot: str, *args: object) -> None:
+    """Queue ``target.slot(*args)`` onto the target's thread from a worker."""
+
+    try:
+        QtCore.QMetaObject.invokeMethod(
+            target,
+            slot,
+            QtCore.Qt.ConnectionType.QueuedConnection,
+            *(QtCore.Q_ARG(object, arg) for arg in args),
+        )
+    except RuntimeError:  # pragma: no cover - window destroyed mid-scan
+        pass
+
+
+@lru_cache(maxsize=8)
+def _split_tickers(text: str) -> Tuple[str, ...]:
+    """Split a watchlist into unique, upper-cased and interned symbols."""
+
+    entries = (entry.strip() for entry in text.translate(_TICKER_SEPARATORS).upper().split(","))
+    return tuple(dict.fromkeys(sys.intern(entry) for entry in entries if entry))
+
+
+class _ChartSignals(QtCore.QObject):
+    loaded = QtCore.pyqtSignal(int, str, object)  # token, symbol, DataFrame | None
+    failed = QtCore.pyqtSignal(int, str)  # token, message
+
+
+class _ChartLoadRunnable(QtCore.QRunnable):
+    """Load chart data on the Qt thread pool and report back via signals."""
+
+    def __init__(
+        self,
+        provider: ChartDataProvider,
+        signals: _ChartSignals,
+        token: int,
+        symbol: str,
+        period: str,
+    ) -> None:
+        super().__init__()
+        self._provider = provider
+        self._signals = signals
+        self._token = token
+        self._symbol = symbol
+        self._period = period
+
+    def run(self) -> None:  # pragma: no cover - executed on a pool thread
+        try:
+            frame = self._provider.load(self._symbol, self._period)
+        except Exception as exc:  # pragma: no cover - defensive feedback
+            self._emit(self._signals.failed, self._token, str(exc))
+            return
+        self._emit(self._signals.loaded, self._token, self._symbol, frame)
+
+    @staticmethod
+    def _emit(signal, *args) -> None:
+        try:
+            signal.emit(*args)
+        except RuntimeError:  # pragma: no cover - window destroyed mid-load
+            pass
+
+
+class _DetailPlaceholder(QtWidgets.QWidget):
+    """Empty stand-in reserving splitter space for a lazily built panel."""
+
+    def sizeHint(self) -> QtCore.QSize:  # type: ignore[override]
+        return QtCore.QSize(720, 360)
+
+
+class _QThreadPoolExecutor(Executor):
+    """Minimal :class:`~concurrent.futures.Executor` backed by a ``QThreadPool``.
 
-class _ScanBridge(QtCore.QObject):
-    resultReceived = QtCore.pyqtSignal(object, object)  # ScanResult | None, List[TradeSignal]
-    progressUpdated = QtCore.pyqtSignal(object)  # ScanProgress
-    scanFinished = QtCore.pyqtSignal(object, object)  # ScanSummary | None, Exception | None
+    Only futures submitted through the executor are cancelled or waited on
+    by :meth:`shutdown`, so other runnables on the pool are left alone.
+    """
+
+    def __init__(self, pool: QtCore.QThreadPool) -> None:
+        self._pool = pool
+        self._lock = threading.Lock()
+        self._futures: Set[Future] = set()
+        self._shutdown = False
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+
+        def _run() -> None:  # pragma: no cover - executed on a pool thread
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._futures.add(future)
+        future.add_done_callback(self._forget)
+        self._pool.start(_run)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            self._shutdown = True
+            futures = list(self._futures)
+        if cancel_futures:
+            for future in futures:
+                future.cancel()
+        if wait:
+            concurrent.futures.wait(futures)
+
+    def _forget(self, future: Future) -> None:
+        with self._lock:
+            self._futures.discard(future)
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -42,18 +195,52 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setWindowTitle("Rectifex Global Screener")
         self.resize(1280, 840)
 
-        self._runner = runner or ScanRunner(max_workers=4)
+        # Scans get a pool of their own so chart previews on the global pool
+        # never wait behind symbol fetches. Idle Qt pool threads expire, so
+        # neither pool keeps workers around between scans.
+        self._thread_pool = QtCore.QThreadPool.globalInstance()
+        self._scan_pool = QtCore.QThreadPool(self)
+        self._scan_pool.setMaxThreadCount(_SCAN_WORKERS)
+        self._scan_executor: Optional[_QThreadPoolExecutor] = None
         self._owns_runner = runner is None
-        self._bridge = _ScanBridge(self)
-        self._signal_store: Dict[str, List[TradeSignal]] = {}
+        if runner is None:
+            self._scan_executor = _QThreadPoolExecutor(self._scan_pool)
+            runner = ScanRunner(max_workers=_SCAN_WORKERS, executor=self._scan_executor)
+        self._runner = runner
+        self._scenario_cache: Dict[str, BaseScenario] = {}
+        self._strategy_index: Dict[str, int] = {}
+        self._signal_store: Dict[str, Tuple[TradeSignal, ...]] = {}
+        self._export_cache: Dict[str, Dict[str, object]] = {}
+        self._pending_results: List[Tuple[Optional[ScanResult], Sequence[TradeSignal]]] = []
+        # Streamed results are buffered and drained in one model update per tick.
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_pending)
+        # Progress is repainted at most every 100 ms, showing the latest snapshot.
+        self._latest_progress: Optional[ScanProgress] = None
+        self._rendered_progress: Optional[ScanProgress] = None
+        self._progress_timer = QtCore.QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._render_progress)
+        # Collapse rapid keyboard navigation into one insight/chart refresh.
+        self._pending_index = QtCore.QPersistentModelIndex()
+        self._selection_debounce = QtCore.QTimer(self)
+        self._selection_debounce.setSingleShot(True)
+        self._selection_debounce.setInterval(150)
+        self._selection_debounce.timeout.connect(self._apply_pending_selection)
+        self._auto_select_pending = False
         self._chart_provider = ChartDataProvider()
-        self._chart_executor = ThreadPoolExecutor(max_workers=1)
+        self._chart_signals = _ChartSignals(self)
         self._chart_request_token = 0
+        self._chart_last: Optional[Tuple[str, str]] = None
         self._active_period = "1y"
 
-        self._bridge.resultReceived.connect(self._handle_stream_result)
-        self._bridge.progressUpdated.connect(self._update_progress)
-        self._bridge.scanFinished.connect(self._scan_finished)
+        # Bridge signals are always emitted from runner threads.
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+        self._chart_signals.loaded.connect(self._handle_chart_loaded, queued)
+        self._chart_signals.failed.connect(self._handle_chart_error, queued)
 
         self._results_model = ResultsTableModel(self)
         self._results_view = ResultsTableView(self)
@@ -62,8 +249,13 @@ class MainWindow(QtWidgets.QMainWindow):
         header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Interactive)
         header.setStretchLastSection(True)
 
-        self._chart_widget = ChartWidget(self)
-        self._insight_panel = InsightPanel(self)
+        # The insight panel and chart (with its matplotlib figure) are built on
+        # the first selection; empty placeholders hold their splitter slots.
+        self._insight_panel: Optional[InsightPanel] = None
+        self._chart_widget: Optional[ChartWidget] = None
+        self._insight_placeholder = _DetailPlaceholder(self)
+        self._chart_placeholder = _DetailPlaceholder(self)
+        self._detail_splitter: Optional[QtWidgets.QSplitter] = None
 
         self._strategy_sidebar = StrategyListWidget(self)
         self._strategy_sidebar.strategySelected.connect(self._on_sidebar_strategy)
@@ -78,11 +270,15 @@ class MainWindow(QtWidgets.QMainWindow):
         status_bar.addPermanentWidget(self._cache_label)
 
         self._setup_toolbar()
-        self.setCentralWidget(self._build_layout())
+        # The splitter layout is assembled on first show so windows that are
+        # never displayed (headless runs, tests) skip building the subtree.
 
-        selection_model = self._results_view.selectionModel()
-        if selection_model is not None:
-            selection_model.currentChanged.connect(self._on_selection_changed)
+        # Model resets drop the current index without emitting currentChanged.
+        self._current_row = -1
+        self._results_model.modelReset.connect(self._on_results_reset)
+        self._selection_model = self._results_view.selectionModel()
+        if self._selection_model is not None:
+            self._selection_model.currentChanged.connect(self._on_selection_changed)
 
         self._populate_strategy_controls()
         self._set_controls_enabled(True)
@@ -100,12 +296,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self._strategy_combo.currentIndexChanged.connect(self._on_strategy_combo_changed)
 
         self._period_combo = QtWidgets.QComboBox(self)
-        for label, value in self._period_options():
+        for label, value in _PERIOD_OPTIONS:
             self._period_combo.addItem(label, value)
         self._period_combo.setCurrentIndex(1)
 
         self._universe_combo = QtWidgets.QComboBox(self)
-        for label, value in self._universe_options():
+        for label, value in _UNIVERSE_OPTIONS:
             self._universe_combo.addItem(label, value)
         self._universe_combo.setCurrentIndex(0)
 
@@ -175,8 +371,9 @@ class MainWindow(QtWidgets.QMainWindow):
         splitter.addWidget(results_container)
 
         right_splitter = QtWidgets.QSplitter(QtCore.Qt.Orientation.Vertical, splitter)
-        right_splitter.addWidget(self._insight_panel)
-        right_splitter.addWidget(self._chart_widget)
+        right_splitter.addWidget(self._insight_panel or self._insight_placeholder)
+        right_splitter.addWidget(self._chart_widget or self._chart_placeholder)
+        self._detail_splitter = right_splitter
         splitter.addWidget(right_splitter)
 
         splitter.setStretchFactor(0, 0)
@@ -186,19 +383,39 @@ class MainWindow(QtWidgets.QMainWindow):
 
         return central
 
+    def _ensure_detail_widgets(self) -> Tuple[InsightPanel, ChartWidget]:
+        if self._insight_panel is None or self._chart_widget is None:
+            self._insight_panel = InsightPanel(self)
+            self._chart_widget = ChartWidget(self)
+            for placeholder, widget in (
+                (self._insight_placeholder, self._insight_panel),
+                (self._chart_placeholder, self._chart_widget),
+            ):
+                splitter = self._detail_splitter
+                if splitter is not None and splitter.indexOf(placeholder) >= 0:
+                    splitter.replaceWidget(splitter.indexOf(placeholder), widget)
+                placeholder.deleteLater()
+        return self._insight_panel, self._chart_widget
+
+    def _ensure_central_widget(self) -> None:
+        if self.centralWidget() is None:
+            self.setCentralWidget(self._build_layout())
+
     def _populate_strategy_controls(self) -> None:
-        self._strategy_combo.blockSignals(True)
-        self._strategy_combo.clear()
-        entries: List[Tuple[str, BaseScenario]] = []
-        for identifier, scenario_cls in SCENARIO_REGISTRY.items():
-            scenario = scenario_cls()
-            entries.append((identifier, scenario))
-        entries.sort(key=lambda pair: pair[1].name.lower())
-
-        for identifier, scenario in entries:
-            self._strategy_combo.addItem(scenario.name, identifier)
-
-        self._strategy_combo.blockSignals(False)
+        entries = _sorted_scenarios()
+        items: List[QtGui.QStandardItem] = []
+        for identifier, name in entries:
+            item = QtGui.QStandardItem(name)
+            item.setData(identifier, QtCore.Qt.ItemDataRole.UserRole)
+            items.append(item)
+        self._strategy_index = {identifier: position for position, (identifier, _) in enumerate(entries)}
+        model = QtGui.QStandardItemModel(self._strategy_combo)
+        model.invisibleRootItem().appendRows(items)
+
+        with QtCore.QSignalBlocker(self._strategy_combo):
+            # One model swap instead of an insert and relayout per addItem.
+            self._strategy_combo.setModel(model)
+
         if self._strategy_combo.count() > 0:
             self._strategy_combo.setCurrentIndex(0)
             self._strategy_sidebar.select_strategy(self._current_strategy())
@@ -215,14 +432,22 @@ class MainWindow(QtWidgets.QMainWindow):
         self._filters_dock.set_strategy(identifier)
 
     def _on_sidebar_strategy(self, identifier: str) -> None:
-        combo_index = self._strategy_combo.findData(identifier)
+        combo_index = self._strategy_index.get(identifier, -1)
         if combo_index >= 0:
             self._strategy_combo.setCurrentIndex(combo_index)
 
     def _on_selection_changed(
         self, current: QtCore.QModelIndex, previous: QtCore.QModelIndex
     ) -> None:  # pragma: no cover - trivial glue
-        self._update_insight_from_index(current)
+        self._current_row = current.row() if current.isValid() else -1
+        self._pending_index = QtCore.QPersistentModelIndex(current)
+        self._selection_debounce.start()
+
+    def _on_results_reset(self) -> None:
+        self._current_row = -1
+
+    def _apply_pending_selection(self) -> None:
+        self._update_insight_from_index(QtCore.QModelIndex(self._pending_index))
 
     def _start_scan(self) -> None:
         strategy_id = self._current_strategy()
@@ -256,6 +481,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self._active_period = period_str
 
         self._signal_store.clear()
+        self._export_cache.clear()
+        self._pending_results.clear()
+        self._flush_timer.stop()
+        self._progress_timer.stop()
+        self._latest_progress = self._rendered_progress = None
+        self._auto_select_pending = True
         self._results_model.clear()
         self._progress_label.setText(initial_status)
         self.statusBar().showMessage(initial_status, 5000)
@@ -264,15 +495,16 @@ class MainWindow(QtWidgets.QMainWindow):
         self._stop_button.setEnabled(True)
         self._export_button.setEnabled(False)
         self._cancel_chart_request()
-        self._chart_widget.clear()
+        if self._chart_widget is not None:
+            self._chart_widget.clear()
 
-        scenario = SCENARIO_REGISTRY[strategy_id]()
+        scenario = self._scenario(strategy_id)
 
-        def _on_result(result: Optional[ScanResult], signals: List[TradeSignal]) -> None:
-            self._bridge.resultReceived.emit(result, signals)
+        def _on_result(result: Optional[ScanResult], signals: Sequence[TradeSignal]) -> None:
+            _post(self, "_handle_stream_result", result, signals)
 
         def _on_progress(progress) -> None:
-            self._bridge.progressUpdated.emit(progress)
+            _post(self, "_update_progress", progress)
 
         future = self._runner.start(
             scenario,
@@ -290,38 +522,92 @@ class MainWindow(QtWidgets.QMainWindow):
                 summary = fut.result()
             except Exception as exc:  # pragma: no cover - defensive
                 error = exc
-            self._bridge.scanFinished.emit(summary, error)
+            _post(self, "_scan_finished", summary, error)
 
         future.add_done_callback(_on_done)
 
+    def _scenario(self, strategy_id: str) -> BaseScenario:
+        # Scenarios carry no per-scan state, so one instance per strategy is reused.
+        scenario = self._scenario_cache.get(strategy_id)
+        if scenario is None:
+            scenario = SCENARIO_REGISTRY[strategy_id]()
+            self._scenario_cache[strategy_id] = scenario
+        return scenario
+
     def _stop_scan(self) -> None:
         self._runner.stop()
         self._stop_button.setEnabled(False)
         self._progress_label.setText("Stopping…")
 
-    def _handle_stream_result(self, result: Optional[ScanResult], signals: List[TradeSignal]) -> None:
-        if result is not None:
-            self._signal_store[result.symbol] = list(signals)
-            self._results_model.upsert_row(result, list(signals))
-            if self._results_model.rowCount() > 0:
-                self._export_button.setEnabled(True)
-            if self._results_model.rowCount() == 1:
-                index = self._results_model.index(0, 0)
-                self._results_view.selectRow(0)
-                self._update_insight_from_index(index)
-        elif signals:
-            # Assign signals to their symbol when result omitted (e.g. watch alerts)
-            for signal in signals:
-                bucket = self._signal_store.setdefault(signal.symbol, [])
-                bucket.append(signal)
-        self._update_selected_signals()
-
-    def _update_progress(self, progress) -> None:
+    @QtCore.pyqtSlot(object, object)
+    def _handle_stream_result(self, result: Optional[ScanResult], signals: Sequence[TradeSignal]) -> None:
+        self._pending_results.append((result, signals))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_pending(self) -> None:
+        if not self._pending_results:
+            return
+        batch = self._pending_results
+        self._pending_results = []
+
+        current_symbol = self._current_selected_symbol()
+        touches_current = False
+        rows: List[Tuple[ScanResult, Tuple[TradeSignal, ...]]] = []
+        for result, signals in batch:
+            if result is not None:
+                symbol = sys.intern(result.symbol)
+                stored = tuple(signals)  # no copy: the runner already emits tuples
+                self._signal_store[symbol] = stored
+                self._export_cache[symbol] = self._export_record(result)
+                rows.append((result, stored))
+                touches_current = touches_current or symbol == current_symbol
+            elif signals:
+                # Assign signals to their symbol when result omitted (e.g. watch alerts)
+                alerts: Dict[str, List[TradeSignal]] = {}
+                for signal in signals:
+                    alerts.setdefault(sys.intern(signal.symbol), []).append(signal)
+                for symbol, extra in alerts.items():
+                    self._signal_store[symbol] = self._signal_store.get(symbol, ()) + tuple(extra)
+                touches_current = touches_current or current_symbol in alerts
+
+        self._results_model.upsert_rows(rows)
+        if self._results_model.rowCount() > 0:
+            self._export_button.setEnabled(True)
+            if self._auto_select_pending:
+                # Select the first row once the batch is painted, off the streaming path.
+                self._auto_select_pending = False
+                QtCore.QTimer.singleShot(0, self._select_first_row)
+        if touches_current:
+            self._update_selected_signals()
+
+    def _select_first_row(self) -> None:
+        if self._current_row >= 0 or self._results_model.rowCount() == 0:
+            return
+        self._results_view.selectRow(0)
+        self._selection_debounce.stop()
+        self._update_insight_from_index(self._results_model.index(0, 0))
+
+    @QtCore.pyqtSlot(object)
+    def _update_progress(self, progress: ScanProgress) -> None:
+        self._latest_progress = progress
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _render_progress(self) -> None:
+        progress = self._latest_progress
+        if progress is None or progress == self._rendered_progress:
+            return
+        self._rendered_progress = progress
         self._progress_label.setText(
             f"Processed {progress.processed}/{progress.total} · Skipped {progress.skipped} · Errors {progress.errors}"
         )
 
+    @QtCore.pyqtSlot(object, object)
     def _scan_finished(self, summary: Optional[ScanSummary], error: Optional[Exception]) -> None:
+        self._flush_timer.stop()
+        self._progress_timer.stop()
+        self._flush_pending()
         self._set_controls_enabled(True)
         self._stop_button.setEnabled(False)
         if error is not None:
@@ -346,85 +632,85 @@ class MainWindow(QtWidgets.QMainWindow):
 
     @staticmethod
     def _parse_tickers(text: str) -> List[str]:
-        entries = [entry.strip().upper() for entry in text.replace("\n", ",").split(",")]
-        return [entry for entry in entries if entry]
+        return list(_split_tickers(text))
 
     def _update_insight_from_index(self, index: QtCore.QModelIndex) -> None:
         if not index.isValid():
-            self._insight_panel.show_result(None, [])
             self._cancel_chart_request()
-            self._chart_widget.set_symbol(None)
+            if self._insight_panel is not None and self._chart_widget is not None:
+                self._insight_panel.show_result(None, [])
+                self._chart_widget.set_symbol(None)
             return
 
+        insight_panel, chart_widget = self._ensure_detail_widgets()
         row = index.row()
         row_data = self._results_model.row_at(row)
         if row_data is None:
-            self._insight_panel.show_result(None, [])
+            insight_panel.show_result(None, [])
             return
 
         signals = self._signal_store.get(row_data.result.symbol, row_data.signals)
-        self._insight_panel.show_result(row_data.result, signals)
+        insight_panel.show_result(row_data.result, signals)
         symbol = row_data.result.symbol
-        self._chart_widget.set_symbol(symbol)
-        self._chart_widget.display_signals(signals)
+        chart_widget.set_symbol(symbol)
+        chart_widget.display_signals(signals)
         self._request_chart_data(symbol)
 
+    def _current_selected_symbol(self) -> Optional[str]:
+        row_data = self._results_model.row_at(self._current_row)
+        return row_data.result.symbol if row_data is not None else None
+
     def _update_selected_signals(self) -> None:
-        index = self._results_view.currentIndex()
-        if index.isValid():
-            self._update_insight_from_index(index)
+        if self._current_row >= 0:
+            self._update_insight_from_index(self._results_model.index(self._current_row, 0))
 
     def _request_chart_data(self, symbol: str) -> None:
         if not symbol:
             return
+        period = self._active_period or str(self._period_combo.currentData() or "1y")
+        if (symbol, period) == self._chart_last:
+            # Already shown (or still loading); nothing new to fetch.
+            return
         self._chart_request_token += 1
         token = self._chart_request_token
-        period = self._active_period or str(self._period_combo.currentData() or "1y")
-
-        self._chart_widget.set_loading()
-
-        future: Future[Optional[pd.DataFrame]] = self._chart_executor.submit(
-            self._chart_provider.load,
-            symbol,
-            period,
-        )
+        self._chart_last = (symbol, period)
 
-        def _relay(fut: Future[Optional[pd.DataFrame]]) -> None:
-            try:
-                frame = fut.result()
-            except Exception as exc:  # pragma: no cover - defensive feedback
-                message = str(exc)
-                QtCore.QTimer.singleShot(
-                    0,
-                    lambda: self._handle_chart_error(token, message),
-                )
-                return
-
-            QtCore.QTimer.singleShot(
-                0,
-                lambda: self._handle_chart_loaded(token, symbol, frame),
-            )
+        try:
+            cached = self._chart_provider.load_cached(symbol, period)
+        except Exception:  # pragma: no cover - fall back to the background load
+            cached = None
+        if cached is not None:
+            # Fresh cache hits render immediately without a worker round trip.
+            self._handle_chart_loaded(token, symbol, cached)
+            return
 
-        future.add_done_callback(_relay)
+        self._ensure_detail_widgets()[1].set_loading()
+        runnable = _ChartLoadRunnable(self._chart_provider, self._chart_signals, token, symbol, period)
+        self._thread_pool.start(runnable)
 
+    @QtCore.pyqtSlot(int, str, object)
     def _handle_chart_loaded(
         self, token: int, symbol: str, frame: Optional[pd.DataFrame]
     ) -> None:
         if token != self._chart_request_token:
             return
-        self._chart_widget.set_price_data(frame)
+        chart_widget = self._ensure_detail_widgets()[1]
+        chart_widget.set_price_data(frame)
         if frame is not None and not frame.empty:
-            signals = self._signal_store.get(symbol, [])
+            signals = self._signal_store.get(symbol, ())
             if signals:
-                self._chart_widget.display_signals(signals)
+                chart_widget.display_signals(signals)
 
+    @QtCore.pyqtSlot(int, str)
     def _handle_chart_error(self, token: int, message: str) -> None:
         if token != self._chart_request_token:
             return
-        self._chart_widget.set_error(f"Failed to load chart data: {message}")
+        self._chart_last = None
+        self._ensure_detail_widgets()[1].set_error(f"Failed to load chart data: {message}")
 
     def _cancel_chart_request(self) -> None:
         self._chart_request_token += 1
+        self._chart_last = None
 
     def _set_controls_enabled(self, enabled: bool) -> None:
         self._run_button.setEnabled(enabled)
@@ -463,28 +749,36 @@ class MainWindow(QtWidgets.QMainWindow):
         if selected_filter.startswith("CSV") and path.suffix.lower() != ".csv":
             path = path.with_suffix(".csv")
 
+        is_csv = path.suffix.lower() == ".csv"
         try:
-            results_df, signals_df = self._prepare_export_frames(rows, self._signal_store)
-            if path.suffix.lower() == ".csv":
-                results_df.to_csv(path, index=False)
+            if is_csv and self._export_cache:
+                self._write_csv(path, self._export_cache.values())
             else:
-                include_signals = False
-                if not signals_df.empty:
-                    response = QtWidgets.QMessageBox.question(
-                        self,
-                        "Include signals",
-                        "Include a separate 'Signals' sheet with trade signals?",
-                        QtWidgets.QMessageBox.StandardButton.Yes
-                        | QtWidgets.QMessageBox.StandardButton.No,
-                        QtWidgets.QMessageBox.StandardButton.Yes,
-                    )
-                    include_signals = (
-                        response == QtWidgets.QMessageBox.StandardButton.Yes
-                    )
-                with pd.ExcelWriter(path, engine="openpyxl") as writer:
-                    results_df.to_excel(writer, sheet_name="Results", index=False)
+                results_df, signals_df = self._prepare_export_frames(
+                    rows,
+                    self._signal_store,
+                    records=self._export_cache.values(),
+                )
+                if is_csv:
+                    results_df.to_csv(path, index=False)
+                else:
+                    include_signals = False
+                    if not signals_df.empty:
+                        response = QtWidgets.QMessageBox.question(
+                            self,
+                            "Include signals",
+                            "Include a separate 'Signals' sheet with trade signals?",
+                            QtWidgets.QMessageBox.StandardButton.Yes
+                            | QtWidgets.QMessageBox.StandardButton.No,
+                            QtWidgets.QMessageBox.StandardButton.Yes,
+                        )
+                        include_signals = (
+                            response == QtWidgets.QMessageBox.StandardButton.Yes
+                        )
+                    sheets = [("Results", results_df)]
                     if include_signals and not signals_df.empty:
-                        signals_df.to_excel(writer, sheet_name="Signals", index=False)
+                        sheets.append(("Signals", signals_df))
+                    self._write_excel(path, sheets)
             QtWidgets.QMessageBox.information(
                 self,
                 "Export complete",
@@ -497,99 +791,155 @@ class MainWindow(QtWidgets.QMainWindow):
                 f"Unable to export results: {exc}",
             )
 
+    @staticmethod
+    def _write_csv(path: Path, records: Iterable[Dict[str, object]]) -> None:
+        """Stream export *records* to *path*, highest score first."""
+
+        records = list(records)
+        # Column order follows first appearance, as DataFrame(records) would.
+        fieldnames = list(dict.fromkeys(key for record in records for key in record))
+        ordered = sorted(records, key=lambda record: record["Score"], reverse=True)  # type: ignore[arg-type, return-value]
+        with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as handle:
+            writer = csv.DictWriter(handle, fieldnames=fieldnames, extrasaction="ignore")
+            writer.writeheader()
+            for record in ordered:
+                # Match to_csv, which leaves missing values empty.
+                writer.writerow(
+                    {key: "" if isinstance(value, float) and value != value else value for key, value in record.items()}
+                )
+
+    @staticmethod
+    def _write_excel(path: Path, sheets: Sequence[Tuple[str, pd.DataFrame]]) -> None:
+        """Stream *sheets* into a write-only openpyxl workbook at *path*."""
+
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        for title, frame in sheets:
+            worksheet = workbook.create_sheet(title)
+            worksheet.append([str(column) for column in frame.columns])
+            # Plain Python objects with None for gaps, as to_excel would write.
+            values = frame.astype(object).where(frame.notna(), None)
+            for row in values.itertuples(index=False, name=None):
+                worksheet.append(row)
+        workbook.save(path)
+
+    @staticmethod
+    def _export_record(result: ScanResult) -> Dict[str, object]:
+        record: Dict[str, object] = {
+            "Symbol": result.symbol,
+            "Score": round(float(result.score), 2),
+            "Last Price": round(float(result.last_price), 2),
+            "As Of": result.as_of.isoformat(),
+            "Top Reasons": " | ".join(result.reasons),
+        }
+
+        metrics = result.metrics or {}
+        for key, value in sorted(metrics.items()):
+            record[f"metric_{key}"] = value
+
+        if result.meta is not None:
+            record.update(
+                {
+                    "Name": result.meta.name or "",
+                    "Exchange": result.meta.exchange or "",
+                    "Currency": result.meta.currency or "",
+                    "Market Cap": result.meta.market_cap or "",
+                }
+            )
+        return record
+
+    @staticmethod
+    def _results_frame(rows: Sequence[ResultRow]) -> pd.DataFrame:
+        """Build the results export frame column by column from *rows*."""
+
+        if not rows:
+            return pd.DataFrame()
+        results = [row.result for row in rows]
+        columns: Dict[str, List[object]] = {
+            "Symbol": [result.symbol for result in results],
+            "Score": [round(float(result.score), 2) for result in results],
+            "Last Price": [round(float(result.last_price), 2) for result in results],
+            "As Of": [result.as_of.isoformat() for result in results],
+            "Top Reasons": [" | ".join(result.reasons) for result in results],
+        }
+
+        metric_keys = sorted({key for result in results for key in (result.metrics or {})})
+        for key in metric_keys:
+            columns[f"metric_{key}"] = [
+                (result.metrics or {}).get(key, np.nan) for result in results
+            ]
+
+        if any(result.meta is not None for result in results):
+            metas = [result.meta for result in results]
+            columns["Name"] = [meta.name or "" if meta is not None else np.nan for meta in metas]
+            columns["Exchange"] = [meta.exchange or "" if meta is not None else np.nan for meta in metas]
+            columns["Currency"] = [meta.currency or "" if meta is not None else np.nan for meta in metas]
+            columns["Market Cap"] = [meta.market_cap or "" if meta is not None else np.nan for meta in metas]
+        return pd.DataFrame(columns)
+
     @staticmethod
     def _prepare_export_frames(
         rows: Sequence[ResultRow],
-        signal_store: Dict[str, List[TradeSignal]],
+        signal_store: Mapping[str, Sequence[TradeSignal]],
+        records: Optional[Iterable[Dict[str, object]]] = None,
     ) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        result_records: List[Dict[str, object]] = []
-        aggregated_signals: Dict[str, List[TradeSignal]] = {}
+        """Build the results and signals frames for export.
 
-        for row in rows:
-            result = row.result
-            aggregated_signals.setdefault(result.symbol, []).extend(row.signals)
-
-            record: Dict[str, object] = {
-                "Symbol": result.symbol,
-                "Score": round(float(result.score), 2),
-                "Last Price": round(float(result.last_price), 2),
-                "As Of": result.as_of.isoformat(),
-                "Top Reasons": " | ".join(result.reasons),
-            }
-
-            metrics = result.metrics or {}
-            for key, value in sorted(metrics.items()):
-                record[f"metric_{key}"] = value
-
-            if result.meta is not None:
-                record.update(
-                    {
-                        "Name": result.meta.name or "",
-                        "Exchange": result.meta.exchange or "",
-                        "Currency": result.meta.currency or "",
-                        "Market Cap": result.meta.market_cap or "",
-                    }
-                )
+        *records* are the per-symbol result dicts collected while streaming;
+        when omitted they are rebuilt from *rows*.
+        """
 
-            result_records.append(record)
+        aggregated_signals: Dict[str, List[TradeSignal]] = {}
+        for row in rows:
+            aggregated_signals.setdefault(row.result.symbol, []).extend(row.signals)
 
         for symbol, stored in signal_store.items():
             aggregated_signals.setdefault(symbol, []).extend(stored)
 
-        results_df = pd.DataFrame(result_records)
+        if records is None:
+            results_df = MainWindow._results_frame(rows)
+        else:
+            results_df = pd.DataFrame(list(records))
         if not results_df.empty:
             results_df.sort_values("Score", ascending=False, inplace=True, ignore_index=True)
 
-        signal_records: List[Dict[str, object]] = []
-        for symbol, signals in aggregated_signals.items():
-            for signal in signals:
-                signal_records.append(
-                    {
-                        "Symbol": signal.symbol,
-                        "Timestamp": signal.timestamp.isoformat(),
-                        "Side": signal.side.title(),
-                        "Confidence": round(float(signal.confidence), 4),
-                        "Reason": signal.reason,
-                        "Scenario": signal.scenario_id,
-                    }
+        signals_df = pd.DataFrame.from_records(
+            [
+                (
+                    signal.symbol,
+                    signal.timestamp.isoformat(),
+                    signal.side.title(),
+                    round(float(signal.confidence), 4),
+                    signal.reason,
+                    signal.scenario_id,
                 )
-
-        signals_df = pd.DataFrame(signal_records)
+                for signal in chain.from_iterable(aggregated_signals.values())
+            ],
+            columns=_SIGNAL_EXPORT_COLUMNS,
+        )
         if not signals_df.empty:
             signals_df.sort_values(["Symbol", "Timestamp"], inplace=True, ignore_index=True)
 
         return results_df, signals_df
 
-    @staticmethod
-    def _period_options() -> Sequence[Tuple[str, str]]:
-        return (
-            ("3 Months", "3mo"),
-            ("6 Months", "6mo"),
-            ("1 Year", "1y"),
-            ("2 Years", "2y"),
-            ("5 Years", "5y"),
-            ("10 Years", "10y"),
-        )
-
-    @staticmethod
-    def _universe_options() -> Sequence[Tuple[str, str]]:
-        return (
-            ("US – All (NASDAQ + NYSE)", "us-all"),
-            ("S&P 500", "sp500"),
-            ("NASDAQ", "nasdaq"),
-            ("NYSE", "nyse"),
-            ("Custom list", "custom"),
-        )
-
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
+    def showEvent(self, event: QtGui.QShowEvent) -> None:  # pragma: no cover - Qt callback
+        self._ensure_central_widget()
+        super().showEvent(event)
+
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:  # pragma: no cover - Qt callback
         try:
             self._runner.stop()
             if self._owns_runner:
                 self._runner.shutdown()
-            self._chart_executor.shutdown(wait=False)
+            if self._scan_executor is not None:
+                self._scan_executor.shutdown(wait=False, cancel_futures=True)
+            self._cancel_chart_request()
+            self._scan_pool.waitForDone(1000)
+            self._thread_pool.waitForDone(1000)
         finally:
             super().closeEvent(event)
 
@@ -10,7 +10,7 @@ import time
 from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence
 
 import pandas as pd
 import yfinance as yf
@@ -225,7 +225,7 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         scan_config=scan_config,
     )
 
-    def _on_result(result: Optional[ScanResult], emitted: List[TradeSignal]) -> None:
+    def _on_result(result: Optional[ScanResult], emitted: Sequence[TradeSignal]) -> None:
         if result is not None:
             results[result.symbol] = result
         for signal in emitted:
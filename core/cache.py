@@ -1,16 +1,31 @@
+from functools import lru_cache
 from pathlib import Path
 import os
+from typing import Set
 from platformdirs import user_cache_dir
 
 APP_ID = "com.rectifex.GlobalScreener"  # must match your Flatpak app-id
 
+# Directories already created by this process; later Cache() calls skip mkdir.
+_INIT_DIRS: Set[Path] = set()
+
+@lru_cache(maxsize=1)
+def _default_cache_root() -> Path:
+    # Respect XDG inside/outside Flatpak
+    return Path(user_cache_dir(appname=APP_ID))
+
 def _cache_root() -> Path:
     # Allow override for dev/testing
     override = os.environ.get("RECTIFEX_CACHE_DIR")
     if override:
         return Path(override)
-    # Respect XDG inside/outside Flatpak
-    return Path(user_cache_dir(appname=APP_ID))
+    return _default_cache_root()
+
+def _ensure_dir(path: Path) -> None:
+    if path in _INIT_DIRS:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _INIT_DIRS.add(path)
 
 class Cache:
     def __init__(self) -> None:
@@ -18,6 +33,6 @@ class Cache:
         self.prices_dir = self.base_dir / "prices"
         self.images_dir = self.base_dir / "images"
         self.universe_dir = self.base_dir / "universe"
-        self.prices_dir.mkdir(parents=True, exist_ok=True)
-        self.images_dir.mkdir(parents=True, exist_ok=True)
-        self.universe_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.prices_dir)
+        _ensure_dir(self.images_dir)
+        _ensure_dir(self.universe_dir)
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
 
 @dataclass(frozen=True)
@@ -27,18 +28,23 @@ class FetcherConfig:
     period_default: str = "1y"
 
 
+_LTI_PROFILES: Mapping[str, Mapping[str, int]] = MappingProxyType(
+    {
+        "balanced": MappingProxyType({"quality": 35, "growth": 25, "value": 20, "finance": 15, "dividend": 5}),
+        "quality": MappingProxyType({"quality": 45, "growth": 20, "value": 15, "finance": 15, "dividend": 5}),
+        "growth": MappingProxyType({"quality": 25, "growth": 40, "value": 15, "finance": 15, "dividend": 5}),
+        "income": MappingProxyType({"quality": 25, "growth": 15, "value": 15, "finance": 20, "dividend": 25}),
+    }
+)
+
+
 @dataclass(frozen=True)
 class ProfilesConfig:
     """Weight profiles used by composite scoring modules."""
 
-    lti_profiles: Dict[str, Dict[str, int]] = field(
-        default_factory=lambda: {
-            "balanced": {"quality": 35, "growth": 25, "value": 20, "finance": 15, "dividend": 5},
-            "quality": {"quality": 45, "growth": 20, "value": 15, "finance": 15, "dividend": 5},
-            "growth": {"quality": 25, "growth": 40, "value": 15, "finance": 15, "dividend": 5},
-            "income": {"quality": 25, "growth": 15, "value": 15, "finance": 20, "dividend": 25},
-        }
-    )
+    # Read-only and shared by every instance; the factory only returns the
+    # singleton because mapping proxies are not accepted as plain defaults.
+    lti_profiles: Mapping[str, Mapping[str, int]] = field(default_factory=lambda: _LTI_PROFILES)
 
 
 @dataclass(frozen=True)
@@ -35,13 +35,8 @@ class ChartDataProvider:
         stale cache copy to ensure the UI can still show historical context.
         """
 
-        cached = self._cache.get(symbol, period)
-        if cached is not None and not cached.empty:
-            cached = cached.copy()
-            cached.attrs["symbol"] = symbol
-
-        ttl = self._ttl_days
-        if cached is not None and not cached.empty and not self._cache.is_stale(symbol, period, ttl_days=ttl):
+        cached = self._cached_copy(symbol, period)
+        if self._is_fresh(symbol, period, cached):
             return cached
 
         fresh = self._fetcher.fetch_single(symbol, period=period)
@@ -52,3 +47,29 @@ class ChartDataProvider:
             return fresh
 
         return cached
+
+    def load_cached(self, symbol: str, period: str) -> Optional[pd.DataFrame]:
+        """Return the cached frame when it is still fresh, without fetching.
+
+        Only the local cache is consulted, which keeps the call cheap enough
+        for the UI thread to try before scheduling a background load.
+        """
+
+        cached = self._cached_copy(symbol, period)
+        if self._is_fresh(symbol, period, cached):
+            return cached
+        return None
+
+    def _cached_copy(self, symbol: str, period: str) -> Optional[pd.DataFrame]:
+        cached = self._cache.get(symbol, period)
+        if cached is not None and not cached.empty:
+            cached = cached.copy()
+            cached.attrs["symbol"] = symbol
+        return cached
+
+    def _is_fresh(self, symbol: str, period: str, cached: Optional[pd.DataFrame]) -> bool:
+        return (
+            cached is not None
+            and not cached.empty
+            and not self._cache.is_stale(symbol, period, ttl_days=self._ttl_days)
+        )
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Dict, Mapping, Sequence
+import re
+from functools import lru_cache
+from typing import Dict, List, Mapping, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 
-__all__ = ["read_fundamentals"]
+try:  # Optional: Arrow's regex and cast kernels speed up batch parsing.
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - pyarrow not installed
+    pa = pc = None
+
+__all__ = ["read_fundamentals", "read_fundamentals_batch"]
 
 
 _FUNDAMENTAL_KEYS = [
@@ -56,6 +64,29 @@ _ALIAS_PATHS: Dict[str, Sequence[Sequence[str] | str]] = {
     "averageVolume": [("summaryDetail", "averageVolume"), ("price", "averageDailyVolume10Day")],
 }
 
+_ALLOWED = frozenset("0123456789+-.eE")
+_DROP_DISALLOWED = str.maketrans("", "", "".join(chr(code) for code in range(128) if chr(code) not in _ALLOWED))
+_FLOAT_TEXT = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+# Every alias as a tuple of path segments, built once at import.
+_COMPILED_ALIASES: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    key: tuple((alias,) if isinstance(alias, str) else tuple(alias) for alias in aliases)
+    for key, aliases in _ALIAS_PATHS.items()
+}
+
+_MISSING = object()
+_MISSING_TOKENS = frozenset({"nan", "n/a", "na", "none", "null", "-"})
+_UNIT_MULTIPLIERS = {"k": 1e3, "m": 1e6, "b": 1e9, "t": 1e12}
+# Plain "<number>[unit][%]" strings, the overwhelmingly common yfinance shape.
+# Anything else goes through the per-value ``_coerce_numeric`` path.
+# ASCII-only so the fast path never accepts digits ``_clean_numeric_string``
+# would drop. The syntax is shared by Python ``re`` and Arrow's RE2.
+_NUMERIC_TEXT_PATTERN = (
+    r"^\s*(?P<number>[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)\s*(?P<unit>[kKmMbBtT]?)(?P<percent>%?)\s*$"
+)
+_NUMERIC_TEXT = re.compile(_NUMERIC_TEXT_PATTERN, re.ASCII)
+_UNIT_KEYS = ("", "k", "m", "b", "t")
+_UNIT_SCALES = np.array([1.0, 1e3, 1e6, 1e9, 1e12])
+
 
 def read_fundamentals(info: Mapping[str, object] | None) -> Dict[str, float]:
     """Return a normalised dictionary of fundamental metrics.
@@ -65,6 +96,9 @@ def read_fundamentals(info: Mapping[str, object] | None) -> Dict[str, float]:
     is extracted to keep the downstream scoring logic deterministic.
     """
 
+    if type(info) is dict:
+        return _read_plain_dict(info)
+
     normalised = _normalise_mapping(info)
     if normalised is None:
         return {key: np.nan for key in _FUNDAMENTAL_KEYS}
@@ -76,6 +110,70 @@ def read_fundamentals(info: Mapping[str, object] | None) -> Dict[str, float]:
     return result
 
 
+def read_fundamentals_batch(infos: Mapping[str, Mapping[str, object] | None]) -> pd.DataFrame:
+    """Return fundamentals for many symbols as a frame indexed by symbol.
+
+    Values match :func:`read_fundamentals` for each entry; string columns are
+    parsed in one vectorised pass instead of value by value.
+    """
+
+    symbols = list(infos)
+    normalised = [_normalise_mapping(infos[symbol]) for symbol in symbols]
+    columns: Dict[str, np.ndarray] = {}
+    for key in _FUNDAMENTAL_KEYS:
+        raw = [None if info is None else _extract_value(info, key) for info in normalised]
+        columns[key] = _coerce_column(raw)
+    return pd.DataFrame(columns, index=pd.Index(symbols, name="symbol"), columns=_FUNDAMENTAL_KEYS)
+
+
+def _coerce_column(values: Sequence[object]) -> np.ndarray:
+    result = np.full(len(values), np.nan)
+    text_positions: List[int] = []
+    texts: List[str] = []
+    for position, value in enumerate(values):
+        if value is None:
+            continue
+        if isinstance(value, str):
+            text_positions.append(position)
+            texts.append(value)
+        else:
+            result[position] = _coerce_numeric(value)
+
+    if not texts:
+        return result
+
+    if pc is not None:
+        matched, parsed = _parse_texts_arrow(texts)
+    else:
+        matched, parsed = _parse_texts_pandas(texts)
+
+    positions = np.asarray(text_positions)
+    result[positions[matched]] = parsed[matched]
+    for position, text in zip(positions[~matched], np.asarray(texts, dtype=object)[~matched]):
+        result[position] = _coerce_numeric(text)
+    return result
+
+
+def _parse_texts_arrow(texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    parts = pc.extract_regex(pa.array(texts, type=pa.string()), _NUMERIC_TEXT_PATTERN)
+    matched = parts.is_valid().to_numpy(zero_copy_only=False)
+    numbers = pc.cast(pc.struct_field(parts, "number"), pa.float64()).to_numpy(zero_copy_only=False)
+    unit_index = pc.index_in(pc.utf8_lower(pc.struct_field(parts, "unit")), value_set=pa.array(_UNIT_KEYS))
+    units = _UNIT_SCALES[pc.fill_null(unit_index, 0).to_numpy(zero_copy_only=False)]
+    is_percent = pc.fill_null(pc.equal(pc.struct_field(parts, "percent"), "%"), False)
+    percents = np.where(is_percent.to_numpy(zero_copy_only=False), 0.01, 1.0)
+    return matched, numbers * (percents * units)
+
+
+def _parse_texts_pandas(texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    parts = pd.Series(texts, dtype=object).str.extract(_NUMERIC_TEXT)
+    matched = parts["number"].notna().to_numpy()
+    numbers = pd.to_numeric(parts["number"], errors="coerce").to_numpy(dtype=float)
+    units = parts["unit"].str.lower().map(_UNIT_MULTIPLIERS).fillna(1.0).to_numpy(dtype=float)
+    percents = np.where(parts["percent"].to_numpy() == "%", 0.01, 1.0)
+    return matched, numbers * (percents * units)
+
+
 def _normalise_mapping(info: object) -> Mapping[str, object] | None:
     if info is None:
         return None
@@ -88,17 +186,52 @@ def _normalise_mapping(info: object) -> Mapping[str, object] | None:
     return None
 
 
+def _read_plain_dict(info: Dict[str, object]) -> Dict[str, float]:
+    # yfinance hands back plain dicts with mostly float fields; keep those off
+    # the generic dispatch.
+    result: Dict[str, float] = {}
+    for key in _FUNDAMENTAL_KEYS:
+        value = info.get(key, _MISSING)
+        if value is _MISSING:
+            value = _alias_value(info, key)
+        if type(value) is float:
+            result[key] = value
+        else:
+            result[key] = _coerce_numeric(value)
+    return result
+
+
 def _extract_value(info: Mapping[str, object], key: str) -> object:
     if key in info:
         return info[key]
+    return _alias_value(info, key)
 
-    for alias in _ALIAS_PATHS.get(key, ()):  # type: ignore[arg-type]
-        value = _value_from_alias(info, alias)
+
+def _alias_value(info: Mapping[str, object], key: str) -> object:
+    for alias in _COMPILED_ALIASES.get(key, ()):
+        if len(alias) == 1:
+            value = info.get(alias[0])
+        elif len(alias) == 2:
+            value = _value_from_section(info, alias)
+        else:
+            value = _value_from_alias(info, alias)
         if value is not None:
             return value
     return None
 
 
+def _value_from_section(info: Mapping[str, object], alias: Tuple[str, ...]) -> object:
+    # Fast path for the common ``(section, field)`` alias over plain dicts.
+    section = info.get(alias[0])
+    if section is None:
+        return None
+    if type(section) is dict:
+        value = section.get(alias[1])
+        if value is None or not isinstance(value, Mapping):
+            return value
+    return _value_from_alias(info, alias)
+
+
 def _value_from_alias(info: Mapping[str, object], alias: Sequence[str] | str) -> object:
     if isinstance(alias, str):
         return info.get(alias)
@@ -160,42 +293,48 @@ def _coerce_numeric(value: object) -> float:
         return _coerce_numeric(_first_scalar(value))
 
     if isinstance(value, pd.DataFrame):
-        return _coerce_numeric(_first_scalar(value.stack(dropna=False)))
+        return _coerce_numeric(_first_frame_scalar(value))
 
     if isinstance(value, str):
-        text = value.strip()
-        if not text:
-            return float("nan")
+        return _parse_numeric_string(value)
 
-        lowered = text.lower()
-        if lowered in {"nan", "n/a", "na", "none", "null", "-"}:
-            return float("nan")
+    try:
+        return float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return float("nan")
 
-        multiplier = 1.0
-        if text.endswith("%"):
-            text = text[:-1]
-            multiplier = 0.01
 
-        unit_multipliers = {"k": 1e3, "m": 1e6, "b": 1e9, "t": 1e12}
-        last_char = text[-1].lower()
-        if last_char in unit_multipliers and _is_numeric_prefix(text[:-1]):
-            multiplier *= unit_multipliers[last_char]
-            text = text[:-1]
+@lru_cache(maxsize=4096)
+def _parse_numeric_string(value: str) -> float:
+    """Parse a yfinance-formatted number; repeated strings hit the cache."""
 
-        cleaned = _clean_numeric_string(text)
-        if cleaned is None:
-            return float("nan")
+    text = value.strip()
+    if not text:
+        return float("nan")
 
-        try:
-            parsed = float(cleaned)
-        except ValueError:
-            return float("nan")
-        return parsed * multiplier
+    lowered = text.lower()
+    if lowered in _MISSING_TOKENS:
+        return float("nan")
+
+    multiplier = 1.0
+    if text.endswith("%"):
+        text = text[:-1]
+        multiplier = 0.01
+
+    last_char = text[-1].lower()
+    if last_char in _UNIT_MULTIPLIERS and _is_numeric_prefix(text[:-1]):
+        multiplier *= _UNIT_MULTIPLIERS[last_char]
+        text = text[:-1]
+
+    cleaned = _clean_numeric_string(text)
+    if cleaned is None:
+        return float("nan")
 
     try:
-        return float(value)  # type: ignore[arg-type]
-    except (TypeError, ValueError):
+        parsed = float(cleaned)
+    except ValueError:
         return float("nan")
+    return parsed * multiplier
 
 
 def _first_scalar(series: pd.Series) -> object:
@@ -207,6 +346,20 @@ def _first_scalar(series: pd.Series) -> object:
     return series.iloc[0]
 
 
+def _first_frame_scalar(frame: pd.DataFrame) -> object:
+    # Row-major first non-null cell, matching ``stack`` order without building it.
+    if frame.empty:
+        return float("nan")
+    first = frame.iat[0, 0]
+    if not pd.isna(first):
+        return first
+    values = frame.to_numpy().ravel()
+    present = np.flatnonzero(~pd.isna(values))
+    if present.size:
+        return values[present[0]]
+    return first
+
+
 def _coerce_series_value(value: object) -> object:
     if isinstance(value, pd.Series):
         return _first_scalar(value)
@@ -214,12 +367,13 @@ def _coerce_series_value(value: object) -> object:
 
 
 def _clean_numeric_string(text: str) -> str | None:
-    allowed = set("0123456789+-.eE")
-    cleaned_chars = [ch for ch in text if ch in allowed]
-    if not cleaned_chars:
+    if text.isascii():
+        cleaned = text.translate(_DROP_DISALLOWED)
+    else:
+        cleaned = "".join(ch for ch in text if ch in _ALLOWED)
+    if not cleaned:
         return None
 
-    cleaned = "".join(cleaned_chars)
     if cleaned.count(".") > 1:
         return None
     if cleaned.count("e") + cleaned.count("E") > 1:
@@ -232,10 +386,6 @@ def _is_numeric_prefix(text: str) -> bool:
     if not stripped:
         return False
     cleaned = _clean_numeric_string(stripped)
-    if cleaned is None:
-        return False
-    try:
-        float(cleaned)
-    except ValueError:
-        return False
-    return True
+    # ``cleaned`` only holds digits, signs, dots and exponents, so this is
+    # exactly the set of strings ``float`` accepts.
+    return cleaned is not None and _FLOAT_TEXT.fullmatch(cleaned) is not None
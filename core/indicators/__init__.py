@@ -0,0 +1,498 @@
+"""Collection of pure indicator helper functions used by the screener."""
+
+from __future__ import annotations
+
+import os
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from core.indicators import _kernels
+from core.indicators.cache import indicator_cache
+
+__all__ = [
+    "sma",
+    "ema",
+    "rsi",
+    "macd",
+    "atr",
+    "bollinger",
+    "stoch",
+    "adx",
+    "obv",
+    "vol_ma",
+    "keltner_channels",
+    "rolling_max",
+    "rolling_min",
+    "rsi_tail",
+    "sma_tail",
+    "bollinger_tail",
+    "stoch_tail",
+]
+
+
+def _as_series(values: Iterable[float] | pd.Series) -> pd.Series:
+    # Indicators never write into their input, so float64 data is used as is.
+    if isinstance(values, pd.Series):
+        if values.dtype == np.float64:
+            return values
+        return values.astype(np.float64, copy=False)
+    if isinstance(values, np.ndarray):
+        return pd.Series(np.ascontiguousarray(values, dtype=np.float64))
+    return pd.Series(np.fromiter(values, dtype=np.float64))
+
+
+def _values(data: pd.Series) -> np.ndarray:
+    return data.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _ewm_mean(data: pd.Series, *, com: float, min_periods: int = 0) -> pd.Series:
+    """``data.ewm(com=com, adjust=False).mean()``, compiled when Numba is present."""
+
+    if _kernels.NUMBA_AVAILABLE:
+        values = _kernels.ewm_mean(_values(data), com, max(min_periods, 1))
+        return pd.Series(values, index=data.index, name=data.name)
+    return data.ewm(com=com, adjust=False, min_periods=min_periods).mean()
+
+
+def _ewm_values(values: np.ndarray, *, com: float, min_periods: int = 0) -> np.ndarray:
+    """:func:`_ewm_mean` for callers that stay on plain arrays."""
+
+    if _kernels.NUMBA_AVAILABLE:
+        return _kernels.ewm_mean(values, com, max(min_periods, 1))
+    return _values(pd.Series(values).ewm(com=com, adjust=False, min_periods=min_periods).mean())
+
+
+def _directional_moves(high: np.ndarray, low: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the ``(+DM, -DM)`` arrays of Wilder's directional movement."""
+
+    up_move = np.empty_like(high)
+    down_move = np.empty_like(low)
+    up_move[:1] = np.nan
+    down_move[:1] = np.nan
+    np.subtract(high[1:], high[:-1], out=up_move[1:])
+    np.subtract(low[:-1], low[1:], out=down_move[1:])
+    plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+    return plus_dm, minus_dm
+
+
+def _rolling_mean(data: pd.Series, window: int, min_periods: int) -> pd.Series:
+    if _kernels.NUMBA_AVAILABLE:
+        values = _kernels.rolling_mean(_values(data), window, min_periods)
+        return pd.Series(values, index=data.index, name=data.name)
+    return data.rolling(window=window, min_periods=min_periods).mean()
+
+
+def _true_range(high: pd.Series, low: pd.Series, close: pd.Series) -> pd.Series:
+    high_v = _values(high)
+    low_v = _values(low)
+    prev_close = np.empty_like(high_v)
+    prev_close[:1] = np.nan
+    prev_close[1:] = _values(close)[:-1]
+    # np.maximum propagates NaN like ``max(axis=1, skipna=False)``.
+    ranges = np.maximum(np.maximum(high_v - low_v, np.abs(high_v - prev_close)), np.abs(low_v - prev_close))
+    return pd.Series(ranges, index=high.index)
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """``numerator / denominator`` with NaN wherever the denominator is zero."""
+
+    out = np.full(numerator.shape, np.nan)
+    return np.divide(numerator, denominator, out=out, where=denominator != 0)
+
+
+def _span_com(span: int) -> float:
+    return (span - 1) / 2
+
+
+def _alpha_com(alpha: float) -> float:
+    return (1 - alpha) / alpha
+
+
+def sma(series: Iterable[float] | pd.Series, window: int, *, min_periods: int | None = None) -> pd.Series:
+    """Simple moving average."""
+
+    if window <= 0:
+        raise ValueError("window must be positive")
+
+    data = _as_series(series)
+    min_periods = min_periods if min_periods is not None else window
+    if not 0 <= min_periods <= window:
+        raise ValueError(f"min_periods {min_periods} must be between 0 and window {window}")
+    return _rolling_mean(data, window, min_periods)
+
+
+def ema(series: Iterable[float] | pd.Series, span: int) -> pd.Series:
+    """Exponential moving average using an EMA span."""
+
+    if span <= 0:
+        raise ValueError("span must be positive")
+
+    data = _as_series(series)
+    return _ewm_mean(data, com=_span_com(span))
+
+
+def rsi(series: Iterable[float] | pd.Series, window: int = 14) -> pd.Series:
+    """Relative Strength Index (0-100)."""
+
+    if window <= 0:
+        raise ValueError("window must be positive")
+
+    data = _as_series(series)
+    if _kernels.NUMBA_AVAILABLE:
+        values = _kernels.rsi_wilder(_values(data), window)
+        return pd.Series(values, index=data.index, name=data.name)
+    return _rsi_pandas(data, window)
+
+
+def _rsi_pandas(data: pd.Series, window: int) -> pd.Series:
+    delta = np.diff(_values(data), prepend=np.nan)
+    gains = pd.Series(np.clip(delta, 0, None), index=data.index)
+    losses = pd.Series(-np.clip(delta, None, 0), index=data.index)
+
+    # The smoothing stays on pandas; the rest is elementwise on the arrays.
+    avg_gain = _values(gains.ewm(alpha=1 / window, adjust=False, min_periods=window).mean())
+    avg_loss = _values(losses.ewm(alpha=1 / window, adjust=False, min_periods=window).mean())
+
+    rs = _safe_divide(avg_gain, avg_loss)
+    rsi_values = 100 - (100 / (1 + rs))
+
+    gain_zero = avg_gain <= 1e-12
+    loss_zero = avg_loss <= 1e-12
+    rsi_values[loss_zero & ~gain_zero] = 100
+    rsi_values[gain_zero & ~loss_zero] = 0
+    rsi_values[gain_zero & loss_zero] = 50
+    rsi_values[np.isnan(rsi_values)] = 50
+    return pd.Series(rsi_values, index=data.index, name=data.name)
+
+
+def macd(series: Iterable[float] | pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> pd.DataFrame:
+    """Moving Average Convergence Divergence indicator."""
+
+    if fast <= 0 or slow <= 0 or signal <= 0:
+        raise ValueError("MACD periods must be positive")
+    if fast >= slow:
+        raise ValueError("fast period must be less than slow period")
+
+    data = _as_series(series)
+    macd_line = _values(ema(data, fast)) - _values(ema(data, slow))
+    signal_line = _values(_ewm_mean(pd.Series(macd_line, index=data.index), com=_span_com(signal)))
+    histogram = macd_line - signal_line
+    return pd.DataFrame({"macd": macd_line, "signal": signal_line, "hist": histogram}, index=data.index)
+
+
+def atr(
+    high: Iterable[float] | pd.Series,
+    low: Iterable[float] | pd.Series,
+    close: Iterable[float] | pd.Series,
+    window: int = 14,
+) -> pd.Series:
+    """Average True Range (Wilder smoothing)."""
+
+    if window <= 0:
+        raise ValueError("window must be positive")
+
+    high_s = _as_series(high)
+    low_s = _as_series(low)
+    close_s = _as_series(close)
+
+    if _kernels.NUMBA_AVAILABLE:
+        values = _kernels.atr_wilder(_values(high_s), _values(low_s), _values(close_s), window)
+        return pd.Series(values, index=high_s.index)
+    true_range = _true_range(high_s, low_s, close_s)
+    return _ewm_mean(true_range, com=_alpha_com(1 / window), min_periods=window)
+
+
+def bollinger(
+    series: Iterable[float] | pd.Series,
+    window: int = 20,
+    num_std: float = 2.0,
+) -> pd.DataFrame:
+    """Bollinger Bands (mid, upper, lower, width)."""
+
+    if window <= 0:
+        raise ValueError("window must be positive")
+    if num_std <= 0:
+        raise ValueError("num_std must be positive")
+
+    data = _as_series(series)
+    if _kernels.NUMBA_AVAILABLE:
+        bands = _kernels.bollinger_bands(_values(data), window, num_std)
+        return pd.DataFrame(
+            {"mid": bands[0], "upper": bands[1], "lower": bands[2], "width": bands[3]},
+            index=data.index,
+        )
+    mid = sma(data, window)
+    std = data.rolling(window=window, min_periods=window).std(ddof=0)
+    upper = mid + num_std * std
+    lower = mid - num_std * std
+    width = upper - lower
+    return pd.DataFrame({"mid": mid, "upper": upper, "lower": lower, "width": width})
+
+
+def stoch(
+    high: Iterable[float] | pd.Series,
+    low: Iterable[float] | pd.Series,
+    close: Iterable[float] | pd.Series,
+    k_window: int = 14,
+    d_window: int = 3,
+    smooth_k: int = 3,
+) -> pd.DataFrame:
+    """Stochastic Oscillator (percent K/D)."""
+
+    if min(k_window, d_window, smooth_k) <= 0:
+        raise ValueError("windows must be positive")
+
+    high_s = _as_series(high)
+    low_s = _as_series(low)
+    close_s = _as_series(close)
+
+    lowest_low = rolling_min(low_s, k_window)
+    highest_high = rolling_max(high_s, k_window)
+    if close_s.index.equals(low_s.index) and close_s.index.equals(high_s.index):
+        lowest = _values(lowest_low)
+        ratio = _safe_divide(_values(close_s) - lowest, _values(highest_high) - lowest)
+        percent_k = pd.Series(ratio * 100, index=close_s.index)
+    else:
+        denom = (highest_high - lowest_low).replace(0, np.nan)
+        percent_k = ((close_s - lowest_low) / denom) * 100
+    percent_k = _rolling_mean(percent_k, smooth_k, smooth_k)
+    percent_d = _rolling_mean(percent_k, d_window, d_window)
+    return pd.DataFrame({"%K": percent_k.fillna(0), "%D": percent_d.fillna(0)})
+
+
+def adx(
+    high: Iterable[float] | pd.Series,
+    low: Iterable[float] | pd.Series,
+    close: Iterable[float] | pd.Series,
+    window: int = 14,
+) -> pd.Series:
+    """Average Directional Index."""
+
+    if window <= 0:
+        raise ValueError("window must be positive")
+
+    high_s = _as_series(high)
+    low_s = _as_series(low)
+    close_s = _as_series(close)
+
+    if high_s.index.equals(low_s.index):
+        plus_dm, minus_dm = _directional_moves(_values(high_s), _values(low_s))
+    else:
+        up_move = high_s.diff()
+        down_move = low_s.shift(1) - low_s
+        plus_dm = _values(up_move.where((up_move > down_move) & (up_move > 0), 0.0).reindex(high_s.index))
+        minus_dm = _values(down_move.where((down_move > up_move) & (down_move > 0), 0.0).reindex(high_s.index))
+
+    # The true range smoothing is exactly :func:`atr`, fused when compiled.
+    wilder_com = _alpha_com(1 / window)
+    atr_values = _values(atr(high_s, low_s, close_s, window))
+    plus_smoothed = _ewm_values(plus_dm, com=wilder_com, min_periods=window)
+    minus_smoothed = _ewm_values(minus_dm, com=wilder_com, min_periods=window)
+
+    plus_di = _safe_divide(100 * plus_smoothed, atr_values)
+    minus_di = _safe_divide(100 * minus_smoothed, atr_values)
+    dx = _safe_divide(np.abs(plus_di - minus_di), plus_di + minus_di) * 100
+    result = _ewm_values(dx, com=wilder_com, min_periods=window)
+    result[np.isnan(result)] = 0
+    return pd.Series(result, index=high_s.index)
+
+
+def obv(close: Iterable[float] | pd.Series, volume: Iterable[float] | pd.Series) -> pd.Series:
+    """On-Balance Volume."""
+
+    close_s = _as_series(close)
+    volume_s = _as_series(volume)
+    if not close_s.index.equals(volume_s.index):
+        direction = np.sign(close_s.diff().fillna(0))
+        return (direction * volume_s).cumsum().fillna(0)
+
+    step = np.diff(_values(close_s), prepend=np.nan)
+    # Comparisons against NaN are False, so missing steps count as flat.
+    direction = (step > 0).astype(np.float64) - (step < 0)
+    obv_delta = direction * _values(volume_s)
+    missing = np.isnan(obv_delta)
+    running = np.cumsum(np.where(missing, 0.0, obv_delta))
+    running[missing] = 0.0
+    name = close_s.name if close_s.name == volume_s.name else None
+    return pd.Series(running, index=close_s.index, name=name)
+
+
+def vol_ma(volume: Iterable[float] | pd.Series, window: int = 20) -> pd.Series:
+    """Moving average of traded volume."""
+
+    if window <= 0:
+        raise ValueError("window must be positive")
+
+    volume_s = _as_series(volume)
+    return _rolling_mean(volume_s, window, window)
+
+
+def keltner_channels(
+    high: Iterable[float] | pd.Series,
+    low: Iterable[float] | pd.Series,
+    close: Iterable[float] | pd.Series,
+    window: int = 20,
+    atr_window: int = 10,
+    multiplier: float = 2.0,
+) -> pd.DataFrame:
+    """Keltner Channels based on EMA midline and ATR bands."""
+
+    if min(window, atr_window) <= 0:
+        raise ValueError("windows must be positive")
+    if multiplier <= 0:
+        raise ValueError("multiplier must be positive")
+
+    high_s = _as_series(high)
+    close_s = _as_series(close)
+    if _kernels.NUMBA_AVAILABLE and close_s.index.equals(high_s.index):
+        low_s = _as_series(low)
+        bands = _kernels.keltner_bands(
+            _values(high_s), _values(low_s), _values(close_s), _span_com(window), atr_window, float(multiplier)
+        )
+        return pd.DataFrame({"mid": bands[0], "upper": bands[1], "lower": bands[2]}, index=close_s.index)
+    mid = ema(close_s, window)
+    atr_values = atr(high_s, low, close_s, atr_window)
+    if not close_s.index.equals(high_s.index):
+        upper = mid + multiplier * atr_values
+        lower = mid - multiplier * atr_values
+        return pd.DataFrame({"mid": mid, "upper": upper, "lower": lower})
+    mid_v = _values(mid)
+    band = multiplier * _values(atr_values)
+    return pd.DataFrame({"mid": mid_v, "upper": mid_v + band, "lower": mid_v - band}, index=close_s.index)
+
+
+def rolling_max(series: Iterable[float] | pd.Series, window: int) -> pd.Series:
+    """Highest value of each full *window*; NaN while any value in it is missing."""
+
+    if window <= 0:
+        raise ValueError("window must be positive")
+
+    data = _as_series(series)
+    if _kernels.NUMBA_AVAILABLE:
+        return pd.Series(_kernels.rolling_max(_values(data), window), index=data.index, name=data.name)
+    return data.rolling(window=window, min_periods=window).max()
+
+
+def rolling_min(series: Iterable[float] | pd.Series, window: int) -> pd.Series:
+    """Lowest value of each full *window*; NaN while any value in it is missing."""
+
+    if window <= 0:
+        raise ValueError("window must be positive")
+
+    data = _as_series(series)
+    if _kernels.NUMBA_AVAILABLE:
+        return pd.Series(_kernels.rolling_min(_values(data), window), index=data.index, name=data.name)
+    return data.rolling(window=window, min_periods=window).min()
+
+
+def _check_count(count: int) -> None:
+    if count <= 0:
+        raise ValueError("count must be positive")
+
+
+def rsi_tail(series: Iterable[float] | pd.Series, window: int = 14, count: int = 3) -> np.ndarray:
+    """Last *count* values of :func:`rsi` without materialising the full series."""
+
+    if window <= 0:
+        raise ValueError("window must be positive")
+    _check_count(count)
+
+    data = _as_series(series)
+    if _kernels.NUMBA_AVAILABLE:
+        return _kernels.rsi_tail(_values(data), window, count)
+    values = indicator_cache.get_or_compute(
+        "rsi", (_values(data),), (window,), lambda: rsi(data, window).to_numpy()
+    )
+    return values[-count:].copy()
+
+
+def sma_tail(series: Iterable[float] | pd.Series, window: int, count: int = 2) -> np.ndarray:
+    """Last *count* values of :func:`sma` over full windows."""
+
+    if window <= 0:
+        raise ValueError("window must be positive")
+    _check_count(count)
+
+    data = _as_series(series)
+    if _kernels.NUMBA_AVAILABLE:
+        return _kernels.sma_tail(_values(data), window, count)
+    values = indicator_cache.get_or_compute(
+        "sma", (_values(data),), (window,), lambda: sma(data, window).to_numpy()
+    )
+    return values[-count:].copy()
+
+
+def bollinger_tail(
+    series: Iterable[float] | pd.Series,
+    window: int = 20,
+    num_std: float = 2.0,
+    count: int = 2,
+) -> np.ndarray:
+    """Last *count* rows of :func:`bollinger` as a ``(4, count)`` array.
+
+    Rows are ``mid, upper, lower, width``.
+    """
+
+    if window <= 0:
+        raise ValueError("window must be positive")
+    if num_std <= 0:
+        raise ValueError("num_std must be positive")
+    _check_count(count)
+
+    data = _as_series(series)
+    if _kernels.NUMBA_AVAILABLE:
+        return _kernels.bollinger_tail(_values(data), window, num_std, count)
+    bands = indicator_cache.get_or_compute(
+        "bollinger",
+        (_values(data),),
+        (window, num_std),
+        lambda: bollinger(data, window, num_std)[["mid", "upper", "lower", "width"]].to_numpy(),
+    )
+    return bands[-count:].T.copy()
+
+
+def stoch_tail(
+    high: Iterable[float] | pd.Series,
+    low: Iterable[float] | pd.Series,
+    close: Iterable[float] | pd.Series,
+    k_window: int = 14,
+    d_window: int = 3,
+    smooth_k: int = 3,
+    count: int = 2,
+) -> np.ndarray:
+    """Last *count* rows of :func:`stoch` as a ``(2, count)`` array of %K, %D.
+
+    The inputs must be positionally aligned.
+    """
+
+    if min(k_window, d_window, smooth_k) <= 0:
+        raise ValueError("windows must be positive")
+    _check_count(count)
+
+    high_s = _as_series(high)
+    low_s = _as_series(low)
+    close_s = _as_series(close)
+    if _kernels.NUMBA_AVAILABLE:
+        return _kernels.stoch_tail(
+            _values(high_s), _values(low_s), _values(close_s), k_window, d_window, smooth_k, count
+        )
+
+    def compute() -> np.ndarray:
+        return stoch(high_s, low_s, close_s, k_window, d_window, smooth_k)[["%K", "%D"]].to_numpy()
+
+    # Misaligned inputs are combined by label, which the value digest cannot see.
+    if not (close_s.index.equals(high_s.index) and close_s.index.equals(low_s.index)):
+        return compute()[-count:].T
+    frame = indicator_cache.get_or_compute(
+        "stoch", (_values(high_s), _values(low_s), _values(close_s)), (k_window, d_window, smooth_k), compute
+    )
+    return frame[-count:].T.copy()
+
+
+# Opt-in so test runs and tools that never touch the kernels do not pay for
+# loading them.
+if os.environ.get("RECTIFEX_JIT_WARMUP") == "1":
+    _kernels.warmup()
@@ -0,0 +1,828 @@
+"""Optional Numba kernels backing :mod:`core.indicators`.
+
+Every kernel repeats the floating point operations of the pandas expression
+it replaces, in the same order, so results match the pandas path exactly.
+``fastmath`` is deliberately not enabled because it would reorder those
+operations and change NaN handling. Without Numba the functions remain plain
+Python; :mod:`core.indicators` then keeps its pandas implementations and
+only the tests call the kernels directly.
+
+The running statistics are written as small step functions over tuples of
+state so the full-series kernels and the ``*_tail`` bundles, which only
+keep the last values a scan reads, share one implementation.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Callable, TypeVar
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+__all__ = [
+    "NUMBA_AVAILABLE",
+    "atr_wilder",
+    "bollinger_bands",
+    "bollinger_tail",
+    "ewm_mean",
+    "keltner_bands",
+    "range_tail",
+    "rolling_max",
+    "rolling_mean",
+    "rolling_min",
+    "rsi_tail",
+    "rsi_wilder",
+    "sma_tail",
+    "squeeze_tail",
+    "stoch_tail",
+    "trend_commit",
+    "trend_peek",
+    "trend_state",
+    "trend_tail",
+    "warmup",
+]
+
+NUMBA_AVAILABLE = njit is not None
+
+_F = TypeVar("_F", bound=Callable)
+
+
+def _jit(func: _F) -> _F:
+    if njit is None:
+        return func
+    return njit(cache=True, nogil=True)(func)  # type: ignore[return-value]
+
+
+# ----------------------------------------------------------------------
+# ewm(adjust=False, ignore_na=False)
+# ----------------------------------------------------------------------
+@_jit
+def _ewm_alpha(alpha: float) -> float:
+    # pandas converts alpha to a centre of mass and back before smoothing.
+    com = (1.0 - alpha) / alpha
+    return 1.0 / (1.0 + com)
+
+
+@_jit
+def _ewm_step(weighted: float, weight: float, current: float, alpha: float, factor: float):
+    # Weights decay across gaps and a value equal to the running mean leaves
+    # it untouched. The first observation seeds the average.
+    if weighted == weighted:
+        weight *= factor
+        if current == current:
+            if weighted != current:
+                weighted = (weight * weighted + alpha * current) / (weight + alpha)
+            weight = 1.0
+    elif current == current:
+        weighted = current
+    return weighted, weight
+
+
+# ----------------------------------------------------------------------
+# rolling(...).mean() after pandas' roll_mean
+# ----------------------------------------------------------------------
+@_jit
+def _mean_state(first: float):
+    # total, add compensation, remove compensation, nobs, negatives,
+    # identical-value run, previous value
+    return 0.0, 0.0, 0.0, 0, 0, 0, first
+
+
+@_jit
+def _mean_add(state, value: float):
+    total, add_comp, remove_comp, nobs, neg_ct, same_run, prev_value = state
+    if value == value:
+        nobs += 1
+        y = value - add_comp
+        t = total + y
+        add_comp = t - total - y
+        total = t
+        if math.copysign(1.0, value) < 0.0:
+            neg_ct += 1
+        if value == prev_value:
+            same_run += 1
+        else:
+            same_run = 1
+        prev_value = value
+    return total, add_comp, remove_comp, nobs, neg_ct, same_run, prev_value
+
+
+@_jit
+def _mean_remove(state, value: float):
+    total, add_comp, remove_comp, nobs, neg_ct, same_run, prev_value = state
+    if value == value:
+        nobs -= 1
+        y = -value - remove_comp
+        t = total + y
+        remove_comp = t - total - y
+        total = t
+        if math.copysign(1.0, value) < 0.0:
+            neg_ct -= 1
+    return total, add_comp, remove_comp, nobs, neg_ct, same_run, prev_value
+
+
+@_jit
+def _mean_value(state, min_periods: int) -> float:
+    total, _add_comp, _remove_comp, nobs, neg_ct, same_run, prev_value = state
+    if nobs < min_periods or nobs == 0:
+        return np.nan
+    if same_run >= nobs:
+        return prev_value
+    result = total / nobs
+    if neg_ct == 0 and result < 0.0:
+        return 0.0
+    if neg_ct == nobs and result > 0.0:
+        return 0.0
+    return result
+
+
+@_jit
+def _mean_slide(state, values: np.ndarray, i: int, window: int):
+    if i >= window:
+        state = _mean_remove(state, values[i - window])
+    return _mean_add(state, values[i])
+
+
+# ----------------------------------------------------------------------
+# rolling(...).var(ddof=0) after pandas' roll_var
+# ----------------------------------------------------------------------
+@_jit
+def _var_add(state, value: float, nobs: int):
+    # *nobs* already counts *value*; NaN values never reach this function.
+    mean_x, ssqdm_x, add_comp, remove_comp = state
+    prev_mean = mean_x - add_comp
+    y = value - add_comp
+    t = y - mean_x
+    add_comp = t + mean_x - y
+    mean_x = mean_x + t / nobs
+    ssqdm_x = ssqdm_x + (value - prev_mean) * (value - mean_x)
+    return mean_x, ssqdm_x, add_comp, remove_comp
+
+
+@_jit
+def _var_remove(state, value: float, nobs: int):
+    # *nobs* already excludes *value*; NaN values never reach this function.
+    mean_x, ssqdm_x, add_comp, remove_comp = state
+    if nobs == 0:
+        return 0.0, 0.0, add_comp, remove_comp
+    prev_mean = mean_x - remove_comp
+    y = value - remove_comp
+    t = y - mean_x
+    remove_comp = t + mean_x - y
+    mean_x = mean_x - t / nobs
+    ssqdm_x = ssqdm_x - (value - prev_mean) * (value - mean_x)
+    return mean_x, ssqdm_x, add_comp, remove_comp
+
+
+# ----------------------------------------------------------------------
+# Wilder RSI over close.diff()
+# ----------------------------------------------------------------------
+@_jit
+def _rsi_state():
+    # average gain, gain weight, average loss, loss weight, nobs, previous close
+    return np.nan, 1.0, np.nan, 1.0, 0, np.nan
+
+
+@_jit
+def _rsi_step(state, current: float, alpha: float, factor: float):
+    avg_gain, gain_wt, avg_loss, loss_wt, nobs, previous = state
+    delta = current - previous
+    if delta == delta:
+        gain = delta if delta > 0.0 else 0.0
+        loss = -(delta if delta < 0.0 else 0.0)
+        nobs += 1
+    else:
+        gain = np.nan
+        loss = np.nan
+    avg_gain, gain_wt = _ewm_step(avg_gain, gain_wt, gain, alpha, factor)
+    avg_loss, loss_wt = _ewm_step(avg_loss, loss_wt, loss, alpha, factor)
+    return avg_gain, gain_wt, avg_loss, loss_wt, nobs, current
+
+
+@_jit
+def _rsi_value(state, window: int) -> float:
+    avg_gain, _gain_wt, avg_loss, _loss_wt, nobs, _previous = state
+    if nobs < window:
+        return 50.0
+    gain_zero = avg_gain <= 1e-12
+    loss_zero = avg_loss <= 1e-12
+    if gain_zero and loss_zero:
+        return 50.0
+    if loss_zero:
+        return 100.0
+    if gain_zero:
+        return 0.0
+    value = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return value if value == value else 50.0
+
+
+# ----------------------------------------------------------------------
+# Full-series kernels
+# ----------------------------------------------------------------------
+@_jit
+def ewm_mean(values: np.ndarray, com: float, min_periods: int) -> np.ndarray:
+    """``Series.ewm(com=com, adjust=False, min_periods=...).mean()``.
+
+    *min_periods* must already be clamped to at least one, as pandas does.
+    """
+
+    n = values.shape[0]
+    out = np.empty(n)
+    alpha = 1.0 / (1.0 + com)
+    factor = 1.0 - alpha
+
+    weighted = np.nan
+    weight = 1.0
+    nobs = 0
+    for i in range(n):
+        current = values[i]
+        if current == current:
+            nobs += 1
+        weighted, weight = _ewm_step(weighted, weight, current, alpha, factor)
+        out[i] = weighted if nobs >= min_periods else np.nan
+    return out
+
+
+@_jit
+def _true_range(high: float, low: float, previous: float) -> float:
+    # max(axis=1, skipna=False): any missing leg makes the range missing.
+    span = high - low
+    up = abs(high - previous)
+    down = abs(low - previous)
+    if span == span and up == up and down == down:
+        return max(span, up, down)
+    return np.nan
+
+
+@_jit
+def atr_wilder(high: np.ndarray, low: np.ndarray, close: np.ndarray, window: int) -> np.ndarray:
+    """True range and its Wilder average in one pass, matching ``core.indicators.atr``."""
+
+    n = close.shape[0]
+    out = np.empty(n)
+    alpha = _ewm_alpha(1.0 / window)
+    factor = 1.0 - alpha
+
+    average = np.nan
+    weight = 1.0
+    nobs = 0
+    previous = np.nan
+    for i in range(n):
+        current = _true_range(high[i], low[i], previous)
+        previous = close[i]
+        if current == current:
+            nobs += 1
+        average, weight = _ewm_step(average, weight, current, alpha, factor)
+        out[i] = average if nobs >= window else np.nan
+    return out
+
+
+@_jit
+def keltner_bands(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    com: float,
+    atr_window: int,
+    multiplier: float,
+) -> np.ndarray:
+    """``core.indicators.keltner_channels`` as ``[mid, upper, lower]`` rows.
+
+    The EMA midline (centre of mass *com*) and the ATR are advanced in the
+    same loop instead of two passes over the bars.
+    """
+
+    n = close.shape[0]
+    out = np.empty((3, n))
+    mid_alpha = 1.0 / (1.0 + com)
+    mid_factor = 1.0 - mid_alpha
+    atr_alpha = _ewm_alpha(1.0 / atr_window)
+    atr_factor = 1.0 - atr_alpha
+
+    mid = np.nan
+    mid_weight = 1.0
+    average = np.nan
+    weight = 1.0
+    nobs = 0
+    previous = np.nan
+    for i in range(n):
+        # The midline has min_periods=1, so it is NaN exactly until the
+        # first observed close.
+        mid, mid_weight = _ewm_step(mid, mid_weight, close[i], mid_alpha, mid_factor)
+        current = _true_range(high[i], low[i], previous)
+        previous = close[i]
+        if current == current:
+            nobs += 1
+        average, weight = _ewm_step(average, weight, current, atr_alpha, atr_factor)
+        band = multiplier * (average if nobs >= atr_window else np.nan)
+        out[0, i] = mid
+        out[1, i] = mid + band
+        out[2, i] = mid - band
+    return out
+
+
+@_jit
+def _extreme_step(ring: np.ndarray, head: int, size: int, last_nan: int, values: np.ndarray, i: int, maximum: bool):
+    # Monotonic deque of indices kept in *ring*, one slot per window position:
+    # every sample is pushed and popped at most once. Like ``rolling(window,
+    # min_periods=window)``, any NaN inside the window makes the value NaN.
+    window = ring.shape[0]
+    current = values[i]
+    if current != current:
+        last_nan = i
+    else:
+        while size > 0:
+            back = ring[(head + size - 1) % window]
+            if (values[back] <= current) if maximum else (values[back] >= current):
+                size -= 1
+            else:
+                break
+        if size == window:
+            head = (head + 1) % window
+            size -= 1
+        ring[(head + size) % window] = i
+        size += 1
+    if size > 0 and ring[head] <= i - window:
+        head = (head + 1) % window
+        size -= 1
+    if i - last_nan < window or i < window - 1:
+        value = np.nan
+    else:
+        value = values[ring[head]]
+    return head, size, last_nan, value
+
+
+@_jit
+def _rolling_extreme(values: np.ndarray, window: int, maximum: bool) -> np.ndarray:
+    n = values.shape[0]
+    out = np.empty(n)
+    ring = np.empty(window, dtype=np.int64)
+    head = 0
+    size = 0
+    last_nan = -window
+    for i in range(n):
+        head, size, last_nan, out[i] = _extreme_step(ring, head, size, last_nan, values, i, maximum)
+    return out
+
+
+@_jit
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """``rolling(window, min_periods=window).max()`` in a single pass."""
+
+    return _rolling_extreme(values, window, True)
+
+
+@_jit
+def rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    """``rolling(window, min_periods=window).min()`` in a single pass."""
+
+    return _rolling_extreme(values, window, False)
+
+
+@_jit
+def rolling_mean(values: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """``rolling(window, min_periods).mean()`` as one add/remove pass.
+
+    Follows pandas' ``roll_mean``: Kahan-compensated running sums for the
+    values entering and leaving the window, a run of identical values
+    returned verbatim and sign clamping for all-positive or all-negative
+    windows.
+    """
+
+    n = values.shape[0]
+    out = np.empty(n)
+    state = _mean_state(values[0] if n else np.nan)
+    for i in range(n):
+        state = _mean_slide(state, values, i, window)
+        out[i] = _mean_value(state, min_periods)
+    return out
+
+
+@_jit
+def _bollinger_step(mean, var, values: np.ndarray, i: int, window: int):
+    if i >= window:
+        leaving = values[i - window]
+        mean = _mean_remove(mean, leaving)
+        if leaving == leaving:
+            var = _var_remove(var, leaving, mean[3])
+    current = values[i]
+    mean = _mean_add(mean, current)
+    if current == current:
+        var = _var_add(var, current, mean[3])
+    return mean, var
+
+
+@_jit
+def _bollinger_value(mean, var, window: int, num_std: float):
+    nobs = mean[3]
+    if nobs < window or nobs == 0:
+        return np.nan, np.nan, np.nan, np.nan
+    mid = _mean_value(mean, window)
+    # roll_var reports zero for a single value or a run of identical ones.
+    variance = 0.0 if nobs == 1 or mean[5] >= nobs else var[1] / nobs
+    std = math.sqrt(variance) if variance >= 0.0 else 0.0
+    upper = mid + num_std * std
+    lower = mid - num_std * std
+    return mid, upper, lower, upper - lower
+
+
+@_jit
+def bollinger_bands(values: np.ndarray, window: int, num_std: float) -> np.ndarray:
+    """Rows ``mid, upper, lower, width`` matching ``core.indicators.bollinger``.
+
+    The midline repeats :func:`rolling_mean`. The deviation follows pandas'
+    ``roll_var``, a Welford update with Kahan compensation and ``ddof=0``.
+    Both share the same walk over the window.
+    """
+
+    n = values.shape[0]
+    out = np.empty((4, n))
+    mean = _mean_state(values[0] if n else np.nan)
+    var = (0.0, 0.0, 0.0, 0.0)
+    for i in range(n):
+        mean, var = _bollinger_step(mean, var, values, i, window)
+        out[0, i], out[1, i], out[2, i], out[3, i] = _bollinger_value(mean, var, window, num_std)
+    return out
+
+
+@_jit
+def rsi_wilder(close: np.ndarray, window: int) -> np.ndarray:
+    """Wilder RSI matching ``core.indicators.rsi`` value for value.
+
+    Equivalent to ``ewm(alpha=1/window, adjust=False, min_periods=window)``
+    over the clipped gains and losses of ``close.diff()``, followed by the
+    flat-market masks and ``fillna(50)``.
+    """
+
+    n = close.shape[0]
+    out = np.empty(n)
+    alpha = _ewm_alpha(1.0 / window)
+    factor = 1.0 - alpha
+    state = _rsi_state()
+    for i in range(n):
+        state = _rsi_step(state, close[i], alpha, factor)
+        out[i] = _rsi_value(state, window)
+    return out
+
+
+# ----------------------------------------------------------------------
+# Tail bundles: several indicators in one walk, last values only
+# ----------------------------------------------------------------------
+@_jit
+def trend_tail(close: np.ndarray, fast: int, slow: int, rsi_window: int) -> np.ndarray:
+    """``[fast[-2], fast[-1], slow[-2], slow[-1], rsi[-1]]`` in one pass.
+
+    *fast* and *slow* are full-window SMAs as in ``core.indicators.sma``;
+    the RSI matches :func:`rsi_wilder`. Missing positions are NaN.
+    """
+
+    n = close.shape[0]
+    out = np.full(5, np.nan)
+    alpha = _ewm_alpha(1.0 / rsi_window)
+    factor = 1.0 - alpha
+    first = close[0] if n else np.nan
+    fast_state = _mean_state(first)
+    slow_state = _mean_state(first)
+    rsi_state = _rsi_state()
+    for i in range(n):
+        fast_state = _mean_slide(fast_state, close, i, fast)
+        slow_state = _mean_slide(slow_state, close, i, slow)
+        rsi_state = _rsi_step(rsi_state, close[i], alpha, factor)
+        if i == n - 2:
+            out[0] = _mean_value(fast_state, fast)
+            out[2] = _mean_value(slow_state, slow)
+    if n:
+        out[1] = _mean_value(fast_state, fast)
+        out[3] = _mean_value(slow_state, slow)
+        out[4] = _rsi_value(rsi_state, rsi_window)
+    return out
+
+
+@_jit
+def trend_state(first: float):
+    """Initial state of :func:`trend_commit` for a series starting at *first*."""
+
+    return _mean_state(first), _mean_state(first), _rsi_state()
+
+
+@_jit
+def _trend_step(state, ring: np.ndarray, count: int, current: float, fast: int, slow: int, alpha: float, factor: float):
+    # *ring* holds the last ``ring.shape[0]`` consumed closes, the close of
+    # bar ``i`` at ``i % size``; it is only read here.
+    size = ring.shape[0]
+    fast_state, slow_state, rsi_state = state
+    if count >= fast:
+        fast_state = _mean_remove(fast_state, ring[(count - fast) % size])
+    if count >= slow:
+        slow_state = _mean_remove(slow_state, ring[(count - slow) % size])
+    fast_state = _mean_add(fast_state, current)
+    slow_state = _mean_add(slow_state, current)
+    rsi_state = _rsi_step(rsi_state, current, alpha, factor)
+    return fast_state, slow_state, rsi_state
+
+
+@_jit
+def trend_commit(
+    close: np.ndarray,
+    start: int,
+    ring: np.ndarray,
+    count: int,
+    state,
+    fast: int,
+    slow: int,
+    rsi_window: int,
+):
+    """Advance :func:`trend_tail`'s running state over ``close[start:]``.
+
+    *count* bars have been consumed so far and *ring*, at least
+    ``max(fast, slow)`` long, holds the most recent of them; it is updated in
+    place. Returns the new count and state.
+    """
+
+    size = ring.shape[0]
+    alpha = _ewm_alpha(1.0 / rsi_window)
+    factor = 1.0 - alpha
+    for i in range(start, close.shape[0]):
+        current = close[i]
+        state = _trend_step(state, ring, count, current, fast, slow, alpha, factor)
+        ring[count % size] = current
+        count += 1
+    return count, state
+
+
+@_jit
+def trend_peek(current: float, ring: np.ndarray, count: int, state, fast: int, slow: int, rsi_window: int) -> np.ndarray:
+    """:func:`trend_tail` of the committed bars followed by *current*.
+
+    The state and *ring* are left as they are, so a revised last bar can be
+    peeked again.
+    """
+
+    alpha = _ewm_alpha(1.0 / rsi_window)
+    factor = 1.0 - alpha
+    out = np.empty(5)
+    out[0] = _mean_value(state[0], fast)
+    out[2] = _mean_value(state[1], slow)
+    fast_state, slow_state, rsi_state = _trend_step(state, ring, count, current, fast, slow, alpha, factor)
+    out[1] = _mean_value(fast_state, fast)
+    out[3] = _mean_value(slow_state, slow)
+    out[4] = _rsi_value(rsi_state, rsi_window)
+    return out
+
+
+@_jit
+def range_tail(
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    volume: np.ndarray,
+    range_window: int,
+    volume_window: int,
+    rsi_window: int,
+) -> np.ndarray:
+    """``[range_high, range_low, volume_ma, rsi]`` at the last bar in one pass.
+
+    The range values match ``rolling_max``/``rolling_min`` over *high* and
+    *low*, the volume average ``rolling_mean`` over *volume* and the RSI
+    :func:`rsi_wilder` over *close*. All inputs share one length.
+    """
+
+    n = close.shape[0]
+    out = np.full(4, np.nan)
+    alpha = _ewm_alpha(1.0 / rsi_window)
+    factor = 1.0 - alpha
+    volume_state = _mean_state(volume[0] if n else np.nan)
+    rsi_state = _rsi_state()
+    # rolling_max/min need a full window without NaN, checked per side.
+    range_high = -np.inf if n >= range_window else np.nan
+    range_low = np.inf if n >= range_window else np.nan
+    for i in range(n):
+        volume_state = _mean_slide(volume_state, volume, i, volume_window)
+        rsi_state = _rsi_step(rsi_state, close[i], alpha, factor)
+        if i >= n - range_window:
+            if high[i] != high[i]:
+                range_high = np.nan
+            elif high[i] > range_high:
+                range_high = high[i]
+            if low[i] != low[i]:
+                range_low = np.nan
+            elif low[i] < range_low:
+                range_low = low[i]
+    if n:
+        out[0] = range_high
+        out[1] = range_low
+        out[2] = _mean_value(volume_state, volume_window)
+        out[3] = _rsi_value(rsi_state, rsi_window)
+    return out
+
+
+@_jit
+def rsi_tail(close: np.ndarray, window: int, count: int) -> np.ndarray:
+    """Last *count* values of :func:`rsi_wilder` (fewer for short inputs)."""
+
+    n = close.shape[0]
+    keep = min(count, n)
+    out = np.empty(keep)
+    alpha = _ewm_alpha(1.0 / window)
+    factor = 1.0 - alpha
+    state = _rsi_state()
+    for i in range(n):
+        state = _rsi_step(state, close[i], alpha, factor)
+        if i >= n - keep:
+            out[i - (n - keep)] = _rsi_value(state, window)
+    return out
+
+
+@_jit
+def sma_tail(values: np.ndarray, window: int, count: int) -> np.ndarray:
+    """Last *count* values of ``rolling_mean(values, window, window)``."""
+
+    n = values.shape[0]
+    keep = min(count, n)
+    out = np.empty(keep)
+    state = _mean_state(values[0] if n else np.nan)
+    for i in range(n):
+        state = _mean_slide(state, values, i, window)
+        if i >= n - keep:
+            out[i - (n - keep)] = _mean_value(state, window)
+    return out
+
+
+@_jit
+def bollinger_tail(values: np.ndarray, window: int, num_std: float, count: int) -> np.ndarray:
+    """Last *count* columns of :func:`bollinger_bands`."""
+
+    n = values.shape[0]
+    keep = min(count, n)
+    out = np.empty((4, keep))
+    mean = _mean_state(values[0] if n else np.nan)
+    var = (0.0, 0.0, 0.0, 0.0)
+    for i in range(n):
+        mean, var = _bollinger_step(mean, var, values, i, window)
+        if i >= n - keep:
+            column = i - (n - keep)
+            out[0, column], out[1, column], out[2, column], out[3, column] = _bollinger_value(
+                mean, var, window, num_std
+            )
+    return out
+
+
+@_jit
+def squeeze_tail(
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    volume: np.ndarray,
+    band_window: int,
+    num_std: float,
+    channel_com: float,
+    atr_window: int,
+    multiplier: float,
+    volume_window: int,
+    count: int,
+):
+    """Bollinger, Keltner and volume average of the squeeze scan in one pass.
+
+    Returns the last *count* columns of ``[upper, lower, width, kc_upper,
+    kc_lower, volume_ma]`` and the number of bars whose width is defined.
+    Each row matches the corresponding ``core.indicators`` function.
+    """
+
+    n = close.shape[0]
+    keep = min(count, n)
+    out = np.empty((6, keep))
+    mean = _mean_state(close[0] if n else np.nan)
+    var = (0.0, 0.0, 0.0, 0.0)
+    volume_state = _mean_state(volume[0] if n else np.nan)
+    mid_alpha = 1.0 / (1.0 + channel_com)
+    mid_factor = 1.0 - mid_alpha
+    atr_alpha = _ewm_alpha(1.0 / atr_window)
+    atr_factor = 1.0 - atr_alpha
+    mid = np.nan
+    mid_weight = 1.0
+    average = np.nan
+    weight = 1.0
+    nobs = 0
+    previous = np.nan
+    widths = 0
+    for i in range(n):
+        mean, var = _bollinger_step(mean, var, close, i, band_window)
+        _, upper, lower, width = _bollinger_value(mean, var, band_window, num_std)
+        if width == width:
+            widths += 1
+
+        mid, mid_weight = _ewm_step(mid, mid_weight, close[i], mid_alpha, mid_factor)
+        current = _true_range(high[i], low[i], previous)
+        previous = close[i]
+        if current == current:
+            nobs += 1
+        average, weight = _ewm_step(average, weight, current, atr_alpha, atr_factor)
+
+        volume_state = _mean_slide(volume_state, volume, i, volume_window)
+        if i >= n - keep:
+            column = i - (n - keep)
+            band = multiplier * (average if nobs >= atr_window else np.nan)
+            out[0, column] = upper
+            out[1, column] = lower
+            out[2, column] = width
+            out[3, column] = mid + band
+            out[4, column] = mid - band
+            out[5, column] = _mean_value(volume_state, volume_window)
+    return out, widths
+
+
+@_jit
+def stoch_tail(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    k_window: int,
+    d_window: int,
+    smooth_k: int,
+    count: int,
+) -> np.ndarray:
+    """Last *count* rows of ``core.indicators.stoch`` as ``[%K, %D]`` rows.
+
+    Raw %K and the smoothed %K are only kept for the windows still needed,
+    so memory stays proportional to the windows rather than the history.
+    """
+
+    n = close.shape[0]
+    keep = min(count, n)
+    out = np.empty((2, keep))
+    low_ring = np.empty(k_window, dtype=np.int64)
+    high_ring = np.empty(k_window, dtype=np.int64)
+    low_head = low_size = high_head = high_size = 0
+    low_nan = high_nan = -k_window
+    raw_k = np.empty(smooth_k)
+    smooth = np.empty(d_window)
+    k_state = _mean_state(np.nan)
+    d_state = _mean_state(np.nan)
+    for i in range(n):
+        low_head, low_size, low_nan, lowest = _extreme_step(low_ring, low_head, low_size, low_nan, low, i, False)
+        high_head, high_size, high_nan, highest = _extreme_step(
+            high_ring, high_head, high_size, high_nan, high, i, True
+        )
+        denom = highest - lowest
+        if denom == 0.0:
+            denom = np.nan
+        percent = ((close[i] - lowest) / denom) * 100
+        if i == 0:
+            k_state = _mean_state(percent)
+        # Rolling means over the derived series, with their inputs held in
+        # small rings instead of full arrays.
+        if i >= smooth_k:
+            k_state = _mean_remove(k_state, raw_k[i % smooth_k])
+        raw_k[i % smooth_k] = percent
+        k_state = _mean_add(k_state, percent)
+        percent_k = _mean_value(k_state, smooth_k)
+
+        if i == 0:
+            d_state = _mean_state(percent_k)
+        if i >= d_window:
+            d_state = _mean_remove(d_state, smooth[i % d_window])
+        smooth[i % d_window] = percent_k
+        d_state = _mean_add(d_state, percent_k)
+        percent_d = _mean_value(d_state, d_window)
+
+        if i >= n - keep:
+            column = i - (n - keep)
+            out[0, column] = percent_k if percent_k == percent_k else 0.0
+            out[1, column] = percent_d if percent_d == percent_d else 0.0
+    return out
+
+
+def warmup() -> None:
+    """Compile or load every public kernel for the signatures the wrappers use.
+
+    With ``cache=True`` the machine code is read back from ``__pycache__``
+    after the first run, so this mostly costs the cache lookups. Calling it
+    up front moves that latency out of the first scan.
+    """
+
+    if not NUMBA_AVAILABLE:
+        return
+    values = np.zeros(32, dtype=np.float64)
+    ewm_mean(values, 13.0, 14)
+    atr_wilder(values, values, values, 14)
+    keltner_bands(values, values, values, 9.5, 10, 1.5)
+    rolling_max(values, 14)
+    rolling_min(values, 14)
+    rolling_mean(values, 20, 20)
+    bollinger_bands(values, 20, 2.0)
+    rsi_wilder(values, 14)
+    trend_tail(values, 50, 200, 14)
+    ring = np.empty(200)
+    count, state = trend_commit(values, 0, ring, 0, trend_state(0.0), 50, 200, 14)
+    trend_peek(0.0, ring, count, state, 50, 200, 14)
+    range_tail(values, values, values, values, 30, 20, 14)
+    rsi_tail(values, 14, 3)
+    sma_tail(values, 20, 3)
+    bollinger_tail(values, 20, 2.0, 3)
+    stoch_tail(values, values, values, 14, 3, 3, 3)
+    squeeze_tail(values, values, values, values, 20, 2.0, 9.5, 10, 1.5, 20, 120)
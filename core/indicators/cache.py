@@ -0,0 +1,86 @@
+"""Memoisation of indicator results shared between scenarios.
+
+Entries are keyed on the indicator name, its parameters and a digest of the
+input arrays, so a symbol evaluated again by another scenario or by a second
+run on the same bars gets the stored result, while revised prices simply
+produce a new key and stale entries age out of the LRU.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Sequence, Tuple, TypeVar
+
+import numpy as np
+
+__all__ = ["IndicatorCache", "indicator_cache"]
+
+_T = TypeVar("_T")
+
+
+class IndicatorCache:
+    """Thread-safe LRU of indicator results keyed on their inputs."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[Hashable, ...], object]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _digest(arrays: Sequence[np.ndarray]) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        for array in arrays:
+            contiguous = np.ascontiguousarray(array)
+            digest.update(str((contiguous.dtype.str, contiguous.shape)).encode())
+            digest.update(memoryview(contiguous).cast("B"))
+        return digest.digest()
+
+    def get_or_compute(
+        self,
+        name: str,
+        arrays: Sequence[np.ndarray],
+        params: Tuple[Hashable, ...],
+        compute: Callable[[], _T],
+    ) -> _T:
+        """Return the stored result for *arrays* or compute and store it.
+
+        Results are shared between callers, so *compute* should return
+        immutable values; arrays are stored read-only.
+        """
+
+        key = (name, params, self._digest(arrays))
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]  # type: ignore[return-value]
+            self.misses += 1
+
+        value = compute()
+        if isinstance(value, np.ndarray):
+            value.setflags(write=False)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+#: Process-wide cache used by the ``*_tail`` helpers in :mod:`core.indicators`.
+indicator_cache = IndicatorCache()
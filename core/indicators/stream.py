@@ -0,0 +1,101 @@
+"""Incremental trend indicators carried between scans of the same symbol.
+
+A :class:`TrendStream` keeps the running SMA and Wilder RSI state of
+:func:`core.indicators._kernels.trend_tail` together with a ring buffer of
+the last ``max(fast, slow)`` closes and the timestamp of the last bar it
+committed. A later scan resumes after that timestamp, so a rolling fetch
+window whose first bar moved on still continues the stream, and only the
+bars after it are processed. The last bar is never committed because it may
+still change while the session is open; it is applied to a copy of the
+state on every update.
+
+Once the window has moved the values continue the series from the first
+bar the stream consumed rather than from the first fetched bar. The SMAs
+agree up to rounding and the RSI difference decays with Wilder's smoothing.
+A revised close at the resume point, such as a dividend adjustment, or a
+missing timestamp restarts the stream from the first bar.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.indicators import _kernels
+
+__all__ = ["TrendStream"]
+
+
+class TrendStream:
+    """``sma(fast)``, ``sma(slow)`` and ``rsi`` at the last bar, updated per bar.
+
+    Instances are not thread-safe; a stream belongs to one symbol and is
+    updated by one scan at a time. Only meaningful with Numba, as the
+    kernels are plain Python loops otherwise.
+    """
+
+    def __init__(self, fast: int = 50, slow: int = 200, rsi_window: int = 14) -> None:
+        if min(fast, slow, rsi_window) <= 0:
+            raise ValueError("windows must be positive")
+        self.fast = fast
+        self.slow = slow
+        self.rsi_window = rsi_window
+        self._ring = np.empty(max(fast, slow))
+        self._count = 0
+        self._state: Any = None
+        self._last_key: Optional[object] = None
+
+    def __len__(self) -> int:
+        """Number of bars committed to the running state."""
+
+        return self._count
+
+    def update(
+        self, closes: np.ndarray, index: Sequence[object]
+    ) -> Tuple[float, float, float, float, float]:
+        """Return ``(prev_fast, last_fast, prev_slow, last_slow, last_rsi)`` for *closes*.
+
+        *index* holds the bar timestamps of *closes*. Until the window moves
+        the values equal ``_kernels.trend_tail(closes, fast, slow, rsi_window)``.
+        """
+
+        n = closes.shape[0]
+        if n == 0:
+            self.reset()
+            return (np.nan,) * 5
+        start = self._resume_position(closes, index)
+        if start is None:
+            self.reset()
+            self._state = _kernels.trend_state(float(closes[0]))
+            start = 0
+        if start < n - 1:
+            self._count, self._state = _kernels.trend_commit(
+                closes[: n - 1], start, self._ring, self._count, self._state,
+                self.fast, self.slow, self.rsi_window,
+            )
+            self._last_key = index[n - 2]
+        tail = _kernels.trend_peek(
+            float(closes[-1]), self._ring, self._count, self._state,
+            self.fast, self.slow, self.rsi_window,
+        )
+        prev_fast, last_fast, prev_slow, last_slow, last_rsi = tail
+        return float(prev_fast), float(last_fast), float(prev_slow), float(last_slow), float(last_rsi)
+
+    def reset(self) -> None:
+        self._count = 0
+        self._state = None
+        self._last_key = None
+
+    def _resume_position(self, closes: np.ndarray, index: Sequence[object]) -> Optional[int]:
+        # New bars are appended at the end, so look for the last committed
+        # bar from the back; this only walks the bars added since.
+        if self._count == 0:
+            return None
+        committed = self._ring[(self._count - 1) % self._ring.shape[0]]
+        for position in range(closes.shape[0] - 2, -1, -1):
+            if index[position] == self._last_key:
+                close = closes[position]
+                same = close == committed or (close != close and committed != committed)
+                return position + 1 if same else None
+        return None
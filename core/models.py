@@ -29,7 +29,7 @@ class ScanResult:
     meta: Optional[TickerMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeSignal:
     symbol: str
     timestamp: pd.Timestamp
@@ -5,22 +5,25 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
 
 import pandas as pd
 
 from core.cache import Cache
 from core.data.fetcher import Fetcher
+from core.indicators import _kernels
 from core.models import ScanResult, TradeSignal
 from core.scans import SCENARIO_REGISTRY, BaseScenario
+from core.scans._batch import stack_contexts
 from core.universe import UniverseLoader, UniverseSpec
+from core.workq import WorkStealingExecutor
 
 _LOGGER = logging.getLogger(__name__)
 
 
-ResultCallback = Callable[[Optional[ScanResult], List[TradeSignal]], None]
+ResultCallback = Callable[[Optional[ScanResult], Sequence[TradeSignal]], None]
 ProgressCallback = Callable[["ScanProgress"], None]
 FundamentalsProvider = Callable[[str], Optional[dict]]
 
@@ -72,7 +75,17 @@ class ScanRunner:
         fundamentals_provider: Optional[FundamentalsProvider] = None,
         max_workers: int = 4,
         scan_config: Optional[ScanConfig] = None,
+        executor: Optional[Executor] = None,
     ) -> None:
+        """Create a runner.
+
+        When *executor* is given, per-symbol evaluation is submitted to it
+        instead of a private :class:`~core.workq.WorkStealingExecutor` sized
+        by *max_workers*, which is created on the first scan and reused until
+        :meth:`shutdown`. The caller keeps ownership of a supplied executor
+        and is responsible for shutting it down.
+        """
+
         if max_workers <= 0:
             raise ValueError("max_workers must be positive")
 
@@ -81,11 +94,17 @@ class ScanRunner:
         self._fundamentals_provider = fundamentals_provider or (lambda symbol: None)
         self._max_workers = max_workers
         self._scan_config = scan_config or ScanConfig()
+        self._executor = executor
+        self._owned_executor: Optional[WorkStealingExecutor] = None
 
         self._manager_executor = ThreadPoolExecutor(max_workers=1)
         self._active_future: Optional[Future[ScanSummary]] = None
         self._cancel_event = threading.Event()
         self._lock = threading.Lock()
+        # Scenario state per (scenario id, symbol), carried from one scan to the
+        # next; only symbols of the latest scan and its period are kept.
+        self._stream_states: Dict[Tuple[str, str], Any] = {}
+        self._stream_period: Optional[str] = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -140,6 +159,10 @@ class ScanRunner:
         if future is not None:
             future.cancel()
         self._manager_executor.shutdown(wait=True)
+        with self._lock:
+            owned, self._owned_executor = self._owned_executor, None
+        if owned is not None:
+            owned.shutdown(wait=True)
 
     # ------------------------------------------------------------------
     # Internal implementation
@@ -161,7 +184,9 @@ class ScanRunner:
 
         self._emit_progress(on_progress, ScanProgress(total, processed, skipped, errors))
 
+        self._prune_stream_states(symbols, period)
         price_map, cache_hits, cache_misses = self._load_price_data(symbols, period)
+        rejected = self._screen_batch(scenario, price_map, params)
 
         def _process(symbol: str) -> Tuple[str, Optional[ScanResult], List[TradeSignal], Optional[str]]:
             if self._cancel_event.is_set():
@@ -170,18 +195,27 @@ class ScanRunner:
             price_df = price_map.get(symbol)
             if price_df is None or price_df.empty:
                 return symbol, None, [], "missing"
+            if symbol in rejected:
+                return symbol, None, [], None
 
             fundamentals = self._fundamentals_provider(symbol)
+            stream_state = self._stream_state(scenario, symbol)
 
             try:
-                result, signals = scenario.evaluate(price_df, fundamentals, params)
+                if stream_state is None:
+                    result, signals = scenario.evaluate(price_df, fundamentals, params)
+                else:
+                    result, signals = scenario.evaluate(
+                        price_df, fundamentals, params, stream_state=stream_state
+                    )
                 return symbol, result, signals, None
             except Exception as exc:  # pragma: no cover - defensive logging
                 _LOGGER.exception("Scenario evaluation failed for %s", symbol)
                 return symbol, None, [], str(exc)
 
-        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
-            futures = {executor.submit(_process, symbol): symbol for symbol in symbols}
+        executor = self._executor or self._worker_pool()
+        futures = {executor.submit(_process, symbol): symbol for symbol in symbols}
+        try:
             for future in as_completed(futures):
                 symbol, result, signals, error = future.result()
 
@@ -197,7 +231,8 @@ class ScanRunner:
                         skipped += 1
                     else:
                         if on_result is not None:
-                            on_result(result, signals)
+                            # Immutable once emitted so consumers can keep the reference.
+                            on_result(result, tuple(signals))
 
                 processed += 1
                 self._emit_progress(
@@ -207,6 +242,11 @@ class ScanRunner:
 
                 if self._cancel_event.is_set():
                     break
+        finally:
+            for future in futures:
+                future.cancel()
+            # The pool outlives the scan; let in-flight symbols settle first.
+            wait(futures)
 
         duration = time.perf_counter() - start_time
         return ScanSummary(
@@ -219,6 +259,61 @@ class ScanRunner:
             duration_seconds=duration,
         )
 
+    @staticmethod
+    def _screen_batch(
+        scenario: BaseScenario, price_map: Mapping[str, pd.DataFrame], params: Dict[str, object]
+    ) -> Set[str]:
+        """Symbols the scenario's batch screen rules out before evaluation.
+
+        The screen runs serially on the manager thread. Without Numba the
+        batch indicators are the per-row pandas ones that :meth:`evaluate`
+        computes again for every survivor, so it is skipped.
+        """
+
+        if not _kernels.NUMBA_AVAILABLE or not scenario.supports_batch or not price_map:
+            return set()
+        try:
+            symbols: List[str] = []
+            contexts = []
+            for symbol, price_df in price_map.items():
+                context = scenario.build_context(price_df, None)
+                if context is not None:
+                    symbols.append(symbol)
+                    contexts.append(context)
+            candidates = scenario.batch_candidates(*stack_contexts(contexts), params)
+        except Exception:  # pragma: no cover - defensive logging
+            _LOGGER.exception("Batch screen failed for %s; evaluating every symbol", scenario.id)
+            return set()
+        if candidates is None:
+            return set()
+        return {symbol for symbol, keep in zip(symbols, candidates) if not keep}
+
+    def _prune_stream_states(self, symbols: Sequence[str], period: str) -> None:
+        with self._lock:
+            if period != self._stream_period:
+                self._stream_states.clear()
+                self._stream_period = period
+                return
+            wanted = set(symbols)
+            for key in [key for key in self._stream_states if key[1] not in wanted]:
+                del self._stream_states[key]
+
+    def _stream_state(self, scenario: BaseScenario, symbol: str) -> Any:
+        key = (scenario.id, symbol)
+        with self._lock:
+            state = self._stream_states.get(key)
+            if state is None:
+                state = scenario.create_stream_state()
+                if state is not None:
+                    self._stream_states[key] = state
+        return state
+
+    def _worker_pool(self) -> WorkStealingExecutor:
+        with self._lock:
+            if self._owned_executor is None:
+                self._owned_executor = WorkStealingExecutor(max_workers=self._max_workers)
+            return self._owned_executor
+
     def _load_price_data(
         self, symbols: Iterable[str], period: str
     ) -> Tuple[Dict[str, pd.DataFrame], int, int]:
@@ -0,0 +1,314 @@
+"""Indicators evaluated across many symbols in one call.
+
+Matrices hold one symbol per row and one bar per column. Histories are
+right-aligned on the latest bar and padded with NaN on the left, as built by
+:func:`align_right`. The kernels ignore leading NaNs, so every real bar of
+row ``i`` carries the same value as the single-series indicator in
+:mod:`core.indicators` applied to symbol ``i`` alone.
+
+With Numba installed, rows are spread over its thread pool with ``prange``.
+Each row reuses the sequential kernel from :mod:`core.indicators._kernels`.
+Without Numba, the pandas indicators are applied row by row.
+
+Matrices may be stored as float32 to halve their footprint and the memory
+traffic of a scan over many symbols. The kernels still accumulate and return
+float64, so a float32 matrix gives exactly the result of its float64 upcast.
+Only the rounding of the stored prices differs. The scenarios keep float64
+because that rounding can flip the equality tests their scores depend on.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from core import indicators
+from core.indicators import _kernels
+from core.indicators._kernels import (
+    bollinger_bands,
+    keltner_bands,
+    rolling_max,
+    rolling_mean,
+    rolling_min,
+    rsi_wilder,
+    stoch_tail,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from core.scans.base import ScenarioContext
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+    prange = range
+
+__all__ = [
+    "align_right",
+    "batch_bollinger",
+    "batch_keltner",
+    "batch_rsi",
+    "batch_sma",
+    "batch_stoch",
+    "stack_contexts",
+]
+
+_F = TypeVar("_F", bound=Callable)
+
+_STORAGE_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+
+def _parallel(func: _F) -> _F:
+    if njit is None:
+        return func
+    return njit(cache=True, nogil=True, parallel=True)(func)  # type: ignore[return-value]
+
+
+def _storage_dtype(dtype: DTypeLike) -> np.dtype:
+    resolved = np.dtype(dtype)
+    if resolved not in _STORAGE_DTYPES:
+        raise ValueError("dtype must be float64 or float32")
+    return resolved
+
+
+def align_right(
+    rows: Sequence[Optional[np.ndarray]],
+    length: Optional[int] = None,
+    dtype: DTypeLike = np.float64,
+) -> np.ndarray:
+    """Stack *rows* into a matrix aligned on their last element.
+
+    Shorter rows are padded with NaN on the left. ``None`` becomes an
+    all-NaN row. *length* defaults to the longest row; longer rows keep
+    only their latest *length* values. *dtype* is ``float64`` or
+    ``float32``.
+    """
+
+    dtype = _storage_dtype(dtype)
+    if length is None:
+        length = max((row.shape[0] for row in rows if row is not None), default=0)
+    matrix = np.full((len(rows), length), np.nan, dtype=dtype)
+    if length == 0:
+        return matrix
+    for position, row in enumerate(rows):
+        if row is None or row.shape[0] == 0:
+            continue
+        tail = row[-length:]
+        matrix[position, length - tail.shape[0]:] = tail
+    return matrix
+
+
+def stack_contexts(
+    contexts: Sequence["ScenarioContext"],
+    dtype: DTypeLike = np.float64,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``closes, highs, lows, volumes`` matrices for *contexts*.
+
+    Rows come from :attr:`ScenarioContext.arrays`, the same bars the
+    scenarios evaluate. *dtype* selects the storage precision, see
+    :func:`align_right`.
+    """
+
+    closes, highs, lows, volumes = [], [], [], []
+    for context in contexts:
+        arrays = context.arrays
+        closes.append(arrays.close)
+        highs.append(arrays.high)
+        lows.append(arrays.low)
+        if arrays.volume is None:
+            volumes.append(np.full(arrays.close.shape[0], np.nan))
+        else:
+            volumes.append(arrays.volume)
+    length = max((row.shape[0] for row in closes), default=0)
+    return (
+        align_right(closes, length, dtype),
+        align_right(highs, length, dtype),
+        align_right(lows, length, dtype),
+        align_right(volumes, length, dtype),
+    )
+
+
+def _as_matrix(values: np.ndarray) -> np.ndarray:
+    values = np.asarray(values)
+    dtype = values.dtype if values.dtype in _STORAGE_DTYPES else np.float64
+    matrix = np.ascontiguousarray(values, dtype=dtype)
+    if matrix.ndim != 2:
+        raise ValueError("expected a (symbols, bars) matrix")
+    return matrix
+
+
+@_parallel
+def _rsi_rows(closes: np.ndarray, window: int) -> np.ndarray:
+    out = np.empty(closes.shape)
+    for row in prange(closes.shape[0]):
+        out[row] = rsi_wilder(closes[row], window)
+    return out
+
+
+@_parallel
+def _sma_rows(values: np.ndarray, window: int) -> np.ndarray:
+    out = np.empty(values.shape)
+    for row in prange(values.shape[0]):
+        out[row] = rolling_mean(values[row], window, window)
+    return out
+
+
+@_parallel
+def _bollinger_rows(closes: np.ndarray, window: int, num_std: float) -> np.ndarray:
+    out = np.empty((4, closes.shape[0], closes.shape[1]))
+    for row in prange(closes.shape[0]):
+        out[:, row] = bollinger_bands(closes[row], window, num_std)
+    return out
+
+
+@_parallel
+def _keltner_rows(
+    highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, com: float, atr_window: int, multiplier: float
+) -> np.ndarray:
+    out = np.empty((3, closes.shape[0], closes.shape[1]))
+    for row in prange(closes.shape[0]):
+        out[:, row] = keltner_bands(highs[row], lows[row], closes[row], com, atr_window, multiplier)
+    return out
+
+
+@_parallel
+def _stoch_rows(
+    highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, k_window: int, d_window: int, smooth_k: int
+) -> np.ndarray:
+    out = np.empty((2, closes.shape[0], closes.shape[1]))
+    for row in prange(closes.shape[0]):
+        lowest_low = rolling_min(lows[row], k_window)
+        denom = rolling_max(highs[row], k_window) - lowest_low
+        denom = np.where(denom == 0.0, np.nan, denom)
+        percent_k = ((closes[row] - lowest_low) / denom) * 100
+        percent_k = rolling_mean(percent_k, smooth_k, smooth_k)
+        percent_d = rolling_mean(percent_k, d_window, d_window)
+        out[0, row] = np.where(np.isnan(percent_k), 0.0, percent_k)
+        out[1, row] = np.where(np.isnan(percent_d), 0.0, percent_d)
+    return out
+
+
+@_parallel
+def _stoch_tail_rows(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    k_window: int,
+    d_window: int,
+    smooth_k: int,
+    count: int,
+) -> np.ndarray:
+    out = np.empty((2, closes.shape[0], min(count, closes.shape[1])))
+    for row in prange(closes.shape[0]):
+        out[:, row] = stoch_tail(highs[row], lows[row], closes[row], k_window, d_window, smooth_k, count)
+    return out
+
+
+def batch_rsi(closes: np.ndarray, window: int = 14) -> np.ndarray:
+    """:func:`core.indicators.rsi` applied to every row of *closes*."""
+
+    if window <= 0:
+        raise ValueError("window must be positive")
+    closes = _as_matrix(closes)
+    if _kernels.NUMBA_AVAILABLE:
+        return _rsi_rows(closes, window)
+    return np.array([indicators.rsi(row, window).to_numpy() for row in closes]).reshape(closes.shape)
+
+
+def batch_sma(values: np.ndarray, window: int) -> np.ndarray:
+    """:func:`core.indicators.sma` (full windows only) applied to every row."""
+
+    if window <= 0:
+        raise ValueError("window must be positive")
+    values = _as_matrix(values)
+    if _kernels.NUMBA_AVAILABLE:
+        return _sma_rows(values, window)
+    return np.array([indicators.sma(row, window).to_numpy() for row in values]).reshape(values.shape)
+
+
+def batch_bollinger(closes: np.ndarray, window: int = 20, num_std: float = 2.0) -> np.ndarray:
+    """Bollinger bands per row, stacked as ``mid, upper, lower, width``.
+
+    The result has shape ``(4, symbols, bars)``.
+    """
+
+    if window <= 0:
+        raise ValueError("window must be positive")
+    if num_std <= 0:
+        raise ValueError("num_std must be positive")
+    closes = _as_matrix(closes)
+    if _kernels.NUMBA_AVAILABLE:
+        return _bollinger_rows(closes, window, num_std)
+    out = np.empty((4,) + closes.shape)
+    for position, row in enumerate(closes):
+        bands = indicators.bollinger(row, window, num_std)
+        out[:, position] = bands[["mid", "upper", "lower", "width"]].to_numpy().T
+    return out
+
+
+def batch_keltner(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    window: int = 20,
+    atr_window: int = 10,
+    multiplier: float = 2.0,
+) -> np.ndarray:
+    """Keltner channels per row, stacked as ``mid, upper, lower``.
+
+    The result has shape ``(3, symbols, bars)``.
+    """
+
+    if min(window, atr_window) <= 0:
+        raise ValueError("windows must be positive")
+    if multiplier <= 0:
+        raise ValueError("multiplier must be positive")
+    highs, lows, closes = _as_matrix(highs), _as_matrix(lows), _as_matrix(closes)
+    if not highs.shape == lows.shape == closes.shape:
+        raise ValueError("highs, lows and closes must share a shape")
+    if _kernels.NUMBA_AVAILABLE:
+        return _keltner_rows(highs, lows, closes, (window - 1) / 2, atr_window, float(multiplier))
+    out = np.empty((3,) + closes.shape)
+    for position in range(closes.shape[0]):
+        frame = indicators.keltner_channels(
+            highs[position], lows[position], closes[position], window, atr_window, multiplier
+        )
+        out[:, position] = frame[["mid", "upper", "lower"]].to_numpy().T
+    return out
+
+
+def batch_stoch(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    k_window: int = 14,
+    d_window: int = 3,
+    smooth_k: int = 3,
+    count: Optional[int] = None,
+) -> np.ndarray:
+    """Stochastic %K and %D per row with shape ``(2, symbols, bars)``.
+
+    With *count*, only the last *count* bars are returned and each row is
+    reduced by the tail kernel without materialising the full series.
+    """
+
+    if min(k_window, d_window, smooth_k) <= 0:
+        raise ValueError("windows must be positive")
+    if count is not None and count <= 0:
+        raise ValueError("count must be positive")
+    highs, lows, closes = _as_matrix(highs), _as_matrix(lows), _as_matrix(closes)
+    if not highs.shape == lows.shape == closes.shape:
+        raise ValueError("highs, lows and closes must share a shape")
+    if _kernels.NUMBA_AVAILABLE:
+        if count is not None:
+            return _stoch_tail_rows(highs, lows, closes, k_window, d_window, smooth_k, count)
+        return _stoch_rows(highs, lows, closes, k_window, d_window, smooth_k)
+    out = np.empty((2,) + closes.shape)
+    for position in range(closes.shape[0]):
+        frame = indicators.stoch(highs[position], lows[position], closes[position], k_window, d_window, smooth_k)
+        out[:, position] = frame[["%K", "%D"]].to_numpy().T
+    if count is not None:
+        return out[:, :, -count:]
+    return out
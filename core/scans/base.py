@@ -5,14 +5,20 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from functools import cached_property
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 
 from core.models import ScanResult, TradeSignal
 
-__all__ = ["BaseScenario", "ScenarioContext", "PriceSeriesBundle"]
+__all__ = ["BaseScenario", "ScenarioContext", "PriceSeriesBundle", "PriceArrayBundle", "BATCH_SCREEN_DTYPE"]
+
+BATCH_SCREEN_DTYPE = np.dtype([("score", np.float64), ("signal", np.bool_)])
+# Batch scores are only trusted to reject rows clearly below the threshold;
+# anything closer is left to :meth:`BaseScenario.evaluate`.
+_BATCH_SCORE_SLACK = 1e-6
 
 
 @dataclass(frozen=True)
@@ -26,6 +32,21 @@ class PriceSeriesBundle:
     volume: Optional[pd.Series]
 
 
+@dataclass(frozen=True)
+class PriceArrayBundle:
+    """Float64 OHLCV values restricted to the bars with a close.
+
+    Equivalent to ``close.dropna()`` with the other series reindexed to it,
+    without building the intermediate Series.
+    """
+
+    index: pd.Index
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: Optional[np.ndarray]
+
+
 @dataclass(frozen=True)
 class ScenarioContext:
     """Runtime context passed to scans with the extracted data series."""
@@ -46,6 +67,24 @@ class ScenarioContext:
             return last_index.to_pydatetime(warn=False)
         return datetime.utcnow()
 
+    @cached_property
+    def arrays(self) -> PriceArrayBundle:
+        """Return the series as arrays aligned on the defined closes."""
+
+        series = self.series
+        close = series.close.to_numpy(dtype=np.float64, na_value=np.nan)
+        mask = ~np.isnan(close)
+        volume = None
+        if series.volume is not None:
+            volume = series.volume.to_numpy(dtype=np.float64, na_value=np.nan)[mask]
+        return PriceArrayBundle(
+            index=series.close.index[mask],
+            high=series.high.to_numpy(dtype=np.float64, na_value=np.nan)[mask],
+            low=series.low.to_numpy(dtype=np.float64, na_value=np.nan)[mask],
+            close=close[mask],
+            volume=volume,
+        )
+
 
 class BaseScenario(ABC):
     """Abstract base class for all scan scenarios."""
@@ -54,6 +93,8 @@ class BaseScenario(ABC):
     name: str
     description: str
     default_params: Dict[str, Any]
+    #: Whether :meth:`evaluate_batch` is implemented for this scenario.
+    supports_batch: bool = False
 
     def build_context(
         self, price_df: Optional[pd.DataFrame], fundamentals: Optional[dict]
@@ -101,6 +142,59 @@ class BaseScenario(ABC):
     ) -> Tuple[Optional[ScanResult], List[TradeSignal]]:
         """Evaluate the scan returning a result and associated trade signals."""
 
+    def create_stream_state(self) -> Optional[Any]:
+        """Return per-symbol state the runner keeps between scans, or ``None``.
+
+        Scenarios that return a state accept it back as the ``stream_state``
+        keyword of :meth:`evaluate` on every later scan of the same symbol.
+        """
+
+        return None
+
+    def evaluate_batch(
+        self,
+        closes: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        volumes: np.ndarray,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Optional[np.ndarray]:
+        """Screen many symbols at once.
+
+        Inputs are ``(symbols, bars)`` matrices built with
+        :func:`core.scans._batch.align_right` from each context's
+        ``close.dropna()`` and the other series reindexed to it. Scenarios
+        that set :attr:`supports_batch` return a :data:`BATCH_SCREEN_DTYPE`
+        array holding, per row, the score :meth:`evaluate` would compute
+        (``-inf`` where it would return nothing) and whether it would emit a
+        signal. The default returns ``None``.
+
+        The runner skips every symbol :meth:`batch_candidates` rejects
+        without calling :meth:`evaluate`, so an implementation repeats that
+        scoring and must change with it.
+        ``test_contrarian_batch_screen_matches_evaluate`` and
+        ``test_squeeze_batch_screen_matches_evaluate`` check the two agree.
+        """
+
+        return None
+
+    def batch_candidates(
+        self,
+        closes: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        volumes: np.ndarray,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Optional[np.ndarray]:
+        """Boolean mask of rows worth a full :meth:`evaluate`, or ``None``."""
+
+        screen = self.evaluate_batch(closes, highs, lows, volumes, params)
+        if screen is None:
+            return None
+        arguments = {**self.default_params, **(params or {})}
+        threshold = float(arguments.get("threshold", 0.0))
+        return screen["signal"] | ~(screen["score"] < threshold - _BATCH_SCORE_SLACK)
+
     # ------------------------------------------------------------------
     # Helper utilities
     # ------------------------------------------------------------------
@@ -128,6 +222,37 @@ class BaseScenario(ABC):
         if text and text not in reasons:
             reasons.append(text)
 
+    @staticmethod
+    def _history_lengths(closes: np.ndarray) -> np.ndarray:
+        return np.count_nonzero(~np.isnan(closes), axis=1)
+
+    @staticmethod
+    def _batch_rejected(rows: int) -> np.ndarray:
+        screen = np.empty(rows, dtype=BATCH_SCREEN_DTYPE)
+        screen["score"] = -np.inf
+        screen["signal"] = False
+        return screen
+
+    @staticmethod
+    def _batch_screen(score: np.ndarray, signal: np.ndarray, valid: np.ndarray) -> np.ndarray:
+        screen = np.empty(score.shape[0], dtype=BATCH_SCREEN_DTYPE)
+        screen["score"] = np.where(valid, score, -np.inf)
+        screen["signal"] = signal & valid
+        return screen
+
+    @staticmethod
+    def _flag_score(base: Any, flags: Sequence[np.ndarray], weights: Sequence[float]) -> np.ndarray:
+        """Return ``base + flags @ weights`` clipped to ``[0, 100]``.
+
+        *flags* holds one boolean array per score component, *weights* the
+        points each component adds. The matrix product replaces a chain of
+        ``np.where`` terms and the clip reuses its result buffer.
+        """
+
+        score = np.column_stack(flags).astype(np.float64) @ np.asarray(weights, dtype=np.float64)
+        score += base
+        return np.clip(score, 0.0, 100.0, out=score)
+
     @staticmethod
     def _confidence_from_score(score: float, threshold: float) -> float:
         if threshold <= 0:
@@ -7,8 +7,9 @@ from typing import Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 
-from core.indicators import bollinger, rsi, stoch
+from core.indicators import bollinger_tail, rsi_tail, stoch_tail
 from core.models import ScanResult, TradeSignal
+from core.scans._batch import batch_bollinger, batch_rsi, batch_stoch
 from core.scans.base import BaseScenario
 
 __all__ = [
@@ -26,6 +27,7 @@ class ClassicOversoldScenario(BaseScenario):
         "rsi_threshold": 30.0,
         "threshold": 50.0,
     }
+    supports_batch = True
 
     def evaluate(
         self,
@@ -46,19 +48,23 @@ class ClassicOversoldScenario(BaseScenario):
         if closes.shape[0] < 40:
             return None, []
 
-        rsi_series = rsi(closes, 14)
-        bb = bollinger(closes, window=20)
+        recent_rsi = rsi_tail(closes, 14, count=3)
         last_close = closes.iloc[-1]
-        last_rsi = float(rsi_series.iloc[-1])
-        recent_rsi = rsi_series.tail(3)
+        last_rsi = float(recent_rsi[-1])
         recent_min_rsi = float(recent_rsi.min())
         oversold_recent = recent_min_rsi <= rsi_threshold
-        last_lower = float(bb["lower"].iloc[-1])
-        prev_close = closes.iloc[-2] if closes.shape[0] >= 2 else np.nan
-        candle_reversal = last_close > prev_close and last_close > last_lower
-
         rsi_reference = min(last_rsi, recent_min_rsi)
         rsi_score = np.clip((rsi_threshold - rsi_reference) / max(rsi_threshold, 1e-3), 0.0, 1.5)
+
+        # Without an oversold reading there is no signal, and when even a
+        # reversal candle cannot lift the score to the threshold the
+        # Bollinger bands are not needed.
+        if not oversold_recent and np.clip(20.0 + rsi_score * 40.0 + 30.0, 0.0, 100.0) < threshold:
+            return None, []
+
+        last_lower = float(bollinger_tail(closes, window=20, count=1)[2, -1])
+        prev_close = closes.iloc[-2] if closes.shape[0] >= 2 else np.nan
+        candle_reversal = last_close > prev_close and last_close > last_lower
         bounce_score = 1.0 if candle_reversal else 0.0
         score = float(np.clip(20.0 + rsi_score * 40.0 + bounce_score * 30.0, 0.0, 100.0))
 
@@ -108,6 +114,37 @@ class ClassicOversoldScenario(BaseScenario):
 
         return result, signals
 
+    def evaluate_batch(
+        self,
+        closes: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        volumes: np.ndarray,
+        params: Optional[Dict[str, float]] = None,
+    ) -> Optional[np.ndarray]:
+        arguments = {**self.default_params, **(params or {})}
+        rsi_threshold = float(arguments.get("rsi_threshold", 30.0))
+
+        if closes.shape[1] < 40:
+            return self._batch_rejected(closes.shape[0])
+
+        rsi_values = batch_rsi(closes, 14)
+        last_lower = batch_bollinger(closes, window=20)[2, :, -1]
+        last_close = closes[:, -1]
+        last_rsi = rsi_values[:, -1]
+        recent_min_rsi = rsi_values[:, -3:].min(axis=1)
+        oversold_recent = recent_min_rsi <= rsi_threshold
+        candle_reversal = (last_close > closes[:, -2]) & (last_close > last_lower)
+
+        rsi_reference = np.minimum(last_rsi, recent_min_rsi)
+        rsi_score = np.clip((rsi_threshold - rsi_reference) / max(rsi_threshold, 1e-3), 0.0, 1.5)
+        score = self._flag_score(20.0 + rsi_score * 40.0, [candle_reversal], [30.0])
+        return self._batch_screen(
+            score,
+            oversold_recent & candle_reversal,
+            self._history_lengths(closes) >= 40,
+        )
+
 
 class MeanReversionBollingerScenario(BaseScenario):
     id = "mean_reversion_bb"
@@ -117,6 +154,7 @@ class MeanReversionBollingerScenario(BaseScenario):
         "threshold": 48.0,
         "band_window": 20,
     }
+    supports_batch = True
 
     def evaluate(
         self,
@@ -138,10 +176,9 @@ class MeanReversionBollingerScenario(BaseScenario):
         if closes.shape[0] < band_window + 5:
             return None, []
 
-        bb = bollinger(closes, window=band_window)
         last_close = closes.iloc[-1]
         last_low = lows.iloc[-1]
-        lower_band = bb["lower"].iloc[-1]
+        lower_band = bollinger_tail(closes, window=band_window, count=1)[2, -1]
         prev_close = closes.iloc[-2] if closes.shape[0] >= 2 else last_close
 
         tagged_band = last_low < lower_band
@@ -195,6 +232,33 @@ class MeanReversionBollingerScenario(BaseScenario):
 
         return result, signals
 
+    def evaluate_batch(
+        self,
+        closes: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        volumes: np.ndarray,
+        params: Optional[Dict[str, float]] = None,
+    ) -> Optional[np.ndarray]:
+        arguments = {**self.default_params, **(params or {})}
+        band_window = int(arguments.get("band_window", 20))
+
+        if closes.shape[1] < max(band_window + 5, 2):
+            return self._batch_rejected(closes.shape[0])
+
+        lower_band = batch_bollinger(closes, window=band_window)[2, :, -1]
+        last_close = closes[:, -1]
+        prev_close = closes[:, -2]
+
+        tagged_band = lows[:, -1] < lower_band
+        reclaim = (last_close > lower_band) & (prev_close < lower_band)
+        score = self._flag_score(20.0, [tagged_band, reclaim], [25.0, 35.0])
+        return self._batch_screen(
+            score,
+            tagged_band & reclaim,
+            self._history_lengths(closes) >= band_window + 5,
+        )
+
 
 class StochasticOversoldScenario(BaseScenario):
     id = "stochastic_oversold"
@@ -203,6 +267,7 @@ class StochasticOversoldScenario(BaseScenario):
     default_params: Dict[str, float] = {
         "threshold": 45.0,
     }
+    supports_batch = True
 
     def evaluate(
         self,
@@ -224,11 +289,11 @@ class StochasticOversoldScenario(BaseScenario):
         if closes.shape[0] < 20:
             return None, []
 
-        stoch_df = stoch(highs, lows, closes)
-        percent_k = stoch_df["%K"].iloc[-1]
-        percent_d = stoch_df["%D"].iloc[-1]
-        prev_k = stoch_df["%K"].iloc[-2] if stoch_df.shape[0] >= 2 else percent_k
-        prev_d = stoch_df["%D"].iloc[-2] if stoch_df.shape[0] >= 2 else percent_d
+        percent = stoch_tail(highs, lows, closes, count=2)
+        percent_k = percent[0, -1]
+        percent_d = percent[1, -1]
+        prev_k = percent[0, -2] if percent.shape[1] >= 2 else percent_k
+        prev_d = percent[1, -2] if percent.shape[1] >= 2 else percent_d
 
         oversold = max(percent_k, percent_d) < 20
         bullish_cross = prev_k < prev_d and percent_k > percent_d
@@ -275,3 +340,24 @@ class StochasticOversoldScenario(BaseScenario):
 
         return result, signals
 
+    def evaluate_batch(
+        self,
+        closes: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        volumes: np.ndarray,
+        params: Optional[Dict[str, float]] = None,
+    ) -> Optional[np.ndarray]:
+        if closes.shape[1] < 20:
+            return self._batch_rejected(closes.shape[0])
+
+        percent = batch_stoch(highs, lows, closes, count=2)
+        percent_k = percent[0, :, -1]
+        percent_d = percent[1, :, -1]
+        prev_k = percent[0, :, -2]
+        prev_d = percent[1, :, -2]
+
+        oversold = np.maximum(percent_k, percent_d) < 20
+        bullish_cross = (prev_k < prev_d) & (percent_k > percent_d)
+        score = self._flag_score(15.0, [oversold, bullish_cross], [35.0, 35.0])
+        return self._batch_screen(score, oversold & bullish_cross, self._history_lengths(closes) >= 20)
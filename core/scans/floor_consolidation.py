@@ -7,9 +7,9 @@ from typing import Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 
-from core.indicators import rsi, vol_ma
+from core.indicators import _kernels, rolling_max, rolling_min, rsi, vol_ma
 from core.models import ScanResult, TradeSignal
-from core.scans.base import BaseScenario
+from core.scans.base import BaseScenario, ScenarioContext
 from core.scoring import score_finance, score_quality
 
 __all__ = [
@@ -18,6 +18,24 @@ __all__ = [
 ]
 
 
+def _range_snapshot(
+    closes: np.ndarray, highs: np.ndarray, lows: np.ndarray, volume: np.ndarray, range_window: int
+) -> Tuple[float, float, float, float]:
+    """Return ``(range_high, range_low, volume_ma20, rsi14)`` at the last bar."""
+
+    if _kernels.NUMBA_AVAILABLE:
+        range_high, range_low, volume_ma, last_rsi = _kernels.range_tail(
+            closes, highs, lows, volume, range_window, 20, 14
+        )
+        return float(range_high), float(range_low), float(volume_ma), float(last_rsi)
+    return (
+        float(rolling_max(highs, range_window).iloc[-1]),
+        float(rolling_min(lows, range_window).iloc[-1]),
+        float(vol_ma(volume, 20).iloc[-1]),
+        float(rsi(closes, 14).iloc[-1]),
+    )
+
+
 class _BaseFloorScenario(BaseScenario):
     range_window: int = 30
     breakout_buffer: float = 0.005
@@ -27,36 +45,30 @@ class _BaseFloorScenario(BaseScenario):
     def _evaluate_common(self, context: object) -> Optional[dict]:
         if context is None:  # type: ignore[redundant-expr]
             return None
-        assert hasattr(context, "series")
-        series = context.series  # type: ignore[attr-defined]
+        assert hasattr(context, "arrays")
+        arrays = context.arrays  # type: ignore[attr-defined]
+        closes, low_values, volume = arrays.close, arrays.low, arrays.volume
 
-        closes = series.close.dropna()
-        highs = series.high.reindex(closes.index)
-        lows = series.low.reindex(closes.index)
-        volume = series.volume.reindex(closes.index) if series.volume is not None else None
-
-        if closes.shape[0] < max(self.range_window + 5, 40) or volume is None or volume.isna().all():
+        if closes.shape[0] < max(self.range_window + 5, 40) or volume is None or np.isnan(volume).all():
             return None
 
-        recent_high = highs.rolling(window=self.range_window, min_periods=self.range_window).max()
-        recent_low = lows.rolling(window=self.range_window, min_periods=self.range_window).min()
-        last_high = float(recent_high.iloc[-1])
-        last_low = float(recent_low.iloc[-1])
-        last_close = float(closes.iloc[-1])
+        last_high, last_low, last_volume_ma, last_rsi = _range_snapshot(
+            closes, arrays.high, low_values, volume, self.range_window
+        )
+        last_close = float(closes[-1])
         range_pct = (last_high - last_low) / last_close if last_close else np.nan
 
-        higher_lows = lows.iloc[-3:].is_monotonic_increasing if lows.shape[0] >= 3 else False
-        volume_ma_series = vol_ma(volume, 20)
-        last_volume = float(volume.iloc[-1])
-        last_volume_ma = float(volume_ma_series.iloc[-1])
+        # Same as ``is_monotonic_increasing`` on the last three lows: NaN fails.
+        higher_lows = (
+            low_values[-3] <= low_values[-2] <= low_values[-1] if low_values.shape[0] >= 3 else False
+        )
+        last_volume = float(volume[-1])
         breakout_trigger = last_high * (1 - self.breakout_buffer)
         breakout = last_close >= breakout_trigger
         volume_confirm = last_volume_ma > 0 and last_volume >= last_volume_ma * self.volume_multiplier
-        rsi_series = rsi(closes, 14)
-        last_rsi = float(rsi_series.iloc[-1])
 
         return {
-            "closes": closes,
+            "timestamp": arrays.index[-1],
             "last_close": last_close,
             "last_high": last_high,
             "last_low": last_low,
@@ -69,27 +81,9 @@ class _BaseFloorScenario(BaseScenario):
         }
 
 
-class FloorConsolidationUniversalScenario(_BaseFloorScenario):
-    id = "floor_consolidation_universal"
-    name = "Floor Consolidation (Universal)"
-    description = "Tight base with rising lows and breakout on volume."
-    default_params: Dict[str, float] = {"threshold": 55.0}
-
-    def evaluate(
-        self,
-        price_df: Optional[pd.DataFrame],
-        fundamentals: Optional[dict],
-        params: Optional[Dict[str, float]] = None,
+    def _score_snapshot(
+        self, context: ScenarioContext, snapshot: dict, threshold: float
     ) -> Tuple[Optional[ScanResult], List[TradeSignal]]:
-        context = self.build_context(price_df, fundamentals)
-        if context is None:
-            return None, []
-
-        snapshot = self._evaluate_common(context)
-        if snapshot is None:
-            return None, []
-
-        threshold = float({**self.default_params, **(params or {})}.get("threshold", 55.0))
         score = 25.0
         if snapshot["range_pct"] <= self.max_range_pct:
             score += 20.0
@@ -117,7 +111,7 @@ class FloorConsolidationUniversalScenario(_BaseFloorScenario):
             signals.append(
                 TradeSignal(
                     symbol=context.symbol,
-                    timestamp=snapshot["closes"].index[-1],
+                    timestamp=snapshot["timestamp"],
                     side="buy",
                     confidence=confidence,
                     reason="Floor breakout with volume",
@@ -147,6 +141,30 @@ class FloorConsolidationUniversalScenario(_BaseFloorScenario):
         return result, signals
 
 
+class FloorConsolidationUniversalScenario(_BaseFloorScenario):
+    id = "floor_consolidation_universal"
+    name = "Floor Consolidation (Universal)"
+    description = "Tight base with rising lows and breakout on volume."
+    default_params: Dict[str, float] = {"threshold": 55.0}
+
+    def evaluate(
+        self,
+        price_df: Optional[pd.DataFrame],
+        fundamentals: Optional[dict],
+        params: Optional[Dict[str, float]] = None,
+    ) -> Tuple[Optional[ScanResult], List[TradeSignal]]:
+        context = self.build_context(price_df, fundamentals)
+        if context is None:
+            return None, []
+
+        snapshot = self._evaluate_common(context)
+        if snapshot is None:
+            return None, []
+
+        threshold = float({**self.default_params, **(params or {})}.get("threshold", 55.0))
+        return self._score_snapshot(context, snapshot, threshold)
+
+
 class FloorConsolidationQualityScenario(_BaseFloorScenario):
     id = "floor_consolidation_quality"
     name = "Floor Consolidation (Quality)"
@@ -163,8 +181,7 @@ class FloorConsolidationQualityScenario(_BaseFloorScenario):
         if context is None:
             return None, []
 
-        snapshot = self._evaluate_common(context)
-        if snapshot is None or fundamentals is None:
+        if fundamentals is None:
             return None, []
 
         arguments = {**self.default_params, **(params or {})}
@@ -172,21 +189,19 @@ class FloorConsolidationQualityScenario(_BaseFloorScenario):
         quality_floor = float(arguments.get("quality_floor", 60.0))
         finance_floor = float(arguments.get("finance_floor", 55.0))
 
+        # The fundamental filter is cheap and rejects most symbols, so it
+        # runs before any indicator is computed.
         quality_score = score_quality(fundamentals)
         finance_score = score_finance(fundamentals)
-        fundamentals_ok = quality_score >= quality_floor and finance_score >= finance_floor
-
-        base_result, signals = FloorConsolidationUniversalScenario.evaluate(  # type: ignore[misc]
-            self,
-            price_df,
-            fundamentals,
-            {"threshold": threshold},
-        )
+        if quality_score < quality_floor or finance_score < finance_floor:
+            return None, []
 
-        if base_result is None:
+        snapshot = self._evaluate_common(context)
+        if snapshot is None:
             return None, []
 
-        if not fundamentals_ok:
+        base_result, signals = self._score_snapshot(context, snapshot, threshold)
+        if base_result is None:
             return None, []
 
         base_result.metrics.update({"quality_score": quality_score, "finance_score": finance_score})
@@ -2,29 +2,52 @@
 
 from __future__ import annotations
 
+import math
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
-from core.indicators import rsi, sma
+from core.indicators import _kernels, rsi_tail, sma_tail
+from core.indicators.stream import TrendStream
 from core.models import ScanResult, TradeSignal
 from core.scans.base import BaseScenario
 
 __all__ = ["GoldenCrossScenario"]
 
 
+def _trend_snapshot(
+    closes: np.ndarray, index: pd.Index, stream: Optional[TrendStream] = None
+) -> Tuple[float, float, float, float, float]:
+    """Return ``(prev_sma50, last_sma50, prev_sma200, last_sma200, last_rsi)``."""
+
+    if stream is not None:
+        return stream.update(closes, index)
+    if _kernels.NUMBA_AVAILABLE:
+        prev_fast, last_fast, prev_slow, last_slow, last_rsi = _kernels.trend_tail(closes, 50, 200, 14)
+        return prev_fast, last_fast, prev_slow, last_slow, float(last_rsi)
+    # The tail helpers share memoised series with the other trend scenarios.
+    prev_fast, last_fast = sma_tail(closes, 50, count=2)
+    prev_slow, last_slow = sma_tail(closes, 200, count=2)
+    return prev_fast, last_fast, prev_slow, last_slow, float(rsi_tail(closes, 14, count=1)[-1])
+
+
 class GoldenCrossScenario(BaseScenario):
     id = "golden_cross"
     name = "Golden Cross"
     description = "SMA50 crossing above SMA200 (buy) and below (sell)."
     default_params: Dict[str, float] = {"threshold": 45.0}
 
+    def create_stream_state(self) -> Optional[TrendStream]:
+        return TrendStream(50, 200, 14) if _kernels.NUMBA_AVAILABLE else None
+
     def evaluate(
         self,
         price_df: Optional[pd.DataFrame],
         fundamentals: Optional[dict],
         params: Optional[Dict[str, float]] = None,
+        *,
+        stream_state: Optional[TrendStream] = None,
     ) -> Tuple[Optional[ScanResult], List[TradeSignal]]:
         context = self.build_context(price_df, fundamentals)
         if context is None:
@@ -33,27 +56,22 @@ class GoldenCrossScenario(BaseScenario):
         arguments = {**self.default_params, **(params or {})}
         threshold = float(arguments.get("threshold", 45.0))
 
-        closes = context.series.close.dropna()
+        arrays = context.arrays
+        closes = arrays.close
         if closes.shape[0] < 210:
             return None, []
 
-        sma50 = sma(closes, 50)
-        sma200 = sma(closes, 200)
-        last_close = closes.iloc[-1]
-        last_sma50 = sma50.iloc[-1]
-        last_sma200 = sma200.iloc[-1]
-        prev_sma50 = sma50.iloc[-2]
-        prev_sma200 = sma200.iloc[-2]
+        prev_sma50, last_sma50, prev_sma200, last_sma200, last_rsi = _trend_snapshot(
+            closes, arrays.index, stream_state
+        )
+        last_close = closes[-1]
 
-        if np.isnan(last_sma200) or np.isnan(prev_sma200):
+        if math.isnan(last_sma200) or math.isnan(prev_sma200):
             return None, []
 
         golden_cross = prev_sma50 <= prev_sma200 and last_sma50 > last_sma200
         death_cross = prev_sma50 >= prev_sma200 and last_sma50 < last_sma200
 
-        rsi_series = rsi(closes, 14)
-        last_rsi = float(rsi_series.iloc[-1])
-
         score = 25.0
         if golden_cross:
             score += 25.0
@@ -88,7 +106,7 @@ class GoldenCrossScenario(BaseScenario):
             signals.append(
                 TradeSignal(
                     symbol=context.symbol,
-                    timestamp=closes.index[-1],
+                    timestamp=arrays.index[-1],
                     side="buy",
                     confidence=confidence,
                     reason="Golden cross triggered",
@@ -100,7 +118,7 @@ class GoldenCrossScenario(BaseScenario):
             signals.append(
                 TradeSignal(
                     symbol=context.symbol,
-                    timestamp=closes.index[-1],
+                    timestamp=arrays.index[-1],
                     side="sell",
                     confidence=confidence,
                     reason="Death cross triggered",
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import math
+from functools import cached_property
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
 from core.config import DEFAULT_CONFIG
-from core.indicators import rsi, sma
+from core.indicators import _kernels, rsi_tail, sma_tail
+from core.indicators.stream import TrendStream
 from core.models import ScanResult, TradeSignal
 from core.scans.base import BaseScenario
 from core.scoring import (
@@ -24,6 +27,43 @@ from core.scoring import (
 __all__ = ["LTICompounderScenario"]
 
 
+class _TrendTail:
+    """SMA-50, SMA-200 and RSI-14 at the last bar, computed on first access.
+
+    With a stream or Numba the three values come from one pass. The pandas
+    fallback computes each one separately, so values a code path never
+    reads are never computed.
+    """
+
+    def __init__(
+        self, closes: np.ndarray, index: pd.Index, stream: Optional[TrendStream] = None
+    ) -> None:
+        self._closes = closes
+        self._index = index
+        self._stream = stream
+        self._one_pass = stream is not None or _kernels.NUMBA_AVAILABLE
+
+    @cached_property
+    def _bundle(self) -> Tuple[float, float, float]:
+        if self._stream is not None:
+            _, last_sma50, _, last_sma200, last_rsi = self._stream.update(self._closes, self._index)
+            return last_sma50, last_sma200, last_rsi
+        _, last_sma50, _, last_sma200, last_rsi = _kernels.trend_tail(self._closes, 50, 200, 14)
+        return float(last_sma50), float(last_sma200), float(last_rsi)
+
+    @cached_property
+    def sma50(self) -> float:
+        return self._bundle[0] if self._one_pass else float(sma_tail(self._closes, 50, count=1)[-1])
+
+    @cached_property
+    def sma200(self) -> float:
+        return self._bundle[1] if self._one_pass else float(sma_tail(self._closes, 200, count=1)[-1])
+
+    @cached_property
+    def rsi(self) -> float:
+        return self._bundle[2] if self._one_pass else float(rsi_tail(self._closes, 14, count=1)[-1])
+
+
 class LTICompounderScenario(BaseScenario):
     id = "lti_compounder"
     name = "LTI Compounder"
@@ -33,11 +73,16 @@ class LTICompounderScenario(BaseScenario):
         "threshold": 60.0,
     }
 
+    def create_stream_state(self) -> Optional[TrendStream]:
+        return TrendStream(50, 200, 14) if _kernels.NUMBA_AVAILABLE else None
+
     def evaluate(
         self,
         price_df: Optional[pd.DataFrame],
         fundamentals: Optional[dict],
         params: Optional[Dict[str, object]] = None,
+        *,
+        stream_state: Optional[TrendStream] = None,
     ) -> Tuple[Optional[ScanResult], List[TradeSignal]]:
         context = self.build_context(price_df, fundamentals)
         if context is None or fundamentals is None:
@@ -63,46 +108,26 @@ class LTICompounderScenario(BaseScenario):
         timing, timing_reason = timing_modifier(context.price_df)
         final_score = float(np.clip(base_score + timing, 0.0, 100.0))
 
-        closes = context.series.close.dropna()
-        if closes.empty:
+        arrays = context.arrays
+        closes = arrays.close
+        if closes.shape[0] == 0:
             return None, []
 
-        sma50 = sma(closes, 50)
-        sma200 = sma(closes, 200)
-        last_close = float(closes.iloc[-1])
-        last_sma200 = float(sma200.iloc[-1]) if sma200.iloc[-1] == sma200.iloc[-1] else np.nan
-        last_sma50 = float(sma50.iloc[-1]) if sma50.iloc[-1] == sma50.iloc[-1] else np.nan
-        rsi_series = rsi(closes, 14)
-        last_rsi = float(rsi_series.iloc[-1])
-
-        reasons: List[str] = []
-        sorted_parts = sorted(parts.items(), key=lambda item: item[1], reverse=True)
-        for key, value in sorted_parts[:2]:
-            self._append_reason(reasons, f"{key.title()} score {value:.0f}")
-        if timing_reason:
-            self._append_reason(reasons, timing_reason)
-
-        metrics = {
-            "base_score": float(base_score),
-            "timing_modifier": float(timing),
-            "final_score": final_score,
-            "last_close": last_close,
-            "last_sma50": float(last_sma50),
-            "last_sma200": float(last_sma200),
-            "last_rsi": last_rsi,
-        }
-        metrics.update({f"score_{key}": float(value) for key, value in parts.items()})
+        trend = _TrendTail(closes, arrays.index, stream_state)
+        last_close = float(closes[-1])
 
         signals: List[TradeSignal] = []
         buy_trigger = final_score >= threshold and timing >= 0 and (
-            np.isnan(last_sma200) or last_close >= last_sma200 * 0.99
+            math.isnan(trend.sma200) or last_close >= trend.sma200 * 0.99
         )
 
-        prev_close = float(closes.iloc[-2]) if closes.shape[0] >= 2 else last_close
+        # Below the threshold only the sell check reads the indicators, and
+        # it needs the RSI only after a down close.
+        prev_close = float(closes[-2]) if closes.shape[0] >= 2 else last_close
         sell_trigger = False
-        if not np.isnan(last_sma200) and last_close < last_sma200 * 0.98:
+        if not math.isnan(trend.sma200) and last_close < trend.sma200 * 0.98:
             sell_trigger = True
-        elif last_rsi >= 75 and last_close < prev_close:
+        elif last_close < prev_close and trend.rsi >= 75:
             sell_trigger = True
 
         confidence = self._confidence_from_score(final_score, threshold)
@@ -110,7 +135,7 @@ class LTICompounderScenario(BaseScenario):
             signals.append(
                 TradeSignal(
                     symbol=context.symbol,
-                    timestamp=closes.index[-1],
+                    timestamp=arrays.index[-1],
                     side="buy",
                     confidence=confidence,
                     reason="Compounder profile aligned with timing",
@@ -122,7 +147,7 @@ class LTICompounderScenario(BaseScenario):
             signals.append(
                 TradeSignal(
                     symbol=context.symbol,
-                    timestamp=closes.index[-1],
+                    timestamp=arrays.index[-1],
                     side="sell",
                     confidence=sell_confidence,
                     reason="Trend deterioration for compounder",
@@ -132,6 +157,24 @@ class LTICompounderScenario(BaseScenario):
 
         result = None
         if final_score >= threshold:
+            reasons: List[str] = []
+            sorted_parts = sorted(parts.items(), key=lambda item: item[1], reverse=True)
+            for key, value in sorted_parts[:2]:
+                self._append_reason(reasons, f"{key.title()} score {value:.0f}")
+            if timing_reason:
+                self._append_reason(reasons, timing_reason)
+
+            metrics = {
+                "base_score": float(base_score),
+                "timing_modifier": float(timing),
+                "final_score": final_score,
+                "last_close": last_close,
+                "last_sma50": float(trend.sma50),
+                "last_sma200": float(trend.sma200),
+                "last_rsi": trend.rsi,
+            }
+            metrics.update({f"score_{key}": float(value) for key, value in parts.items()})
+
             result = ScanResult(
                 symbol=context.symbol,
                 score=final_score,
@@ -7,13 +7,51 @@ from typing import Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 
-from core.indicators import bollinger, keltner_channels, vol_ma
+from core.indicators import _kernels, bollinger, keltner_channels, vol_ma
 from core.models import ScanResult, TradeSignal
+from core.scans._batch import batch_bollinger, batch_keltner, batch_sma
 from core.scans.base import BaseScenario
 
 __all__ = ["VolatilitySqueezeScenario"]
 
 
+def _squeeze_snapshot(
+    closes: np.ndarray, highs: np.ndarray, lows: np.ndarray, volume: np.ndarray, lookback: int
+) -> Optional[Tuple[np.ndarray, float, float, float, float, float, float]]:
+    """Return the recent Bollinger widths and the last band values.
+
+    The values are ``(recent_width, upper, lower, width, kc_upper, kc_lower,
+    volume_ma20)``, where *recent_width* is ``width[-lookback:]`` and may
+    hold NaN. ``None`` means no Bollinger width is defined at all.
+    """
+
+    if _kernels.NUMBA_AVAILABLE:
+        count = len(range(closes.shape[0])[-lookback:])
+        tail, widths = _kernels.squeeze_tail(
+            closes, highs, lows, volume, 20, 2.0, (20 - 1) / 2, 10, 1.5, 20, max(count, 1)
+        )
+        if widths == 0:
+            return None
+        last = tail[:, -1]
+        return tail[2, tail.shape[1] - count:], last[0], last[1], last[2], last[3], last[4], last[5]
+
+    bb = bollinger(closes, window=20)[["upper", "lower", "width"]].to_numpy()
+    kc = keltner_channels(highs, lows, closes, window=20, atr_window=10, multiplier=1.5)
+    kc_upper, kc_lower = kc["upper"].to_numpy(), kc["lower"].to_numpy()
+    width = bb[:, 2]
+    if np.isnan(width).all():
+        return None
+    return (
+        width[-lookback:],
+        bb[-1, 0],
+        bb[-1, 1],
+        width[-1],
+        kc_upper[-1],
+        kc_lower[-1],
+        vol_ma(volume, 20).to_numpy()[-1],
+    )
+
+
 class VolatilitySqueezeScenario(BaseScenario):
     id = "volatility_squeeze"
     name = "Volatility Squeeze"
@@ -24,6 +62,7 @@ class VolatilitySqueezeScenario(BaseScenario):
         "width_percentile": 0.25,
         "volume_multiplier": 1.2,
     }
+    supports_batch = True
 
     def evaluate(
         self,
@@ -41,48 +80,37 @@ class VolatilitySqueezeScenario(BaseScenario):
         width_percentile = float(arguments.get("width_percentile", 0.25))
         volume_multiplier = float(arguments.get("volume_multiplier", 1.2))
 
-        closes = context.series.close.dropna()
-        highs = context.series.high.reindex(closes.index)
-        lows = context.series.low.reindex(closes.index)
-        volume = context.series.volume.reindex(closes.index) if context.series.volume is not None else None
-
-        if closes.shape[0] < max(lookback, 40) or volume is None or volume.isna().all():
+        # Dropping missing closes cannot lengthen the history, so short
+        # series are rejected before the aligned arrays are built.
+        if context.series.close.shape[0] < max(lookback, 40):
             return None, []
 
-        bb = bollinger(closes, window=20)
-        kc = keltner_channels(highs, lows, closes, window=20, atr_window=10, multiplier=1.5)
+        arrays = context.arrays
+        closes, volume = arrays.close, arrays.volume
 
-        width = bb["width"]
-        if width.isna().all():
+        if closes.shape[0] < max(lookback, 40) or volume is None or np.isnan(volume).all():
             return None, []
 
-        recent_width = width.iloc[-lookback:]
-        width_floor = np.nanpercentile(recent_width.dropna(), width_percentile * 100)
+        snapshot = _squeeze_snapshot(closes, arrays.high, arrays.low, volume, lookback)
+        if snapshot is None:
+            return None, []
+        recent_width, last_upper, last_lower, last_width, last_kc_upper, last_kc_lower, last_volume_ma = snapshot
 
-        last_close = closes.iloc[-1]
-        last_upper = bb["upper"].iloc[-1]
-        last_lower = bb["lower"].iloc[-1]
-        last_kc_upper = kc["upper"].iloc[-1]
-        last_kc_lower = kc["lower"].iloc[-1]
-        last_width = width.iloc[-1]
+        recent_width = recent_width[~np.isnan(recent_width)]
+        # np.percentile selects with np.partition; on NaN-free data it equals
+        # np.nanpercentile without its masking passes.
+        width_floor = np.percentile(recent_width, width_percentile * 100) if recent_width.size else np.nan
 
+        last_close = closes[-1]
         squeeze_active = last_width <= width_floor and last_upper <= last_kc_upper and last_lower >= last_kc_lower
 
-        volume_ma_series = vol_ma(volume, 20)
-        last_volume_ma = volume_ma_series.iloc[-1]
-        last_volume = volume.iloc[-1]
+        last_volume = volume[-1]
         volume_confirm = last_volume_ma > 0 and last_volume >= last_volume_ma * volume_multiplier
 
         breakout_up = last_close > max(last_upper, last_kc_upper)
         breakout_down = last_close < min(last_lower, last_kc_lower)
 
-        score = 35.0
-        if squeeze_active:
-            score += 25.0
-        if breakout_up or breakout_down:
-            score += 20.0
-        if volume_confirm:
-            score += 15.0
+        score = 35.0 + 25.0 * squeeze_active + 20.0 * (breakout_up or breakout_down) + 15.0 * volume_confirm
         score = float(np.clip(score, 0.0, 100.0))
 
         reasons: List[str] = []
@@ -110,7 +138,7 @@ class VolatilitySqueezeScenario(BaseScenario):
             signals.append(
                 TradeSignal(
                     symbol=context.symbol,
-                    timestamp=closes.index[-1],
+                    timestamp=arrays.index[-1],
                     side="buy",
                     confidence=confidence,
                     reason="Squeeze breakout to the upside",
@@ -122,7 +150,7 @@ class VolatilitySqueezeScenario(BaseScenario):
             signals.append(
                 TradeSignal(
                     symbol=context.symbol,
-                    timestamp=closes.index[-1],
+                    timestamp=arrays.index[-1],
                     side="sell",
                     confidence=confidence,
                     reason="Squeeze breakdown to the downside",
@@ -144,3 +172,53 @@ class VolatilitySqueezeScenario(BaseScenario):
 
         return result, signals
 
+    def evaluate_batch(
+        self,
+        closes: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        volumes: np.ndarray,
+        params: Optional[Dict[str, float]] = None,
+    ) -> Optional[np.ndarray]:
+        arguments = {**self.default_params, **(params or {})}
+        lookback = int(arguments.get("lookback", 120))
+        width_percentile = float(arguments.get("width_percentile", 0.25))
+        volume_multiplier = float(arguments.get("volume_multiplier", 1.2))
+
+        # A negative lookback slices from the start of each history, which
+        # left-padded rows cannot reproduce.
+        if lookback < 0:
+            return None
+        if closes.shape[1] < max(lookback, 40):
+            return self._batch_rejected(closes.shape[0])
+
+        bands = batch_bollinger(closes, window=20)
+        channels = batch_keltner(highs, lows, closes, window=20, atr_window=10, multiplier=1.5)
+        width = bands[3]
+        valid = (
+            (self._history_lengths(closes) >= max(lookback, 40))
+            & ~np.isnan(volumes).all(axis=1)
+            & ~np.isnan(width).all(axis=1)
+        )
+
+        width_floor = np.full(closes.shape[0], np.nan)
+        if valid.any():
+            # Padding is NaN, so nanpercentile sees each row's own recent bars.
+            width_floor[valid] = np.nanpercentile(width[valid, -lookback:], width_percentile * 100, axis=1)
+
+        last_close = closes[:, -1]
+        last_upper, last_lower, last_width = bands[1, :, -1], bands[2, :, -1], width[:, -1]
+        last_kc_upper, last_kc_lower = channels[1, :, -1], channels[2, :, -1]
+        squeeze_active = (last_width <= width_floor) & (last_upper <= last_kc_upper) & (last_lower >= last_kc_lower)
+
+        last_volume_ma = batch_sma(volumes, 20)[:, -1]
+        volume_confirm = (last_volume_ma > 0) & (volumes[:, -1] >= last_volume_ma * volume_multiplier)
+
+        # Builtin max/min keep the first argument when the second is NaN.
+        breakout_up = last_close > np.where(last_kc_upper > last_upper, last_kc_upper, last_upper)
+        breakout_down = last_close < np.where(last_kc_lower < last_lower, last_kc_lower, last_lower)
+
+        score = self._flag_score(
+            35.0, [squeeze_active, breakout_up | breakout_down, volume_confirm], [25.0, 20.0, 15.0]
+        )
+        return self._batch_screen(score, (breakout_up | breakout_down) & volume_confirm, valid)
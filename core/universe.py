@@ -2,18 +2,28 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-import gzip
 import io
 from pathlib import Path
+import re
 import time
 
 import pandas as pd
 import requests
 
+try:  # Optional: Arrow-backed strings keep the symbol filters vectorised.
+    import pyarrow
+except ImportError:  # pragma: no cover - pyarrow not installed
+    pyarrow = None
+
 
 DEFAULT_UNIVERSE = "us-all"
 DEFAULT_REFRESH_SECS = 7 * 24 * 3600
+_SYMBOL_DTYPE = "string[pyarrow]" if pyarrow is not None else object
+# Index (``^``), futures/FX (``=``), preferred (``$``) and dotted class or unit
+# listings. With dotted symbols dropped there is nothing to rewrite to dashes.
+_UNTRADABLE_SYMBOL = re.compile(r"[\^=$.]")
 
 
 @dataclass(frozen=True)
@@ -34,11 +44,9 @@ class UniverseLoader:
 
     def load(self, spec: UniverseSpec) -> pd.Series:
         cache_file = self.cache_dir / f"{spec.name}.csv"
-        if cache_file.exists():
-            age = time.time() - cache_file.stat().st_mtime
-            if age < spec.refresh_secs:
-                series = pd.read_csv(cache_file)["symbol"]
-                return series.iloc[: spec.max_count] if spec.max_count else series
+        cached = self._read_cached(spec, cache_file)
+        if cached is not None:
+            return cached.iloc[: spec.max_count] if spec.max_count else cached
 
         if spec.name == "us-all":
             series = self._load_us_all()
@@ -53,22 +61,49 @@ class UniverseLoader:
         else:  # pragma: no cover - guarded by CLI/UI options
             raise ValueError(f"Unknown universe: {spec.name}")
 
-        processed = self._postprocess_symbols(series)
-        processed.iloc[: spec.max_count].to_frame("symbol").to_csv(cache_file, index=False)
+        processed = self._postprocess_symbols(series, limit=spec.max_count or None)
+        frame = processed.iloc[: spec.max_count].to_frame("symbol")
+        if pyarrow is not None:
+            frame.to_feather(cache_file.with_suffix(".feather"), compression="zstd")
+        else:
+            frame.to_csv(cache_file, index=False)
         return processed.iloc[: spec.max_count] if spec.max_count else processed
 
+    def _read_cached(self, spec: UniverseSpec, cache_file: Path) -> pd.Series | None:
+        # Feather is written when pyarrow is available. CSV files remain
+        # readable: caches from earlier versions and ``custom.csv``, which
+        # takes precedence whenever it was edited after the Feather file.
+        candidates = [cache_file]
+        if pyarrow is not None:
+            candidates.append(cache_file.with_suffix(".feather"))
+        stamps = [(path.stat().st_mtime, path) for path in candidates if path.exists()]
+        if not stamps:
+            return None
+        mtime, path = max(stamps)
+        if time.time() - mtime >= spec.refresh_secs:
+            return None
+        if path.suffix == ".feather":
+            return pd.read_feather(path, columns=["symbol"])["symbol"].astype(_SYMBOL_DTYPE)
+        return pd.read_csv(path, dtype={"symbol": _SYMBOL_DTYPE}, memory_map=True)["symbol"]
+
     # ------------------------------------------------------------------
     # Universe sources
     # ------------------------------------------------------------------
     def _load_us_all(self) -> pd.Series:
-        nasdaq = self._download_csv_like(
-            "https://ftp.nasdaqtrader.com/dynamic/SymDir/nasdaqtraded.txt",
-            sep="|",
-        )
-        other = self._download_csv_like(
-            "https://ftp.nasdaqtrader.com/dynamic/SymDir/otherlisted.txt",
-            sep="|",
-        )
+        # Both files are fetched at once; the refresh is bound by latency.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            nasdaq_future = executor.submit(
+                self._download_csv_like,
+                "https://ftp.nasdaqtrader.com/dynamic/SymDir/nasdaqtraded.txt",
+                sep="|",
+            )
+            other_future = executor.submit(
+                self._download_csv_like,
+                "https://ftp.nasdaqtrader.com/dynamic/SymDir/otherlisted.txt",
+                sep="|",
+            )
+            nasdaq = nasdaq_future.result()
+            other = other_future.result()
 
         nasdaq.columns = [col.lower() for col in nasdaq.columns]
         other.columns = [col.lower() for col in other.columns]
@@ -76,7 +111,7 @@ class UniverseLoader:
         sym1 = nasdaq.get("symbol") or nasdaq.get("nasdaq symbol")
         sym2 = other.get("symbol") or other.get("act symbol")
 
-        combined = pd.concat([sym1, sym2], ignore_index=True).dropna().astype(str).str.upper()
+        combined = pd.concat([sym1, sym2], ignore_index=True).dropna().astype(_SYMBOL_DTYPE).str.upper()
         return combined.drop_duplicates()
 
     def _load_nasdaq_only(self) -> pd.Series:
@@ -86,7 +121,7 @@ class UniverseLoader:
         )
         df.columns = [col.lower() for col in df.columns]
         sym = df.get("symbol") or df.get("nasdaq symbol")
-        return sym.dropna().astype(str).str.upper().drop_duplicates()
+        return sym.dropna().astype(_SYMBOL_DTYPE).str.upper().drop_duplicates()
 
     def _load_nyse_only(self) -> pd.Series:
         df = self._download_csv_like(
@@ -95,36 +130,82 @@ class UniverseLoader:
         )
         df.columns = [col.lower() for col in df.columns]
         sym = df.get("symbol") or df.get("act symbol")
-        return sym.dropna().astype(str).str.upper().drop_duplicates()
+        return sym.dropna().astype(_SYMBOL_DTYPE).str.upper().drop_duplicates()
 
     def _load_sp500(self) -> pd.Series:
-        tables = pd.read_html("https://en.wikipedia.org/wiki/List_of_S%26P_500_companies")
+        # Only tables mentioning the symbol column are turned into frames.
+        tables = pd.read_html(
+            "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies",
+            match="Symbol|Ticker symbol",
+        )
         frame = tables[0]
         column = "Symbol" if "Symbol" in frame.columns else "Ticker symbol"
-        return frame[column].astype(str).str.upper().drop_duplicates()
+        return frame[column].astype(_SYMBOL_DTYPE).str.upper().drop_duplicates()
 
     def _load_custom(self, path: Path) -> pd.Series:
         if path.exists():
-            return pd.read_csv(path)["symbol"].astype(str).str.upper().drop_duplicates()
-        return pd.Series(dtype=str)
+            return pd.read_csv(path)["symbol"].astype(_SYMBOL_DTYPE).str.upper().drop_duplicates()
+        return pd.Series(dtype=_SYMBOL_DTYPE)
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
     def _download_csv_like(self, url: str, sep: str = ",") -> pd.DataFrame:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        content = response.content
-        if url.endswith(".gz") or content[:2] == b"\x1f\x8b":
-            content = gzip.decompress(content)
-        buffer = io.StringIO(content.decode("utf-8", errors="replace"))
-        return pd.read_csv(buffer, sep=sep)
-
-    def _postprocess_symbols(self, series: pd.Series) -> pd.Series:
-        cleaned = series[~series.str.contains(r"[\^=]", regex=True)]
-        cleaned = cleaned[~cleaned.str.contains(r"\$", regex=True)]
-        cleaned = cleaned[~cleaned.str.contains(r"\.", regex=True)]
-        cleaned = cleaned.str.replace(".", "-", regex=False)
-        cleaned = cleaned.drop_duplicates().sort_values(kind="stable").reset_index(drop=True)
-        return cleaned
+        # The body is parsed as it arrives instead of being held as bytes
+        # and again as text.
+        with requests.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            # Keep the raw stream open at EOF so the buffered wrapper can drain.
+            response.raw.auto_close = False
+            stream = io.BufferedReader(response.raw)
+            gzipped = url.endswith(".gz") or stream.peek(2)[:2] == b"\x1f\x8b"
+            compression = "gzip" if gzipped else None
+            if pyarrow is None:
+                return pd.read_csv(
+                    stream, sep=sep, compression=compression, encoding="utf-8", encoding_errors="replace"
+                )
+            frame = pd.read_csv(stream, sep=sep, compression=compression, engine="pyarrow")
+        # Arrow keeps columns holding invalid UTF-8 as bytes; decode them with
+        # the replacement the C parser applies.
+        for column in frame.columns:
+            values = frame[column]
+            if values.dtype == object:
+                present = values.dropna()
+                if not present.empty and isinstance(present.iloc[0], bytes):
+                    frame[column] = values.str.decode("utf-8", errors="replace")
+        return frame
+
+    def _postprocess_symbols(self, series: pd.Series, limit: int | None = None) -> pd.Series:
+        """Return the sorted, unique tradable symbols, at most *limit* of them.
+
+        With a *limit* the raw list is sorted first and filtered in growing
+        blocks until enough symbols survive, which yields the same first
+        *limit* symbols as filtering everything.
+        """
+
+        if limit is None:
+            # Only the distinct symbols are sorted; with Arrow strings both the
+            # hashing and the sort run as compute kernels.
+            unique = pd.Series(self._drop_untradable(series).unique(), dtype=series.dtype)
+            return unique.sort_values(kind="stable", ignore_index=True)
+
+        ordered = series.sort_values(kind="stable")
+        cleaned = ordered.iloc[:0]
+        start, block = 0, max(limit, 256)
+        while start < ordered.shape[0]:
+            kept = self._drop_untradable(ordered.iloc[start : start + block])
+            cleaned = pd.concat([cleaned, kept]).drop_duplicates()
+            if cleaned.shape[0] >= limit:
+                break
+            start += block
+            block *= 2
+        return cleaned.iloc[:limit].reset_index(drop=True)
+
+    @staticmethod
+    def _drop_untradable(series: pd.Series) -> pd.Series:
+        # Missing symbols count as matches and are dropped with the rest. The
+        # pattern goes in as text: Arrow strings reject compiled patterns on
+        # pandas 2.2.
+        return series[~series.str.contains(_UNTRADABLE_SYMBOL.pattern, regex=True, na=True)]
 
@@ -0,0 +1,128 @@
+"""Work-stealing executor for many small, independent scan tasks."""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future
+from queue import SimpleQueue
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+__all__ = ["WorkStealingExecutor"]
+
+_WorkItem = Tuple["Future[Any]", Callable[..., Any], Tuple[Any, ...], dict]
+
+
+class WorkStealingExecutor(Executor):
+    """Executor with a deque per worker plus a shared injection queue.
+
+    Tasks submitted from outside the pool go onto the shared FIFO queue. Tasks
+    submitted by a running task are pushed onto that worker's own deque and
+    popped LIFO, so follow-up work stays on the same thread. Idle workers
+    drain the shared queue first and then steal the oldest task from a
+    neighbour.
+    """
+
+    def __init__(self, max_workers: int = 4, thread_name_prefix: str = "rectifex-worker") -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+
+        self._injector: Deque[Optional[_WorkItem]] = deque()
+        self._locals: List[Deque[_WorkItem]] = [deque() for _ in range(max_workers)]
+        # One permit per queued item (sentinels included): a worker that
+        # takes a permit is guaranteed to find an item in some queue. A
+        # SimpleQueue is used as the counter because it blocks in C, unlike
+        # threading.Semaphore.
+        self._permits: SimpleQueue[None] = SimpleQueue()
+        self._shutdown_lock = threading.Lock()
+        self._shutdown = False
+        self._worker_index = threading.local()
+        self._threads = [
+            threading.Thread(
+                target=self._work,
+                args=(index,),
+                name=f"{thread_name_prefix}-{index}",
+                daemon=True,
+            )
+            for index in range(max_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    # ------------------------------------------------------------------
+    # Executor interface
+    # ------------------------------------------------------------------
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> "Future[Any]":
+        future: Future[Any] = Future()
+        item: _WorkItem = (future, fn, args, kwargs)
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            index = getattr(self._worker_index, "value", None)
+            if index is None:
+                self._injector.append(item)
+            else:
+                self._locals[index].append(item)
+            self._permits.put(None)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._shutdown_lock:
+            if not self._shutdown:
+                self._shutdown = True
+                if cancel_futures:
+                    # Queued items stay in place; workers skip cancelled futures.
+                    for queue in (self._injector, *self._locals):
+                        for item in list(queue):
+                            if item is not None:
+                                item[0].cancel()
+                for _ in self._threads:
+                    self._injector.append(None)
+                    self._permits.put(None)
+
+        if wait:
+            current = threading.current_thread()
+            for thread in self._threads:
+                if thread is not current:
+                    thread.join()
+
+    # ------------------------------------------------------------------
+    # Worker loop
+    # ------------------------------------------------------------------
+    def _work(self, index: int) -> None:
+        self._worker_index.value = index
+        while True:
+            self._permits.get()
+            item = self._take(index)
+            if item is None:
+                return
+
+            future, fn, args, kwargs = item
+            del item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+            del future, fn, args, kwargs
+
+    def _take(self, index: int) -> Optional[_WorkItem]:
+        own = self._locals[index]
+        count = len(self._locals)
+        while True:
+            try:
+                return own.pop()
+            except IndexError:
+                pass
+            try:
+                return self._injector.popleft()
+            except IndexError:
+                pass
+            for offset in range(1, count):
+                try:
+                    return self._locals[(index + offset) % count].popleft()
+                except IndexError:
+                    continue
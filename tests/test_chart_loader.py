@@ -74,3 +74,30 @@ def test_chart_provider_falls_back_to_stale_when_fetch_fails(tmp_path) -> None:
     loaded = provider.load("TEST", "1y")
     assert loaded is not None
     pd.testing.assert_frame_equal(loaded, stale_frame)
+
+
+class DummyCache:
+    def __init__(self, frame: Optional[pd.DataFrame], stale: bool) -> None:
+        self._frame = frame
+        self._stale = stale
+
+    def get(self, symbol: str, period: str) -> Optional[pd.DataFrame]:
+        return self._frame
+
+    def is_stale(self, symbol: str, period: str, ttl_days: Optional[int] = None) -> bool:
+        return self._stale
+
+
+def test_chart_provider_load_cached_never_fetches() -> None:
+    frame = _sample_frame()
+    fetcher = DummyFetcher({"TEST": frame})
+
+    fresh_provider = ChartDataProvider(cache=DummyCache(frame, stale=False), fetcher=fetcher)  # type: ignore[arg-type]
+    loaded = fresh_provider.load_cached("TEST", "1y")
+    assert loaded is not None
+    assert loaded.attrs["symbol"] == "TEST"
+    pd.testing.assert_frame_equal(loaded, frame)
+
+    stale_provider = ChartDataProvider(cache=DummyCache(frame, stale=True), fetcher=fetcher)  # type: ignore[arg-type]
+    assert stale_provider.load_cached("TEST", "1y") is None
+    assert fetcher.calls == []
@@ -50,3 +50,75 @@ def test_prepare_export_frames_structures_results_and_signals() -> None:
     assert not signals_df.empty
     assert signals_df.loc[0, "Symbol"] == "TEST"
     assert signals_df.loc[0, "Scenario"] == "lti_compounder"
+
+
+def test_prepare_export_frames_reuses_streamed_records() -> None:
+    row = ResultRow(result=_result(), signals=[_signal()])
+    record = MainWindow._export_record(_result())
+    rebuilt_df, _ = MainWindow._prepare_export_frames([row], {})
+    cached_df, _ = MainWindow._prepare_export_frames([row], {}, records=[record])
+
+    pd.testing.assert_frame_equal(rebuilt_df, cached_df)
+    assert cached_df.loc[0, "Market Cap"] == 1.5e10
+
+
+def test_write_excel_streams_sheets(tmp_path) -> None:
+    openpyxl = pytest.importorskip("openpyxl")
+    row = ResultRow(result=_result(), signals=[_signal()])
+    results_df, signals_df = MainWindow._prepare_export_frames([row], {})
+    results_df.loc[0, "metric_alpha"] = float("nan")
+    path = tmp_path / "export.xlsx"
+
+    MainWindow._write_excel(path, [("Results", results_df), ("Signals", signals_df)])
+
+    workbook = openpyxl.load_workbook(path)
+    assert workbook.sheetnames == ["Results", "Signals"]
+    rows = list(workbook["Results"].iter_rows(values_only=True))
+    assert rows[0] == tuple(results_df.columns)
+    record = dict(zip(rows[0], rows[1]))
+    assert record["Symbol"] == "TEST"
+    assert record["Score"] == 87.5
+    assert record["metric_alpha"] is None
+    assert workbook["Signals"].max_row == 2
+
+
+def test_results_frame_fills_missing_metrics_and_meta() -> None:
+    other = ScanResult(
+        symbol="OTHER",
+        score=91.0,
+        metrics={"beta": 0.7},
+        reasons=["Breakout"],
+        last_price=10.0,
+        as_of=datetime(2024, 5, 1, 15, 30),
+    )
+    rows = [ResultRow(result=_result(), signals=[]), ResultRow(result=other, signals=[])]
+    records = [MainWindow._export_record(row.result) for row in rows]
+
+    rebuilt_df, _ = MainWindow._prepare_export_frames(rows, {})
+    cached_df, _ = MainWindow._prepare_export_frames(rows, {}, records=records)
+
+    assert list(rebuilt_df["Symbol"]) == ["OTHER", "TEST"]
+    assert pd.isna(rebuilt_df.loc[0, "metric_alpha"])
+    assert pd.isna(rebuilt_df.loc[0, "Name"])
+    assert rebuilt_df.loc[1, "Name"] == "Test Corp"
+    pd.testing.assert_frame_equal(rebuilt_df, cached_df[rebuilt_df.columns])
+
+
+def test_write_csv_matches_dataframe_export(tmp_path) -> None:
+    other = ScanResult(
+        symbol="OTHER",
+        score=91.0,
+        metrics={"beta": float("nan")},
+        reasons=["Breakout"],
+        last_price=10.0,
+        as_of=datetime(2024, 5, 1, 15, 30),
+    )
+    records = [MainWindow._export_record(_result()), MainWindow._export_record(other)]
+    streamed = tmp_path / "streamed.csv"
+    expected = tmp_path / "expected.csv"
+
+    MainWindow._write_csv(streamed, records)
+    results_df, _ = MainWindow._prepare_export_frames([], {}, records=records)
+    results_df.to_csv(expected, index=False)
+
+    assert streamed.read_text(encoding="utf-8") == expected.read_text(encoding="utf-8")
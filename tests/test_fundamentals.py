@@ -1,8 +1,11 @@
 import math
 
 import numpy as np
+import pandas as pd
+import pytest
 
-from core.data.fundamentals import read_fundamentals
+import core.data.fundamentals as fundamentals_module
+from core.data.fundamentals import read_fundamentals, read_fundamentals_batch
 
 
 def test_read_fundamentals_parses_and_normalises_values():
@@ -70,3 +73,35 @@ def test_read_fundamentals_handles_missing_info():
 
     assert all(np.isnan(value) for value in fundamentals.values())
 
+
+@pytest.mark.parametrize("use_arrow", [True, False])
+def test_read_fundamentals_batch_matches_per_symbol_parsing(monkeypatch, use_arrow):
+    if use_arrow:
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setattr(fundamentals_module, "pc", None)
+    infos = {
+        "AAA": {"roe": "15.5%", "totalDebt": "1.2B", "beta": 1.1, "pb": "n/a", "marketCap": "$2,500"},
+        "BBB": {"roe": " 5 k%", "totalDebt": ["800M"], "beta": "abc", "averageVolume": "1e3k", "pb": "1\u0661"},
+        "CCC": None,
+    }
+
+    frame = read_fundamentals_batch(infos)
+
+    assert list(frame.index) == ["AAA", "BBB", "CCC"]
+    for symbol, info in infos.items():
+        expected = read_fundamentals(info)
+        row = frame.loc[symbol]
+        for key, value in expected.items():
+            if np.isnan(value):
+                assert np.isnan(row[key])
+            else:
+                assert row[key] == value
+
+
+def test_read_fundamentals_takes_first_present_frame_cell():
+    frame = pd.DataFrame({"2024": [np.nan, 2.0], "2023": ["1.5B", 1.0]}, index=["x", "y"])
+
+    fundamentals = read_fundamentals({"totalDebt": frame})
+
+    assert math.isclose(fundamentals["totalDebt"], 1.5e9, rel_tol=1e-9)
@@ -88,6 +88,13 @@ def test_obv_accumulates_volume():
     assert obv_series.iloc[2] == 0
 
 
+def test_obv_treats_missing_values_as_flat():
+    close = pd.Series([10, np.nan, 11, 12, 11], dtype=float)
+    volume = pd.Series([100, 100, 100, np.nan, 50], dtype=float)
+
+    assert indicators.obv(close, volume).tolist() == [0.0, 0.0, 0.0, 0.0, -50.0]
+
+
 def test_volume_moving_average():
     volume = pd.Series([10, 20, 30, 40], dtype=float)
     vol_avg = indicators.vol_ma(volume, window=2)
@@ -106,3 +113,246 @@ def test_keltner_channels_structure():
     valid = keltner.dropna()
     assert (valid["upper"] >= valid["mid"]).all()
     assert (valid["mid"] >= valid["lower"]).all()
+
+
+def _kernel_cases():
+    rng = np.random.default_rng(7)
+    walk = 100 + np.cumsum(rng.normal(size=400))
+    gappy = walk.copy()
+    gappy[rng.integers(0, walk.size, size=40)] = np.nan
+    gappy[:9] = np.nan
+    return [walk, gappy, np.round(walk), np.full(50, 3.0), np.repeat(walk[:40], 5), walk[:3]]
+
+
+@pytest.mark.parametrize("window", [1, 3, 14])
+def test_rsi_kernel_matches_pandas_reference(window):
+    from core.indicators import _kernels
+
+    kernels = [_kernels.rsi_wilder, getattr(_kernels.rsi_wilder, "py_func", _kernels.rsi_wilder)]
+    for values in _kernel_cases():
+        expected = indicators._rsi_pandas(pd.Series(values), window).to_numpy()
+        for kernel in kernels:
+            np.testing.assert_array_equal(kernel(values, window), expected)
+
+
+@pytest.mark.parametrize(("com", "min_periods"), [(0.0, 0), (4.5, 0), (13.0, 14), (1.0, 500)])
+def test_ewm_kernel_matches_pandas(com, min_periods):
+    from core.indicators import _kernels
+
+    kernels = [_kernels.ewm_mean, getattr(_kernels.ewm_mean, "py_func", _kernels.ewm_mean)]
+    for values in _kernel_cases() + [np.array([])]:
+        expected = pd.Series(values, dtype=float).ewm(com=com, adjust=False, min_periods=min_periods).mean()
+        for kernel in kernels:
+            np.testing.assert_array_equal(kernel(values, com, max(min_periods, 1)), expected.to_numpy())
+
+
+@pytest.mark.parametrize("window", [1, 3, 14])
+def test_atr_kernel_matches_pandas(window):
+    from core.indicators import _kernels
+
+    kernels = [_kernels.atr_wilder, getattr(_kernels.atr_wilder, "py_func", _kernels.atr_wilder)]
+    for values in _kernel_cases():
+        close = pd.Series(values)
+        high, low = close + 1.5, close - np.abs(np.sin(values))
+        prev_close = close.shift(1)
+        ranges = pd.concat([high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1)
+        expected = ranges.max(axis=1, skipna=False).ewm(alpha=1 / window, adjust=False, min_periods=window).mean()
+        for kernel in kernels:
+            result = kernel(high.to_numpy(), low.to_numpy(), close.to_numpy(), window)
+            np.testing.assert_array_equal(result, expected.to_numpy())
+
+
+@pytest.mark.parametrize("window", [1, 3, 14, 60])
+def test_rolling_extremes_match_pandas(window):
+    for values in _kernel_cases():
+        series = pd.Series(values)
+        rolling = series.rolling(window=window, min_periods=window)
+        pd.testing.assert_series_equal(indicators.rolling_max(series, window), rolling.max())
+        pd.testing.assert_series_equal(indicators.rolling_min(series, window), rolling.min())
+
+
+@pytest.mark.parametrize(("window", "min_periods"), [(1, 1), (3, 1), (20, 20), (20, 0)])
+def test_rolling_mean_kernel_matches_pandas(window, min_periods):
+    from core.indicators import _kernels
+
+    kernels = [_kernels.rolling_mean, getattr(_kernels.rolling_mean, "py_func", _kernels.rolling_mean)]
+    for values in _kernel_cases() + [np.array([])]:
+        expected = pd.Series(values, dtype=float).rolling(window=window, min_periods=min_periods).mean()
+        for kernel in kernels:
+            np.testing.assert_array_equal(kernel(values, window, min_periods), expected.to_numpy())
+
+
+@pytest.mark.parametrize("window", [1, 3, 20])
+def test_bollinger_kernel_matches_pandas(window):
+    from core.indicators import _kernels
+
+    kernels = [_kernels.bollinger_bands, getattr(_kernels.bollinger_bands, "py_func", _kernels.bollinger_bands)]
+    for values in _kernel_cases():
+        series = pd.Series(values)
+        mid = series.rolling(window=window, min_periods=window).mean()
+        std = series.rolling(window=window, min_periods=window).std(ddof=0)
+        expected = [mid, mid + 2.0 * std, mid - 2.0 * std, (mid + 2.0 * std) - (mid - 2.0 * std)]
+        for kernel in kernels:
+            bands = kernel(values, window, 2.0)
+            for row, column in zip(bands, expected):
+                np.testing.assert_array_equal(row, column.to_numpy())
+
+
+@pytest.mark.parametrize(("window", "atr_window"), [(1, 1), (20, 10), (5, 14)])
+def test_keltner_kernel_matches_pandas(window, atr_window):
+    from core.indicators import _kernels
+
+    kernels = [_kernels.keltner_bands, getattr(_kernels.keltner_bands, "py_func", _kernels.keltner_bands)]
+    for values in _kernel_cases():
+        close = pd.Series(values)
+        high, low = close + 1.5, close - np.abs(np.sin(values))
+        mid = close.ewm(span=window, adjust=False).mean()
+        prev_close = close.shift(1)
+        ranges = pd.concat([high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1)
+        atr = ranges.max(axis=1, skipna=False).ewm(alpha=1 / atr_window, adjust=False, min_periods=atr_window).mean()
+        expected = [mid, mid + 1.5 * atr, mid - 1.5 * atr]
+        for kernel in kernels:
+            bands = kernel(high.to_numpy(), low.to_numpy(), values, (window - 1) / 2, atr_window, 1.5)
+            for row, column in zip(bands, expected):
+                np.testing.assert_array_equal(row, column.to_numpy())
+
+
+def test_as_series_accepts_arrays_and_iterables():
+    expected = pd.Series([1.0, np.nan, 3.0])
+
+    pd.testing.assert_series_equal(indicators._as_series(np.array([1, np.nan, 3])), expected)
+    pd.testing.assert_series_equal(indicators._as_series([1, None, 3]), expected)
+    pd.testing.assert_series_equal(indicators._as_series(x for x in (1.0, np.nan, 3.0)), expected)
+    source = pd.Series([1.0, 2.0])
+    assert indicators._as_series(source) is source
+
+
+def test_tail_bundles_match_full_indicators():
+    from core.indicators import _kernels
+
+    for values in _kernel_cases():
+        close = pd.Series(values)
+        high, low = close + 1.0, close - 0.5
+        volume = pd.Series(np.arange(values.size, dtype=float) % 7 + 1)
+        volume[::11] = np.nan
+
+        trend = _kernels.trend_tail(values, 5, 20, 14)
+        fast, slow = indicators.sma(close, 5), indicators.sma(close, 20)
+        expected_trend = [np.nan, np.nan, np.nan, np.nan, np.nan]
+        if values.size >= 2:
+            expected_trend[0], expected_trend[2] = fast.iloc[-2], slow.iloc[-2]
+        expected_trend[1], expected_trend[3] = fast.iloc[-1], slow.iloc[-1]
+        expected_trend[4] = indicators.rsi(close, 14).iloc[-1]
+        np.testing.assert_array_equal(trend, expected_trend)
+
+        window = 30
+        ranges = _kernels.range_tail(values, high.to_numpy(), low.to_numpy(), volume.to_numpy(), window, 20, 14)
+        expected_range = [
+            indicators.rolling_max(high, window).iloc[-1],
+            indicators.rolling_min(low, window).iloc[-1],
+            indicators.vol_ma(volume, 20).iloc[-1],
+            indicators.rsi(close, 14).iloc[-1],
+        ]
+        np.testing.assert_array_equal(ranges, expected_range)
+
+
+@pytest.mark.parametrize("count", [1, 3, 500])
+def test_tail_helpers_match_full_series(count):
+    for values in _kernel_cases():
+        close = pd.Series(values)
+        high, low = close + 1.0, close - np.abs(np.cos(values))
+
+        np.testing.assert_array_equal(
+            indicators.rsi_tail(close, 14, count), indicators.rsi(close, 14).to_numpy()[-count:]
+        )
+        np.testing.assert_array_equal(
+            indicators.sma_tail(close, 5, count), indicators.sma(close, 5).to_numpy()[-count:]
+        )
+        bands = indicators.bollinger(close, 20)[["mid", "upper", "lower", "width"]].to_numpy()
+        np.testing.assert_array_equal(indicators.bollinger_tail(close, 20, count=count), bands[-count:].T)
+        percent = indicators.stoch(high, low, close)[["%K", "%D"]].to_numpy()
+        np.testing.assert_array_equal(indicators.stoch_tail(high, low, close, count=count), percent[-count:].T)
+
+
+def test_kernel_warmup_runs():
+    from core.indicators import _kernels
+
+    _kernels.warmup()
+
+
+def test_squeeze_tail_matches_full_indicators():
+    from core.indicators import _kernels
+
+    for values in _kernel_cases():
+        close = pd.Series(values)
+        high, low = close + 1.0, close - np.abs(np.cos(values))
+        volume = pd.Series(np.arange(values.size, dtype=float) % 5 + 1)
+        tail, widths = _kernels.squeeze_tail(
+            values, high.to_numpy(), low.to_numpy(), volume.to_numpy(), 20, 2.0, 9.5, 10, 1.5, 20, 30
+        )
+        bands = indicators.bollinger(close, 20)
+        channels = indicators.keltner_channels(high, low, close, window=20, atr_window=10, multiplier=1.5)
+        expected = [
+            bands["upper"],
+            bands["lower"],
+            bands["width"],
+            channels["upper"],
+            channels["lower"],
+            indicators.vol_ma(volume, 20),
+        ]
+        for row, column in zip(tail, expected):
+            np.testing.assert_array_equal(row, column.to_numpy()[-30:])
+        assert widths == bands["width"].notna().sum()
+
+
+def test_indicator_cache_memoises_by_content_and_evicts():
+    from core.indicators.cache import IndicatorCache
+
+    cache = IndicatorCache(maxsize=2)
+    calls = []
+
+    def compute(tag):
+        def run():
+            calls.append(tag)
+            return np.array([float(len(calls))])
+
+        return run
+
+    first = np.arange(5, dtype=float)
+    value = cache.get_or_compute("sma", (first,), (3,), compute("a"))
+    assert cache.get_or_compute("sma", (first.copy(),), (3,), compute("b")) is value
+    assert not value.flags.writeable
+    cache.get_or_compute("sma", (first,), (4,), compute("c"))
+    cache.get_or_compute("sma", (first + 1,), (3,), compute("d"))
+    assert len(cache) == 2
+    cache.get_or_compute("sma", (first,), (3,), compute("e"))
+    assert calls == ["a", "c", "d", "e"]
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_trend_stream_matches_full_recomputation():
+    from core.indicators import _kernels
+    from core.indicators.stream import TrendStream
+
+    values = 100 + np.cumsum(np.sin(np.arange(420) * 0.37))
+    index = pd.date_range("2020-01-01", periods=420, freq="D")
+    stream = TrendStream(50, 200, 14)
+    assert np.isnan(stream.update(values[:0], index[:0])).all()
+    for end in (1, 2, 150, 151, 151, 260, 400):
+        expected = _kernels.trend_tail(values[:end], 50, 200, 14)
+        np.testing.assert_array_equal(stream.update(values[:end], index[:end]), expected)
+    assert len(stream) == 399
+
+    # A revised last bar is peeked again; a revised committed bar restarts.
+    revised = values[:400].copy()
+    revised[-1] += 1.0
+    np.testing.assert_array_equal(stream.update(revised, index[:400]), _kernels.trend_tail(revised, 50, 200, 14))
+    revised[-2] += 1.0
+    np.testing.assert_array_equal(stream.update(revised, index[:400]), _kernels.trend_tail(revised, 50, 200, 14))
+    np.testing.assert_array_equal(stream.update(values[:400], index[:400]), _kernels.trend_tail(values[:400], 50, 200, 14))
+
+    # A window that dropped its first bars continues from the bars consumed.
+    shifted = stream.update(values[20:405], index[20:405])
+    np.testing.assert_array_equal(shifted, _kernels.trend_tail(values[:405], 50, 200, 14))
+    assert len(stream) == 404
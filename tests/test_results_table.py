@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+try:
+    import PyQt6.QtWidgets  # noqa: F401
+except Exception:  # pragma: no cover - environment without Qt libraries
+    pytest.skip("PyQt6 is required for results table tests", allow_module_level=True)
+
+from PyQt6 import QtCore
+
+from app.ui.components.results_table import ResultsTableModel
+from core.models import ScanResult, TradeSignal
+
+
+def _result(symbol: str, score: float = 70.0) -> ScanResult:
+    return ScanResult(
+        symbol=symbol,
+        score=score,
+        metrics={},
+        reasons=["Momentum confirmed", "Volume expansion"],
+        last_price=101.234,
+        as_of=datetime(2024, 5, 1, 15, 30),
+    )
+
+
+def _signal(symbol: str, side: str = "buy") -> TradeSignal:
+    return TradeSignal(
+        symbol=symbol,
+        timestamp=pd.Timestamp("2024-05-01T15:30:00Z"),
+        side=side,  # type: ignore[arg-type]
+        confidence=0.8,
+        reason="test",
+        scenario_id="test",
+    )
+
+
+def test_model_renders_cells_per_role() -> None:
+    model = ResultsTableModel()
+    model.upsert_row(_result("AAA"), [_signal("AAA"), _signal("AAA", "sell")])
+
+    roles = QtCore.Qt.ItemDataRole
+    assert model.data(model.index(0, 0)) == "AAA"
+    assert model.data(model.index(0, 1)) == "70.0"
+    assert model.data(model.index(0, 2)) == "101.23"
+    assert model.data(model.index(0, 3)) == "Buy: 1, Sell: 1"
+    assert model.data(model.index(0, 5)) == "2024-05-01 15:30"
+    assert model.data(model.index(0, 4), roles.ToolTipRole) == "Momentum confirmed\nVolume expansion"
+    assert model.data(model.index(0, 2), roles.TextAlignmentRole) is not None
+    assert model.data(model.index(0, 4), roles.TextAlignmentRole) is None
+    assert model.data(model.index(0, 1), roles.DecorationRole) is None
+
+
+def test_upsert_refreshes_rendered_row() -> None:
+    model = ResultsTableModel()
+    model.upsert_row(_result("AAA"), [])
+    model.upsert_row(_result("AAA", score=88.0), [])
+
+    assert model.rowCount() == 1
+    assert model.data(model.index(0, 1)) == "88.0"
+    assert model.data(model.index(0, 3)) == "—"
+
+
+def test_replace_all_resets_rows_in_one_pass() -> None:
+    model = ResultsTableModel()
+    model.upsert_row(_result("OLD"), [])
+    resets: list[bool] = []
+    inserts: list[bool] = []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.rowsInserted.connect(lambda *args: inserts.append(True))
+
+    model.replace_all([(_result("AAA"), [_signal("AAA")]), (_result("BBB", score=55.0), [])])
+
+    assert resets == [True]
+    assert inserts == []
+    assert model.rowCount() == 2
+    assert model.data(model.index(1, 0)) == "BBB"
+    assert model.data(model.index(0, 3)) == "Buy: 1"
+
+    model.upsert_row(_result("BBB", score=60.0), [])
+    assert model.rowCount() == 2
+    assert model.data(model.index(1, 1)) == "60.0"
+
+
+def test_upsert_rows_batches_inserts_and_updates() -> None:
+    model = ResultsTableModel()
+    model.upsert_rows([(_result("AAA"), []), (_result("BBB"), [])])
+    inserted: list[tuple[int, int]] = []
+    changed: list[tuple[int, int]] = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    model.dataChanged.connect(lambda top, bottom, roles: changed.append((top.row(), bottom.row())))
+
+    model.upsert_rows(
+        [
+            (_result("CCC"), []),
+            (_result("AAA", score=90.0), []),
+            (_result("DDD"), []),
+            (_result("CCC", score=40.0), []),
+        ]
+    )
+
+    assert inserted == [(2, 3)]
+    assert changed == [(0, 0)]
+    assert [model.data(model.index(row, 0)) for row in range(model.rowCount())] == ["AAA", "BBB", "CCC", "DDD"]
+    assert model.data(model.index(0, 1)) == "90.0"
+    assert model.data(model.index(2, 1)) == "40.0"
+
+
+def test_cells_render_only_for_requested_rows() -> None:
+    model = ResultsTableModel()
+    model.upsert_rows([(_result(f"S{i:03d}"), []) for i in range(200)])
+
+    assert model.data(model.index(150, 0)) == "S150"
+    assert sum(cells is not None for cells in model._display) == 1
+
+    model.upsert_row(_result("S150", score=12.0), [])
+    assert model.data(model.index(150, 1)) == "12.0"
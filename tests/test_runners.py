@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Dict, List, Optional, Sequence
 
 import pandas as pd
+import pytest
 
 from core.models import ScanResult, TradeSignal
 from core.runners import ScanRunner
@@ -134,3 +135,110 @@ def test_runner_streams_results_and_updates_cache() -> None:
 
     runner.shutdown()
 
+
+def test_runner_uses_injected_executor_without_owning_it() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    frames = {symbol: _price_frame(symbol) for symbol in ("AAA", "BBB", "CCC")}
+    submitted: List[str] = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, /, *args, **kwargs):
+            submitted.extend(str(arg) for arg in args)
+            return super().submit(fn, *args, **kwargs)
+
+    executor = RecordingExecutor(max_workers=2)
+    runner = ScanRunner(fetcher=DummyFetcher(frames), cache=DummyCache(), executor=executor)
+
+    summary = runner.start(DummyScenario(), list(frames), period="6mo").result(timeout=5)
+    runner.shutdown()
+
+    assert summary.processed == 3
+    assert sorted(submitted) == ["AAA", "BBB", "CCC"]
+    # The runner must leave a caller-supplied executor usable.
+    assert executor.submit(lambda: 42).result(timeout=5) == 42
+    executor.shutdown()
+
+
+@pytest.mark.parametrize("numba_available", [True, False])
+def test_runner_skips_symbols_rejected_by_batch_screen(monkeypatch, numba_available) -> None:
+    import numpy as np
+
+    # Without Numba the screen would only repeat evaluate's pandas work.
+    monkeypatch.setattr("core.indicators._kernels.NUMBA_AVAILABLE", numba_available)
+
+    frames = {symbol: _price_frame(symbol) for symbol in ("AAA", "BBB", "CCC")}
+    evaluated: List[str] = []
+
+    class ScreenedScenario(DummyScenario):
+        supports_batch = True
+
+        def evaluate(self, price_df, fundamentals, params):
+            evaluated.append(price_df.attrs["symbol"])
+            return super().evaluate(price_df, fundamentals, params)
+
+        def evaluate_batch(self, closes, highs, lows, volumes, params=None):
+            keep = np.arange(closes.shape[0]) == 1
+            return self._batch_screen(np.full(closes.shape[0], 75.0), keep, keep)
+
+    runner = ScanRunner(fetcher=DummyFetcher(frames), cache=DummyCache(), max_workers=2)
+    summary = runner.start(ScreenedScenario(), ["AAA", "BBB", "CCC"], period="6mo").result(timeout=5)
+    runner.shutdown()
+
+    if numba_available:
+        assert evaluated == ["BBB"]
+        assert summary.skipped == 2
+    else:
+        assert sorted(evaluated) == ["AAA", "BBB", "CCC"]
+        assert summary.skipped == 0
+    assert summary.processed == 3
+
+
+def test_runner_keeps_stream_state_per_symbol_between_scans() -> None:
+    frames = {symbol: _price_frame(symbol) for symbol in ("AAA", "BBB")}
+    seen: List[tuple[str, object]] = []
+
+    class StreamingScenario(DummyScenario):
+        def create_stream_state(self):
+            return []
+
+        def evaluate(self, price_df, fundamentals, params, *, stream_state):
+            stream_state.append(price_df.shape[0])
+            seen.append((price_df.attrs["symbol"], stream_state))
+            return super().evaluate(price_df, fundamentals, params)
+
+    runner = ScanRunner(fetcher=DummyFetcher(frames), cache=DummyCache(), max_workers=2)
+    runner.start(StreamingScenario(), ["AAA", "BBB"], period="6mo").result(timeout=5)
+    runner.start(StreamingScenario(), ["AAA", "BBB"], period="6mo").result(timeout=5)
+    runner.shutdown()
+
+    states = {symbol: state for symbol, state in seen}
+    assert len(seen) == 4
+    assert states["AAA"] is not states["BBB"]
+    assert states["AAA"] == [30, 30]
+
+
+def test_runner_drops_stream_state_of_symbols_left_out_or_other_periods() -> None:
+    frames = {symbol: _price_frame(symbol) for symbol in ("AAA", "BBB")}
+    seen: Dict[str, List[object]] = {}
+
+    class StreamingScenario(DummyScenario):
+        def create_stream_state(self):
+            return []
+
+        def evaluate(self, price_df, fundamentals, params, *, stream_state):
+            stream_state.append(price_df.shape[0])
+            seen.setdefault(price_df.attrs["symbol"], []).append(stream_state)
+            return super().evaluate(price_df, fundamentals, params)
+
+    runner = ScanRunner(fetcher=DummyFetcher(frames), cache=DummyCache(), max_workers=2)
+    runner.start(StreamingScenario(), ["AAA", "BBB"], period="6mo").result(timeout=5)
+    runner.start(StreamingScenario(), ["AAA"], period="6mo").result(timeout=5)
+    runner.start(StreamingScenario(), ["AAA", "BBB"], period="6mo").result(timeout=5)
+    runner.start(StreamingScenario(), ["AAA"], period="1y").result(timeout=5)
+    runner.shutdown()
+
+    assert seen["AAA"][0] is seen["AAA"][1] is seen["AAA"][2]
+    assert seen["AAA"][3] is not seen["AAA"][0]
+    assert seen["BBB"][0] is not seen["BBB"][1]
+    assert seen["BBB"][1] == [30]
@@ -5,7 +5,12 @@ from typing import Dict
 import numpy as np
 import pandas as pd
 
-from core.scans.contrarian import ClassicOversoldScenario
+from core.scans._batch import align_right, batch_bollinger, batch_rsi, batch_stoch, stack_contexts
+from core.scans.contrarian import (
+    ClassicOversoldScenario,
+    MeanReversionBollingerScenario,
+    StochasticOversoldScenario,
+)
 from core.scans.floor_consolidation import FloorConsolidationQualityScenario
 from core.scans.lti_compounder import LTICompounderScenario
 from core.scans.momentum import MomentumBreakoutScenario
@@ -84,6 +89,88 @@ def test_classic_oversold_detects_reversal() -> None:
     assert any(signal.side == "buy" for signal in signals)
 
 
+def test_contrarian_batch_screen_matches_evaluate() -> None:
+    rng = np.random.default_rng(3)
+    base = np.linspace(120.0, 90.0, 50)
+    selloff = np.linspace(90.0, 70.0, 10, endpoint=False)
+    reversal = np.concatenate([base, selloff, np.array([72.0, 74.0, 79.0, 83.0])])
+    histories = [reversal, np.linspace(100.0, 150.0, 260), 100 + np.cumsum(rng.normal(size=90)), reversal[:30]]
+    frames = [_make_price_df(prices, 750_000.0) for prices in histories]
+
+    for scenario in (ClassicOversoldScenario(), MeanReversionBollingerScenario(), StochasticOversoldScenario()):
+        contexts = [scenario.build_context(df, None) for df in frames]
+        screen = scenario.evaluate_batch(*stack_contexts(contexts))
+        candidates = scenario.batch_candidates(*stack_contexts(contexts))
+        for row, df in enumerate(frames):
+            result, signals = scenario.evaluate(df, fundamentals=None)
+            assert bool(signals) == bool(screen["signal"][row])
+            if result is not None:
+                assert screen["score"][row] == result.score
+            assert bool(candidates[row]) == (result is not None or bool(signals))
+
+
+def test_squeeze_batch_screen_matches_evaluate() -> None:
+    rng = np.random.default_rng(4)
+    flat = 100.0 + np.sin(np.linspace(0, np.pi, 140)) * 0.4
+    breakout = np.concatenate([flat, np.array([101.0, 103.0, 107.0, 110.0, 112.0])])
+    histories = [breakout, 100 + np.cumsum(rng.normal(size=200)), flat[:100]]
+    volumes = [np.full(breakout.size, 400_000.0), 750_000.0, 750_000.0]
+    volumes[0][-1] = 700_000.0
+    frames = [_make_price_df(prices, volume) for prices, volume in zip(histories, volumes)]
+
+    scenario = VolatilitySqueezeScenario()
+    contexts = [scenario.build_context(df, None) for df in frames]
+    screen = scenario.evaluate_batch(*stack_contexts(contexts))
+    for row, df in enumerate(frames):
+        result, signals = scenario.evaluate(df, fundamentals=None)
+        assert bool(signals) == bool(screen["signal"][row])
+        if result is not None:
+            assert screen["score"][row] == result.score
+    assert screen["signal"][0]
+    assert screen["score"][2] == -np.inf
+
+
+def test_batch_kernels_accept_float32_storage() -> None:
+    rng = np.random.default_rng(5)
+    rows = [100 + np.cumsum(rng.normal(size=size)) for size in (80, 40, 3)]
+    single = align_right(rows, dtype=np.float32)
+    double = single.astype(np.float64)
+
+    assert single.dtype == np.float32
+    np.testing.assert_array_equal(batch_rsi(single), batch_rsi(double))
+    np.testing.assert_array_equal(batch_bollinger(single), batch_bollinger(double))
+    highs, lows = single + np.float32(1), single - np.float32(1)
+    np.testing.assert_array_equal(
+        batch_stoch(highs, lows, single), batch_stoch(highs.astype(np.float64), lows.astype(np.float64), double)
+    )
+
+
+def test_batch_stoch_tail_matches_full_rows() -> None:
+    rng = np.random.default_rng(6)
+    closes = align_right([100 + np.cumsum(rng.normal(size=size)) for size in (120, 30, 1)])
+    highs, lows = closes + 1.0, closes - 0.5
+
+    full = batch_stoch(highs, lows, closes)
+    np.testing.assert_array_equal(batch_stoch(highs, lows, closes, count=2), full[:, :, -2:])
+
+
+def test_context_arrays_match_reindexed_series() -> None:
+    prices = np.linspace(50, 60, 30)
+    prices[[3, 17]] = np.nan
+    df = _make_price_df(prices, np.arange(30, dtype=float))
+    context = VolatilitySqueezeScenario().build_context(df, None)
+    assert context is not None
+
+    closes = context.series.close.dropna()
+    arrays = context.arrays
+    assert arrays is context.arrays
+    assert arrays.index.equals(closes.index)
+    np.testing.assert_array_equal(arrays.close, closes.to_numpy())
+    np.testing.assert_array_equal(arrays.high, context.series.high.reindex(closes.index).to_numpy())
+    np.testing.assert_array_equal(arrays.low, context.series.low.reindex(closes.index).to_numpy())
+    np.testing.assert_array_equal(arrays.volume, context.series.volume.reindex(closes.index).to_numpy())
+
+
 def test_volatility_squeeze_breakout_generates_signal() -> None:
     flat = np.full(140, 100.0)
     small_noise = flat + np.sin(np.linspace(0, np.pi, 140)) * 0.4
@@ -110,3 +110,45 @@ def test_main_window_streams_results(qtbot) -> None:
     window.close()
     assert runner.shutdown_called is False  # Runner owned externally
 
+
+def test_parse_tickers_normalises_and_deduplicates() -> None:
+    assert MainWindow._parse_tickers(" aapl, MSFT\nmsft,,\n brk-b ") == ["AAPL", "MSFT", "BRK-B"]
+    assert MainWindow._parse_tickers("") == []
+
+
+def test_qthreadpool_executor_shutdown_only_touches_its_own_futures() -> None:
+    import threading
+
+    from app.ui.main_window import _QThreadPoolExecutor
+
+    pool = QtCore.QThreadPool()
+    pool.setMaxThreadCount(1)
+    executor = _QThreadPoolExecutor(pool)
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocking() -> str:
+        started.set()
+        release.wait(5)
+        return "done"
+
+    running = executor.submit(blocking)
+    queued = executor.submit(lambda: "never")
+    assert started.wait(5)
+
+    executor.shutdown(wait=False, cancel_futures=True)
+    assert queued.cancelled()
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
+
+    release.set()
+    executor.shutdown(wait=True)
+    assert running.result(timeout=0) == "done"
+
+    # A runnable the executor did not submit must not hold up its shutdown.
+    foreign = threading.Event()
+    other = _QThreadPoolExecutor(pool)
+    pool.start(lambda: foreign.wait(5))
+    other.shutdown(wait=True)
+    foreign.set()
+    assert pool.waitForDone(5000)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import gzip
+import io
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from core.universe import UniverseLoader, UniverseSpec
+
+
+def test_drop_untradable_accepts_arrow_backed_symbols() -> None:
+    pytest.importorskip("pyarrow")
+
+    series = pd.Series(["AAPL", "BRK.B", "^GSPC", "EURUSD=X", "ABC$", None, "MSFT"], dtype="string[pyarrow]")
+
+    kept = UniverseLoader._drop_untradable(series)
+
+    assert kept.tolist() == ["AAPL", "MSFT"]
+    assert kept.dtype == series.dtype
+
+
+@pytest.mark.parametrize("dtype", ["object", "string[pyarrow]"])
+def test_postprocess_limit_matches_filtering_everything(tmp_path, dtype) -> None:
+    if dtype != "object":
+        pytest.importorskip("pyarrow")
+
+    # Dotted symbols sort first, so the first blocks hold no tradable symbol.
+    dotted = [f"A.{number:04d}" for number in range(700)]
+    tradable = [f"B{chr(65 + number // 26)}{chr(65 + number % 26)}" for number in range(300)]
+    others = ["^GSPC", "EURUSD=X", "ABC$", None]
+    symbols = dotted + tradable + tradable[:50] + others
+    shuffled = pd.Series(symbols, dtype=dtype).sample(frac=1.0, random_state=7).reset_index(drop=True)
+
+    loader = UniverseLoader(tmp_path)
+    everything = loader._postprocess_symbols(shuffled)
+
+    assert everything.tolist() == sorted(tradable)
+    for limit in (1, 10, 299, 300, 1000):
+        limited = loader._postprocess_symbols(shuffled, limit=limit)
+        assert limited.tolist() == everything.iloc[:limit].tolist()
+
+
+def test_cached_universe_prefers_newer_custom_csv_over_feather(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+
+    loader = UniverseLoader(tmp_path)
+    feather = tmp_path / "custom.feather"
+    csv = tmp_path / "custom.csv"
+    pd.DataFrame({"symbol": ["AAA"]}).to_feather(feather)
+    pd.DataFrame({"symbol": ["BBB", "CCC"]}).to_csv(csv, index=False)
+    now = time.time()
+    os.utime(feather, (now - 60, now - 60))
+    os.utime(csv, (now, now))
+
+    spec = UniverseSpec(name="custom")
+    assert loader.load(spec).tolist() == ["BBB", "CCC"]
+
+    os.utime(feather, (now + 60, now + 60))
+    assert loader.load(spec).tolist() == ["AAA"]
+
+
+class _RawBody(io.BytesIO):
+    decode_content = False
+    auto_close = True
+
+
+class _Response:
+    def __init__(self, body: bytes) -> None:
+        self.raw = _RawBody(body)
+
+    def __enter__(self) -> "_Response":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.raw.close()
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+@pytest.mark.parametrize("with_pyarrow", [True, False])
+def test_download_csv_like_parses_gzipped_pipe_file(monkeypatch, tmp_path, with_pyarrow) -> None:
+    import core.universe
+
+    if with_pyarrow:
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setattr(core.universe, "pyarrow", None)
+
+    text = "Symbol|Security Name|ETF\nAAPL|Apple Inc.|N\nSPY|SPDR S&P 500|Y\n"
+    requested = []
+
+    def fake_get(url, **kwargs):
+        requested.append((url, kwargs))
+        return _Response(gzip.compress(text.encode("utf-8")))
+
+    monkeypatch.setattr(core.universe.requests, "get", fake_get)
+
+    frame = UniverseLoader(tmp_path)._download_csv_like("https://example.com/symbols.txt", sep="|")
+
+    assert requested[0][1]["stream"] is True
+    assert frame.columns.tolist() == ["Symbol", "Security Name", "ETF"]
+    assert frame["Symbol"].tolist() == ["AAPL", "SPY"]
+    assert frame["Security Name"].tolist() == ["Apple Inc.", "SPDR S&P 500"]
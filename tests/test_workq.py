@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from core.workq import WorkStealingExecutor
+
+
+def test_executor_runs_tasks_and_propagates_errors() -> None:
+    executor = WorkStealingExecutor(max_workers=3)
+    try:
+        futures = [executor.submit(lambda value=value: value * value) for value in range(50)]
+        failing = executor.submit(lambda: 1 / 0)
+
+        assert [future.result(timeout=5) for future in futures] == [value * value for value in range(50)]
+        with pytest.raises(ZeroDivisionError):
+            failing.result(timeout=5)
+    finally:
+        executor.shutdown()
+
+
+def test_nested_submissions_run_on_the_submitting_worker() -> None:
+    executor = WorkStealingExecutor(max_workers=1)
+    try:
+        def parent() -> tuple[str, str]:
+            child = executor.submit(lambda: threading.current_thread().name)
+            return threading.current_thread().name, child
+
+        name, child = executor.submit(parent).result(timeout=5)
+        assert child.result(timeout=5) == name
+    finally:
+        executor.shutdown()
+
+
+def test_idle_workers_steal_queued_work() -> None:
+    executor = WorkStealingExecutor(max_workers=2)
+    names: set[str] = set()
+    stolen = threading.Event()
+    try:
+        def child() -> None:
+            names.add(threading.current_thread().name)
+            stolen.set()
+
+        def parent() -> tuple[str, bool, list]:
+            # Children land on this worker's deque while it stays busy.
+            children = [executor.submit(child) for _ in range(4)]
+            return threading.current_thread().name, stolen.wait(timeout=5), children
+
+        owner, was_stolen, children = executor.submit(parent).result(timeout=10)
+        for future in children:
+            future.result(timeout=5)
+
+        assert was_stolen
+        assert names - {owner}
+    finally:
+        executor.shutdown()
+
+
+def test_shutdown_rejects_new_work_and_cancels_queued_futures() -> None:
+    executor = WorkStealingExecutor(max_workers=1)
+    gate = threading.Event()
+    blocker = executor.submit(gate.wait, 5)
+    queued = executor.submit(lambda: "late")
+
+    stopper = threading.Thread(target=executor.shutdown, kwargs={"cancel_futures": True})
+    stopper.start()
+    time.sleep(0.05)
+    gate.set()
+    stopper.join(timeout=5)
+
+    assert blocker.result(timeout=5) is True
+    assert queued.cancelled()
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)